@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 
 import logging
 
+from mkdocs_zettelkasten.plugin.services.file_index import FileIndex
+from mkdocs_zettelkasten.plugin.services.link_resolver import is_external_link
 from mkdocs_zettelkasten.plugin.utils.patterns import (
     MD_LINK,
     WIKI_LINK,
@@ -32,36 +34,51 @@ def adapt_page_links_to_zettels(
     files: Files,
     zettel_lookup: Callable[[str], Zettel | None],
     file_suffix: str = ".md",
+    file_index: FileIndex | None = None,
+    *,
+    substring_fallback: bool = False,
 ) -> str:
-    """Adapt links in the markdown to point to zettels."""
+    """Adapt links in the markdown to point to zettels.
 
-    def process_match(m: Match) -> str:
-        url = m.groupdict().get("url", "")
-        title = m.groupdict().get("title", url)
-
-        for f in files:
-            url_with_suffix = (
-                url + file_suffix if not url.endswith(file_suffix) else url
-            )
-
-            if url_with_suffix in f.src_path:
-                if f.page and (
-                    title == url_with_suffix or title + file_suffix == url_with_suffix
-                ):
-                    target_zettel = zettel_lookup(url_with_suffix)
-                    title = target_zettel.title if target_zettel else url
-                new_url = config["site_url"] + f.url
-                logger.debug(
-                    "Transformed link %s to [%s](%s) in %s",
-                    m.group(),
-                    title,
-                    new_url,
-                    page.file.src_path,
-                )
+    Links are normalized as for the link map and looked up in *file_index*,
+    built from *files* when not given. With *substring_fallback*, links that
+    match no file that way fall back to the first file whose path contains
+    them.
+    """
+    index = file_index if file_index is not None else FileIndex(files)
 
-                return f"[{title}]({new_url})"
-
-        return f"[{title}]({url})"
+    def process_match(m: Match) -> str:
+        url = m.groupdict().get("url") or ""
+        title = m.groupdict().get("title")
+        if title is None:
+            title = url
+        url_with_suffix = url if url.endswith(file_suffix) else url + file_suffix
+
+        if is_external_link(url):
+            f = None
+        else:
+            f = index.get_by_link(url, file_suffix, page.file.src_path)
+        if f is None and substring_fallback:
+            f = index.find_containing(url_with_suffix)
+        if f is None:
+            return f"[{title}]({url})"
+
+        if f.page and (
+            title == url_with_suffix or title + file_suffix == url_with_suffix
+        ):
+            target_zettel = zettel_lookup(f.src_path)
+            title = target_zettel.title if target_zettel else url
+        # The lookup ignores the fragment; keep it on the rewritten link.
+        anchor = url.partition("#")[2]
+        new_url = config["site_url"] + f.url + ("#" + anchor if anchor else "")
+        logger.debug(
+            "Transformed link %s to [%s](%s) in %s",
+            m.group(),
+            title,
+            new_url,
+            page.file.src_path,
+        )
+        return f"[{title}]({new_url})"
 
     def _process(text: str) -> str:
         text = WIKI_LINK.sub(process_match, text)
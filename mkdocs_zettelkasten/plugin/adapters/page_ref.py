@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import threading
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from markdown import Markdown
 
 if TYPE_CHECKING:
     import re
+    from collections.abc import Iterator
 
     from mkdocs.config.defaults import MkDocsConfig
     from mkdocs.structure.pages import Page
@@ -20,6 +23,47 @@ logger = logging.getLogger(
 )
 
 
+class _MarkdownPool:
+    """Idle Markdown processors for one extension configuration.
+
+    Loading extensions is the expensive part of building a processor, so
+    processors are reused across pages and ``reset()`` between uses. Each
+    processor is lent to one caller at a time; the pool is thread-safe.
+    A different configuration (e.g. after a config reload) empties it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._key: str | None = None
+        self._idle: list[Markdown] = []
+
+    @contextmanager
+    def borrow(self, config: MkDocsConfig) -> Iterator[Markdown]:
+        extensions = config["markdown_extensions"]
+        extension_configs = config["mdx_configs"] or {}
+        key = repr((extensions, extension_configs))
+        with self._lock:
+            if key != self._key:
+                self._key = key
+                self._idle = []
+            processor = self._idle.pop() if self._idle else None
+        if processor is None:
+            logger.debug("Creating Markdown processor for reference sections")
+            processor = Markdown(
+                extensions=extensions, extension_configs=extension_configs
+            )
+        try:
+            yield processor
+        finally:
+            processor.reset()
+            with self._lock:
+                if key == self._key:
+                    self._idle.append(processor)
+
+
+_PROCESSORS = _MarkdownPool()
+
+
 def _find_divider_indices(content_lines: list[str]) -> list[int]:
     """Return indices of all ``---`` lines outside fenced code blocks."""
     indices: list[int] = []
@@ -111,10 +155,8 @@ def get_page_ref(
     markdown = "\n".join(content_lines[:open_idx])
     page.meta["ref"] = "\n".join(ref_lines)
 
-    processor = Markdown(
-        extensions=config["markdown_extensions"],
-        extension_configs=config["mdx_configs"] or {},
-    )
+    with _PROCESSORS.borrow(config) as processor:
+        html = processor.convert(page.meta["ref"])
 
     logger.debug("Reference section found in %s", page.file.src_path)
-    return (markdown, processor.convert(page.meta["ref"]))
+    return (markdown, html)
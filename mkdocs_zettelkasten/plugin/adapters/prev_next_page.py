@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
     from mkdocs.structure.pages import Page
@@ -13,39 +13,72 @@ import logging
 # module-level: used in function signatures
 from mkdocs.structure.files import File, Files
 
+from mkdocs_zettelkasten.plugin.services.file_index import FileIndex
+
 logger = logging.getLogger(
     __name__.replace("mkdocs_zettelkasten.plugin.", "mkdocs.plugins.zettelkasten.")
 )
 
 
+class Navigation(NamedTuple):
+    """Prev/next pages of every zettel, precomputed once per build."""
+
+    # Page of the first zettel, shown as next on the homepage.
+    first: Page | None
+    # Zettel ID -> (previous page, next page).
+    neighbours: dict[int, tuple[Page | None, Page | None]]
+
+
+def build_navigation(
+    files: Files | FileIndex,
+    zettels: list[Zettel],
+    file_suffix: str = ".md",
+) -> Navigation:
+    """Map each zettel to the pages before and after it in *zettels* order.
+
+    The first zettel's previous page is the homepage.
+    """
+    index = files if isinstance(files, FileIndex) else FileIndex(files)
+    zettel_files = [index.get_by_abs_src_path(str(z.path)) for z in zettels]
+    homepage_file = index.get_by_src_path(f"index{file_suffix}")
+
+    neighbours: dict[int, tuple[Page | None, Page | None]] = {}
+    last = len(zettels) - 1
+    for i, zettel in enumerate(zettels):
+        if not zettel.id or zettel.id in neighbours:
+            continue
+        prev_file = (zettel_files[i - 1] if i > 0 else None) or homepage_file
+        next_file = zettel_files[i + 1] if i < last else None
+        neighbours[zettel.id] = (_page_of(prev_file), _page_of(next_file))
+
+    first = _page_of(zettel_files[0]) if zettel_files else None
+    return Navigation(first=first, neighbours=neighbours)
+
+
 def get_prev_next_page(
     page: Page,
     files: Files,
     zettels: list[Zettel],
     file_suffix: str = ".md",
+    navigation: Navigation | None = None,
 ) -> tuple[Page | None, Page | None]:
-    """Determine previous and next pages for navigation with zettelkasten support."""
-    if _is_special_page(page, file_suffix):
-        return _handle_special_page(page, files, zettels, file_suffix)
+    """Determine previous and next pages for navigation with zettelkasten support.
 
-    homepage_file = _find_homepage(files, file_suffix)
+    *navigation* is built from *files* and *zettels* when not given.
+    """
+    if navigation is None:
+        navigation = build_navigation(files, zettels, file_suffix)
 
-    if not page.meta.get("is_zettel"):
+    if _is_special_page(page, file_suffix):
+        if page.file.src_path == f"index{file_suffix}":
+            return (None, navigation.first)
         return (None, None)
 
-    current_index = _find_zettel_index(page, zettels)
-
-    if current_index is None:
+    if not page.meta.get("is_zettel") or not page.meta.get("zettel"):
         return (None, None)
 
-    prev_zettel, next_zettel = _get_adjacent_zettels(zettels, current_index)
-    prev_file = _resolve_zettel_file(prev_zettel, files) or homepage_file
-    next_file = _resolve_zettel_file(next_zettel, files)
-    prev_page = (
-        prev_file.page if isinstance(prev_file, File) and prev_file.page else None
-    )
-    next_page = (
-        next_file.page if isinstance(next_file, File) and next_file.page else None
+    prev_page, next_page = navigation.neighbours.get(
+        page.meta["zettel"].id, (None, None)
     )
     log_prev_page = prev_page.file.src_path if prev_page is not None else "none"
     log_next_page = next_page.file.src_path if next_page is not None else "none"
@@ -63,54 +96,5 @@ def _is_special_page(page: Page, file_suffix: str = ".md") -> bool:
     return page.file.src_path in {f"index{file_suffix}", f"tags{file_suffix}"}
 
 
-def _handle_special_page(
-    page: Page,
-    files: Files,
-    zettels: list[Zettel],
-    file_suffix: str = ".md",
-) -> tuple[Page | None, Page | None]:
-    if page.file.src_path == f"index{file_suffix}" and zettels:
-        first_zettel_file = _find_file_by_path(files, str(zettels[0].path))
-        next_page = (
-            first_zettel_file.page
-            if isinstance(first_zettel_file, File) and first_zettel_file.page
-            else None
-        )
-
-        return (None, next_page)
-    return (None, None)
-
-
-def _find_homepage(files: Files, file_suffix: str = ".md") -> File | str:
-    return next((f for f in files if f.src_path == f"index{file_suffix}"), "")
-
-
-def _find_zettel_index(page: Page, zettels: list[Zettel]) -> int | None:
-    if not page.meta.get("zettel"):
-        return None
-
-    zettel_id = page.meta["zettel"].id
-
-    return (
-        next((i for i, z in enumerate(zettels) if z.id == zettel_id), None)
-        if zettel_id
-        else None
-    )
-
-
-def _get_adjacent_zettels(
-    zettels: list[Zettel],
-    current_index: int,
-) -> tuple[Zettel | None, Zettel | None]:
-    return (
-        zettels[current_index - 1] if current_index > 0 else None,
-        zettels[current_index + 1] if current_index < len(zettels) - 1 else None,
-    )
-
-
-def _resolve_zettel_file(zettel: Zettel | None, files: Files) -> File | str:
-    return _find_file_by_path(files, str(zettel.path)) if zettel else ""
-
-
-def _find_file_by_path(files: Files, path: str) -> File | str:
-    return next((f for f in files if f.abs_src_path == path), "")
+def _page_of(file: File | None) -> Page | None:
+    return file.page if isinstance(file, File) and file.page else None
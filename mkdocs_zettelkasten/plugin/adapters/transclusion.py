@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -11,7 +11,7 @@ if TYPE_CHECKING:
 import logging
 import re
 
-from mkdocs_zettelkasten.plugin.utils.frontmatter import DIVIDER
+from mkdocs_zettelkasten.plugin.entities.body_view import HEADING_RE, BodyView
 from mkdocs_zettelkasten.plugin.utils.patterns import (
     EMBED_LINK,
     process_outside_code_blocks,
@@ -24,38 +24,82 @@ logger = logging.getLogger(
 
 def _body_without_refs(body: str) -> str:
     """Return body content before the reference section divider."""
-    for i, line in enumerate(body.splitlines(keepends=True)):
-        if line.strip() == DIVIDER:
-            return "".join(body.splitlines(keepends=True)[:i])
-    return body
-
-
-_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+    return BodyView(body).without_refs.body
 
 
 def _extract_section(body: str, section_name: str) -> str | None:
     """Extract a heading section from markdown body. Case-insensitive exact match."""
-    target = section_name.strip().lower()
-    start_pos = None
-    start_level = 0
+    return BodyView(body).section(section_name)
+
 
-    for m in _HEADING_RE.finditer(body):
-        level = len(m.group(1))
-        title = m.group(2).strip().lower()
+_H1_RE = re.compile(r"^#\s+.+\n?", re.MULTILINE)
 
-        if start_pos is None:
-            if title == target:
-                start_pos = m.start()
-                start_level = level
-        elif level <= start_level:
-            return body[start_pos : m.start()]
 
-    if start_pos is not None:
-        return body[start_pos:]
-    return None
+class _Expansion(NamedTuple):
+    """Embedded body after section extraction and nested expansion."""
 
+    # None when the requested section does not exist.
+    body: str | None
+    # Zettels expanded in this subtree, including its root.
+    footprint: frozenset[str]
+    # Circular-embed hits inside this subtree.
+    hits: frozenset[str]
+    # Nested lookups made while expanding, replayed on cache hits.
+    lookups: tuple[str, ...]
 
-_H1_RE = re.compile(r"^#\s+.+\n?", re.MULTILINE)
+
+class _Trace:
+    """Collects what an expansion touched, for its parent and the cache."""
+
+    def __init__(self) -> None:
+        self.footprint: set[str] = set()
+        self.hits: set[str] = set()
+        self.lookups: list[str] = []
+
+    def merge(self, expansion: _Expansion) -> None:
+        self.footprint |= expansion.footprint
+        self.hits |= expansion.hits
+        self.lookups.extend(expansion.lookups)
+
+
+class EmbedCache:
+    """Expanded embed bodies shared by all pages of one build.
+
+    Entries are keyed by (zettel path, section, strip_heading, remaining
+    depth). An entry is only reused when none of the zettels it expanded
+    is on the current embed stack, so circular embeds are still detected
+    from every page. Expansions that hit a cycle through an outer page are
+    not cached, since their output depends on that page.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str | None, bool, int], _Expansion] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        key: tuple[str, str | None, bool, int],
+        embed_stack: frozenset[str],
+    ) -> _Expansion | None:
+        entry = self._entries.get(key)
+        if entry is not None and entry.footprint.isdisjoint(embed_stack):
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def put(self, key: tuple[str, str | None, bool, int], entry: _Expansion) -> None:
+        if entry.hits <= entry.footprint:
+            self._entries[key] = entry
+
+    def log_stats(self) -> None:
+        logger.debug(
+            "Embed cache: %d hits, %d misses (%d entries)",
+            self.hits,
+            self.misses,
+            len(self._entries),
+        )
 
 
 def adapt_transclusion(
@@ -66,12 +110,18 @@ def adapt_transclusion(
     *,
     strip_heading: bool = True,
     max_embed_depth: int = 5,
+    cache: EmbedCache | None = None,
     _depth: int = 0,
     _embed_stack: frozenset[str] | None = None,
+    _trace: _Trace | None = None,
 ) -> str:
-    """Replace ![[id]] embed syntax with transcluded zettel content."""
+    """Replace ![[id]] embed syntax with transcluded zettel content.
+
+    Expanded embeds are shared through *cache* when given.
+    """
     if _embed_stack is None:
         _embed_stack = frozenset()
+    trace = _trace if _trace is not None else _Trace()
 
     def _process(text: str) -> str:
         return EMBED_LINK.sub(
@@ -84,6 +134,8 @@ def adapt_transclusion(
                 max_embed_depth,
                 _depth,
                 _embed_stack,
+                cache,
+                trace,
             ),
             text,
         )
@@ -91,6 +143,20 @@ def adapt_transclusion(
     return process_outside_code_blocks(markdown, _process)
 
 
+def embed_targets(markdown: str, file_suffix: str) -> list[str]:
+    """Return the lookup paths of the embeds in *markdown*, outside code blocks."""
+    targets: list[str] = []
+
+    def _collect(text: str) -> str:
+        for m in EMBED_LINK.finditer(text):
+            url = m.group("url")
+            targets.append(url if url.endswith(file_suffix) else url + file_suffix)
+        return text
+
+    process_outside_code_blocks(markdown, _collect)
+    return targets
+
+
 def _resolve_embed(
     m: Match,
     zettel_lookup: Callable[[str], Zettel | None],
@@ -100,6 +166,8 @@ def _resolve_embed(
     max_embed_depth: int,
     depth: int,
     embed_stack: frozenset[str],
+    cache: EmbedCache | None,
+    trace: _Trace,
 ) -> str:
     url = m.group("url")
     section = m.group("section")
@@ -107,6 +175,7 @@ def _resolve_embed(
 
     url_with_suffix = url + file_suffix if not url.endswith(file_suffix) else url
     zettel = zettel_lookup(url_with_suffix)
+    trace.lookups.append(url_with_suffix)
 
     if zettel is None:
         logger.warning("Embed target not found: %s", url)
@@ -114,23 +183,73 @@ def _resolve_embed(
 
     zettel_key = str(zettel.path)
     if zettel_key in embed_stack:
+        trace.hits.add(zettel_key)
         logger.warning("Circular embed detected: %s", url)
         return f'\n!!! warning "Circular embed"\n    Circular reference detected: `{url}`\n'
 
-    body = _body_without_refs(zettel.body)
+    expansion = _expand(
+        zettel,
+        section,
+        zettel_lookup,
+        site_url,
+        file_suffix,
+        strip_heading,
+        max_embed_depth,
+        depth,
+        embed_stack,
+        cache,
+    )
+    trace.merge(expansion)
+
+    if expansion.body is None:
+        logger.warning("Section '%s' not found in %s", section, url)
+        return f'\n!!! warning "Section not found"\n    Could not find section "{section}" in `{url}`\n'
+
+    display_title = title_override or zettel.title
+    link_url = site_url.rstrip("/") + "/" + url + "/"
+    header = f'<div class="zettel-embed-header"><a href="{link_url}">{display_title}</a></div>'
+
+    return (
+        f'\n<div class="zettel-embed">\n{header}\n'
+        f'<div class="zettel-embed-content">\n\n{expansion.body.strip()}\n\n</div>\n</div>\n'
+    )
+
+
+def _expand(
+    zettel: Zettel,
+    section: str | None,
+    zettel_lookup: Callable[[str], Zettel | None],
+    site_url: str,
+    file_suffix: str,
+    strip_heading: bool,  # noqa: FBT001
+    max_embed_depth: int,
+    depth: int,
+    embed_stack: frozenset[str],
+    cache: EmbedCache | None,
+) -> _Expansion:
+    """Return *zettel*'s embeddable body, served from *cache* when possible."""
+    zettel_key = str(zettel.path)
+    cache_key = (zettel_key, section, strip_heading, max_embed_depth - depth)
+    if cache is not None:
+        cached = cache.get(cache_key, embed_stack)
+        if cached is not None:
+            for partial_path in cached.lookups:
+                zettel_lookup(partial_path)
+            return cached
+
+    trace = _Trace()
+    trace.footprint.add(zettel_key)
+    body_view = zettel.body_view.without_refs
+    body: str | None = body_view.body
 
     if section:
-        extracted = _extract_section(body, section)
-        if extracted is None:
-            logger.warning("Section '%s' not found in %s", section, url)
-            return f'\n!!! warning "Section not found"\n    Could not find section "{section}" in `{url}`\n'
-        body = extracted
-        if strip_heading:
-            body = _HEADING_RE.sub("", body, count=1)
+        body = body_view.section(section)
+        if body is not None and strip_heading:
+            body = HEADING_RE.sub("", body, count=1)
     elif strip_heading:
         body = _H1_RE.sub("", body, count=1)
 
-    if depth < max_embed_depth:
+    if body is not None and depth < max_embed_depth:
         body = adapt_transclusion(
             body,
             zettel_lookup,
@@ -138,15 +257,18 @@ def _resolve_embed(
             file_suffix,
             strip_heading=strip_heading,
             max_embed_depth=max_embed_depth,
+            cache=cache,
             _depth=depth + 1,
             _embed_stack=embed_stack | {zettel_key},
+            _trace=trace,
         )
 
-    display_title = title_override or zettel.title
-    link_url = site_url.rstrip("/") + "/" + url + "/"
-    header = f'<div class="zettel-embed-header"><a href="{link_url}">{display_title}</a></div>'
-
-    return (
-        f'\n<div class="zettel-embed">\n{header}\n'
-        f'<div class="zettel-embed-content">\n\n{body.strip()}\n\n</div>\n</div>\n'
+    expansion = _Expansion(
+        body=body,
+        footprint=frozenset(trace.footprint),
+        hits=frozenset(trace.hits),
+        lookups=tuple(trace.lookups),
     )
+    if cache is not None:
+        cache.put(cache_key, expansion)
+    return expansion
@@ -28,7 +28,11 @@ class ZettelkastenConfig:
     icon_backlinks: str = "fa fa-link"
     file_suffix: str = ".md"
     graph_enabled: bool = False
+    graph_format: str = "objects"
+    graph_layout_enabled: bool = False
+    graph_local_slices: bool = False
     preview_enabled: bool = False
+    preview_shard_size: int = 0
     suggestions_enabled: bool = False
     workflow_enabled: bool = False
     transclusion_strip_heading: bool = True
@@ -37,6 +41,14 @@ class ZettelkastenConfig:
     review_stale_days: int = 30
     max_suggestions: int = 5
     suggestion_confidence_threshold: float = 0.3
+    suggestion_stop_ratio: float = 1.0
+    suggestion_backend: str = "python"
+    suggestion_content_enabled: bool = False
+    link_substring_fallback: bool = False
     max_excerpt_length: int = 200
     max_embed_depth: int = 5
     min_mention_title_length: int = 3
+    parse_cache_enabled: bool = True
+    parse_workers: int = 0
+    render_workers: int = 0
+    prerender_panels: bool = False
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import re
+from functools import cached_property
+
+from mkdocs_zettelkasten.plugin.utils.frontmatter import DIVIDER
+
+FENCED_CODE = re.compile(r"```.*?```", re.DOTALL)
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+# Characters str.splitlines() breaks on.
+_LINE_BREAKS = frozenset("\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029")
+
+
+def _paragraph_spans(lines: list[str]) -> list[tuple[int, int]]:
+    """Return [start, end) line ranges of blank-line separated paragraphs."""
+    spans: list[tuple[int, int]] = []
+    start: int | None = None
+    for i, line in enumerate(lines):
+        if line.strip() == "":
+            if start is not None:
+                spans.append((start, i))
+                start = None
+        elif start is None:
+            start = i
+    if start is not None:
+        spans.append((start, len(lines)))
+    return spans
+
+
+class BodyView:
+    """Structured view of a zettel body, tokenized lazily and memoized.
+
+    Every part (lines, paragraphs, code fences, headings, reference divider)
+    is computed on first access, so services sharing a zettel split its
+    body once instead of each re-tokenizing it.
+    """
+
+    def __init__(self, body: str) -> None:
+        self.body = body
+
+    @cached_property
+    def lines(self) -> list[str]:
+        return self.body.splitlines()
+
+    @cached_property
+    def paragraph_spans(self) -> list[tuple[int, int]]:
+        """[start, end) ranges into ``lines`` of each paragraph."""
+        return _paragraph_spans(self.lines)
+
+    @cached_property
+    def paragraphs(self) -> list[str]:
+        """Paragraphs with their lines joined by newlines."""
+        lines = self.lines
+        return ["\n".join(lines[start:end]) for start, end in self.paragraph_spans]
+
+    @cached_property
+    def flat_paragraphs(self) -> list[str]:
+        """Paragraphs with their stripped lines joined by spaces."""
+        lines = self.lines
+        return [
+            " ".join(line.strip() for line in lines[start:end])
+            for start, end in self.paragraph_spans
+        ]
+
+    @cached_property
+    def code_fences(self) -> list[tuple[int, int]]:
+        """Character ranges of triple-backtick fenced code."""
+        return [m.span() for m in FENCED_CODE.finditer(self.body)]
+
+    @cached_property
+    def fence_masked_paragraphs(self) -> list[str]:
+        """``paragraphs`` of the body with fenced code replaced by NULs.
+
+        Line breaks inside fences are kept and the masked lines are split on
+        the spans of ``paragraphs``, so both lists pair up one to one.
+        """
+        if not self.code_fences:
+            return self.paragraphs
+        parts: list[str] = []
+        pos = 0
+        for start, end in self.code_fences:
+            parts.append(self.body[pos:start])
+            parts.append(
+                "".join(
+                    c if c in _LINE_BREAKS else "\x00" for c in self.body[start:end]
+                )
+            )
+            pos = end
+        parts.append(self.body[pos:])
+        lines = "".join(parts).splitlines()
+        return ["\n".join(lines[start:end]) for start, end in self.paragraph_spans]
+
+    @cached_property
+    def ref_divider(self) -> int | None:
+        """Character offset of the reference-section divider line, if any."""
+        for i, line in enumerate(self.lines):
+            if line.strip() == DIVIDER:
+                return len("".join(self.body.splitlines(keepends=True)[:i]))
+        return None
+
+    @cached_property
+    def without_refs(self) -> BodyView:
+        """View of the body before the reference-section divider."""
+        if self.ref_divider is None:
+            return self
+        return BodyView(self.body[: self.ref_divider])
+
+    @cached_property
+    def headings(self) -> list[tuple[int, int, str]]:
+        """(offset, level, lowercased title) for each heading in the body."""
+        return [
+            (m.start(), len(m.group(1)), m.group(2).strip().lower())
+            for m in HEADING_RE.finditer(self.body)
+        ]
+
+    def section(self, section_name: str) -> str | None:
+        """Extract a heading section. Case-insensitive exact title match."""
+        target = section_name.strip().lower()
+        start_pos = None
+        start_level = 0
+
+        for offset, level, title in self.headings:
+            if start_pos is None:
+                if title == target:
+                    start_pos = offset
+                    start_level = level
+            elif level <= start_level:
+                return self.body[start_pos:offset]
+
+        if start_pos is not None:
+            return self.body[start_pos:]
+        return None
@@ -4,12 +4,15 @@ import datetime
 import html
 import re
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import TYPE_CHECKING, TypedDict
 from zoneinfo import ZoneInfo
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from mkdocs_zettelkasten.plugin.utils.git_utils import GitRevisionIndex
+
 import logging
 
 import yaml
@@ -17,6 +20,7 @@ from yaml.scanner import ScannerError
 
 from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
 from mkdocs_zettelkasten.plugin.constants import MOC_ROLES
+from mkdocs_zettelkasten.plugin.entities.body_view import BodyView
 from mkdocs_zettelkasten.plugin.utils.date_utils import convert_string_to_date
 from mkdocs_zettelkasten.plugin.utils.frontmatter import parse_frontmatter
 from mkdocs_zettelkasten.plugin.utils.git_utils import GitUtil
@@ -95,6 +99,8 @@ class ZettelRelationships:
     sequence_children: list[SequenceRef] = field(default_factory=list)
     sequence_breadcrumb: list[SequenceRef] = field(default_factory=list)
     sequence_tree: list[SequenceTreeNode] = field(default_factory=list)
+    # Pre-rendered list items per relationship, when prerender_panels is on.
+    panels: dict[str, str] = field(default_factory=dict)
 
 
 class ZettelFormatError(ValueError):
@@ -107,9 +113,10 @@ class Zettel:
         abs_src_path: Path,
         src_path: str,
         zettel_config: ZettelkastenConfig | None = None,
+        revision_index: GitRevisionIndex | None = None,
     ) -> None:
         cfg = zettel_config or ZettelkastenConfig()
-        self._meta = self._build_meta(abs_src_path, src_path, cfg)
+        self._meta = self._build_meta(abs_src_path, src_path, cfg, revision_index)
         self._rels = ZettelRelationships()
 
     @classmethod
@@ -151,6 +158,11 @@ class Zettel:
     def body(self) -> str:
         return self._meta.body
 
+    @cached_property
+    def body_view(self) -> BodyView:
+        """Memoized structured view of the body, shared by all services."""
+        return BodyView(self._meta.body)
+
     @property
     def last_update_date(self) -> str:
         return self._meta.last_update_date
@@ -193,6 +205,10 @@ class Zettel:
 
     # -- Relationship properties (read-write) --------------------------------------
 
+    def reset_relationships(self) -> None:
+        """Drop materialized relationships so they can be rebuilt."""
+        self._rels = ZettelRelationships()
+
     @property
     def backlinks(self) -> list[LinkRef]:
         return self._rels.backlinks
@@ -257,6 +273,14 @@ class Zettel:
     def sequence_tree(self, value: list[SequenceTreeNode]) -> None:
         self._rels.sequence_tree = value
 
+    @property
+    def panels(self) -> dict[str, str]:
+        return self._rels.panels
+
+    @panels.setter
+    def panels(self, value: dict[str, str]) -> None:
+        self._rels.panels = value
+
     # -- Parsing (static helpers) --------------------------------------------------
 
     @staticmethod
@@ -264,6 +288,7 @@ class Zettel:
         abs_src_path: Path,
         src_path: str,
         cfg: ZettelkastenConfig,
+        revision_index: GitRevisionIndex | None = None,
     ) -> ZettelMeta:
         try:
             content = abs_src_path.read_text(encoding="utf-8-sig", errors="strict")
@@ -283,15 +308,15 @@ class Zettel:
             raise ZettelFormatError(msg)
 
         meta = Zettel._parse_yaml(header_text, abs_src_path)
-        body_lines = body_text.splitlines()
-        links, link_snippets = Zettel._extract_links(body_lines)
-        alt_title = Zettel._find_alt_title(body_lines)
+        body_view = BodyView(body_text)
+        links, link_snippets = Zettel._extract_links(body_view.flat_paragraphs)
+        alt_title = Zettel._find_alt_title(body_view.lines)
 
         zettel_id, title = Zettel._parse_core_metadata(
             meta, alt_title, abs_src_path, cfg
         )
         last_update_date = Zettel._determine_last_update_date(
-            meta, zettel_id, abs_src_path, src_path, cfg
+            meta, zettel_id, abs_src_path, src_path, cfg, revision_index
         )
         note_type, maturity, source, role, seq_parent = Zettel._parse_optional_metadata(
             meta, cfg
@@ -358,13 +383,13 @@ class Zettel:
         return ""
 
     @staticmethod
-    def _extract_links(body: list[str]) -> tuple[list[str], dict[str, str]]:
+    def _extract_links(paragraphs: list[str]) -> tuple[list[str], dict[str, str]]:
         links: list[str] = []
         link_snippets: dict[str, str] = {}
         wiki_count = 0
         md_count = 0
 
-        for paragraph in Zettel._split_paragraphs(body):
+        for paragraph in paragraphs:
             for m in WIKI_LINK.finditer(paragraph):
                 url = m.group("url")
                 links.append(url)
@@ -386,27 +411,6 @@ class Zettel:
         )
         return links, link_snippets
 
-    @staticmethod
-    def _split_paragraphs(body: list[str]) -> list[str]:
-        """Split body lines into paragraph strings, joined by spaces.
-
-        Space-joining collapses lines for snippet/link-context matching.
-        See also: UnlinkedMentionService._split_paragraphs (newline-joined,
-        preserves structure for regex search).
-        """
-        paragraphs: list[str] = []
-        current: list[str] = []
-        for line in body:
-            if line.strip() == "":
-                if current:
-                    paragraphs.append(" ".join(current))
-                    current = []
-            else:
-                current.append(line.strip())
-        if current:
-            paragraphs.append(" ".join(current))
-        return paragraphs
-
     @staticmethod
     def _make_snippet(paragraph: str, match: re.Match) -> str:
         link_text = match.group("title") or match.group("url")
@@ -492,9 +496,10 @@ class Zettel:
         path: Path,
         rel_path: str,
         cfg: ZettelkastenConfig,
+        revision_index: GitRevisionIndex | None = None,
     ) -> str:
         candidate_date = Zettel._get_initial_candidate_date(meta, zettel_id, cfg)
-        revision_date = Zettel._get_revision_date(path, cfg.timezone)
+        revision_date = Zettel._get_revision_date(path, cfg.timezone, revision_index)
 
         if cfg.last_update_key in meta:
             final_date = candidate_date
@@ -526,7 +531,18 @@ class Zettel:
         return datetime.datetime.now(tz=cfg.timezone)
 
     @staticmethod
-    def _get_revision_date(path: Path, tz: ZoneInfo) -> datetime.datetime:
+    def _get_revision_date(
+        path: Path,
+        tz: ZoneInfo,
+        revision_index: GitRevisionIndex | None = None,
+    ) -> datetime.datetime:
+        if revision_index is not None:
+            if revision_index.is_tracked(str(path)):
+                git_date = revision_index.get_revision_date(str(path))
+                if git_date is not None:
+                    return git_date
+            return Zettel._get_mtime(path, tz)
+
         if GitUtil.is_tracked(str(path)):
             git_date = GitUtil.get_revision_date_for_file(str(path))
             if git_date is not None:
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
     from mkdocs_zettelkasten.plugin.pipeline_context import PipelineContext
 
 from mkdocs_zettelkasten.plugin.services.backlink_processor import BacklinkProcessor
+from mkdocs_zettelkasten.plugin.services.dependency_index import BACKLINKS, LINKS
 
 
 class BacklinkFeature:
@@ -22,7 +23,20 @@ class BacklinkFeature:
         return True
 
     def compute(self, ctx: PipelineContext) -> None:
-        ctx.backlinks = BacklinkProcessor.process(ctx.store, ctx.link_map.resolved)
+        if ctx.previous is not None and ctx.changed_ids is not None:
+            ctx.backlinks = BacklinkProcessor.update(
+                ctx.previous.backlinks,
+                ctx.store,
+                ctx.previous.link_map.resolved,
+                ctx.link_map.resolved,
+                ctx.changed_ids,
+            )
+        else:
+            ctx.backlinks = BacklinkProcessor.process(ctx.store, ctx.link_map.resolved)
+        for source_id, target_ids in ctx.link_map.resolved.items():
+            ctx.dependencies.record(LINKS, source_id, target_ids)
+        for target_id, sources in ctx.backlinks.items():
+            ctx.dependencies.record(BACKLINKS, target_id, (z.id for z in sources))
 
     def export(self, ctx: PipelineContext, files: Files, config: MkDocsConfig) -> None:
         pass
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import json
+import logging
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from mkdocs.config.defaults import MkDocsConfig
     from mkdocs.structure.files import Files
     from mkdocs.structure.pages import Page
@@ -10,8 +14,66 @@ if TYPE_CHECKING:
     from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
     from mkdocs_zettelkasten.plugin.pipeline_context import PipelineContext
 
-from mkdocs_zettelkasten.plugin.pipeline_context import export_json
-from mkdocs_zettelkasten.plugin.services.graph_exporter import GraphExporter
+from mkdocs_zettelkasten.plugin.pipeline_context import export_chunks, export_json
+from mkdocs_zettelkasten.plugin.services.graph_exporter import (
+    COLUMNAR_FORMAT,
+    SLICE_DIR,
+    ColumnarGraph,
+    GraphExporter,
+    neighbourhood_slices,
+)
+
+logger = logging.getLogger(
+    __name__.replace("mkdocs_zettelkasten.plugin.", "mkdocs.plugins.zettelkasten.")
+)
+
+LAYOUT_FILENAME = ".graph_layout.json"
+
+# Hops from a zettel covered by its local graph slice.
+LOCAL_GRAPH_HOPS = 1
+
+
+def _load_positions(path: Path) -> dict[str, list[float]]:
+    if not path.is_file():
+        return {}
+    try:
+        positions = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        logger.warning("Discarding unreadable graph layout %s", path)
+        return {}
+    if not isinstance(positions, dict):
+        return {}
+    return {
+        zid: point
+        for zid, point in positions.items()
+        if isinstance(point, list)
+        and len(point) == 2
+        and all(isinstance(c, (int, float)) for c in point)
+    }
+
+
+def _save_positions(path: Path, positions: dict[str, list[float]]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(positions), encoding="utf-8")
+    except OSError:
+        logger.warning("Failed to write graph layout %s", path)
+
+
+def _layout_input(
+    graph: dict[str, Any] | ColumnarGraph,
+) -> tuple[list[str], list[int], list[bool]]:
+    """Node IDs, flat edge index pairs and sequence flags of *graph*."""
+    if isinstance(graph, ColumnarGraph):
+        kinds = graph.edge_kinds
+        sequence = kinds.names.index("sequence") if "sequence" in kinds.names else -1
+        return graph.ids, list(graph.edges), [k == sequence for k in kinds.index]
+    ids = [node["id"] for node in graph["nodes"]]
+    index = {zid: i for i, zid in enumerate(ids)}
+    edges: list[int] = []
+    for edge in graph["edges"]:
+        edges += (index[edge["source"]], index[edge["target"]])
+    return ids, edges, [edge.get("type") == "sequence" for edge in graph["edges"]]
 
 
 class GraphFeature:
@@ -21,21 +83,88 @@ class GraphFeature:
 
     def __init__(self) -> None:
         self._exporter = GraphExporter()
-        self._graph_data: dict[str, Any] = {}
+        self._graph_data: dict[str, Any] | ColumnarGraph = {}
+        # Node positions by zettel ID, kept across serve rebuilds; loaded
+        # from disk on first use.
+        self._positions: dict[str, list[float]] | None = None
+        # Local graph slice path by zettel ID, and slice JSON by path.
+        self._slice_paths: dict[str, str] = {}
+        self._slices: dict[str, str] = {}
 
     def is_enabled(self, config: ZettelkastenConfig) -> bool:
         return config.graph_enabled
 
     def compute(self, ctx: PipelineContext) -> None:
-        self._graph_data = self._exporter.export(
+        export = (
+            self._exporter.export_columnar
+            if ctx.config.graph_format == COLUMNAR_FORMAT
+            else self._exporter.export
+        )
+        self._graph_data = export(
             ctx.store,
             ctx.tags_metadata,
             ctx.backlinks,
             file_suffix=ctx.config.file_suffix,
         )
+        if ctx.config.graph_layout_enabled:
+            self._add_layout(ctx)
+        self._slice_paths, self._slices = {}, {}
+        if ctx.config.graph_local_slices:
+            graph = self._graph_data
+            if not isinstance(graph, ColumnarGraph):
+                graph = self._exporter.export_columnar(
+                    ctx.store,
+                    ctx.tags_metadata,
+                    ctx.backlinks,
+                    file_suffix=ctx.config.file_suffix,
+                )
+            self._slice_paths, self._slices = neighbourhood_slices(
+                graph, LOCAL_GRAPH_HOPS
+            )
+
+    def _add_layout(self, ctx: PipelineContext) -> None:
+        """Precompute node positions, starting from the previous layout."""
+        try:
+            from mkdocs_zettelkasten.plugin.services import graph_layout
+        except ImportError:
+            logger.warning(
+                "Graph layout needs numpy, leaving the layout to the graph view"
+            )
+            return
+        path = ctx.tags_folder / LAYOUT_FILENAME
+        if self._positions is None:
+            self._positions = _load_positions(path)
+
+        ids, edges, sequence = _layout_input(self._graph_data)
+        previous = self._positions
+        seeds = {i: previous[zid] for i, zid in enumerate(ids) if zid in previous}
+        layout = graph_layout.compute_layout(len(ids), edges, sequence, seeds)
+        points = [[round(x, 1), round(y, 1)] for x, y in layout.tolist()]
+        self._positions = dict(zip(ids, points, strict=True))
+        _save_positions(path, self._positions)
+
+        if isinstance(self._graph_data, ColumnarGraph):
+            self._graph_data.positions = [c for point in points for c in point]
+        else:
+            for node, (x, y) in zip(self._graph_data["nodes"], points, strict=True):
+                node["x"] = x
+                node["y"] = y
 
     def export(self, ctx: PipelineContext, files: Files, config: MkDocsConfig) -> None:
-        export_json(ctx, "graph.json", self._graph_data, files, config)
+        if isinstance(self._graph_data, ColumnarGraph):
+            export_chunks(
+                ctx, "graph.json", self._graph_data.iter_json(), files, config
+            )
+        else:
+            export_json(ctx, "graph.json", self._graph_data, files, config)
+        # Slice names change with their content; drop the ones left behind.
+        for stale in (ctx.tags_folder / SLICE_DIR).glob("*.json"):
+            if f"{SLICE_DIR}/{stale.name}" not in self._slices:
+                stale.unlink()
+        for path, text in self._slices.items():
+            export_chunks(ctx, path, (text,), files, config)
 
-    def adapt_page(self, page: Page, ctx: PipelineContext) -> None:
-        pass
+    def adapt_page(self, page: Page, ctx: PipelineContext) -> None:  # noqa: ARG002
+        zettel = page.meta.get("zettel")
+        if zettel is not None and self._slice_paths:
+            page.meta["local_graph"] = self._slice_paths.get(str(zettel.id))
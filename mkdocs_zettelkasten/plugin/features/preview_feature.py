@@ -10,8 +10,12 @@ if TYPE_CHECKING:
     from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
     from mkdocs_zettelkasten.plugin.pipeline_context import PipelineContext
 
-from mkdocs_zettelkasten.plugin.pipeline_context import export_json
-from mkdocs_zettelkasten.plugin.services.preview_exporter import PreviewExporter
+from mkdocs_zettelkasten.plugin.pipeline_context import export_chunks, export_json
+from mkdocs_zettelkasten.plugin.services.preview_exporter import (
+    SHARD_DIR,
+    PreviewExporter,
+    shard_previews,
+)
 
 
 class PreviewFeature:
@@ -34,7 +38,20 @@ class PreviewFeature:
         )
 
     def export(self, ctx: PipelineContext, files: Files, config: MkDocsConfig) -> None:
-        export_json(ctx, "previews.json", self._preview_data, files, config)
+        if ctx.config.preview_shard_size > 0:
+            manifest, shards = shard_previews(
+                self._preview_data, ctx.config.preview_shard_size
+            )
+        else:
+            manifest, shards = self._preview_data, {}
+        # Shard names change with their content, and sharding may have been
+        # turned off since the last build; drop the ones left behind.
+        for stale in (ctx.tags_folder / SHARD_DIR).glob("*.json"):
+            if f"{SHARD_DIR}/{stale.name}" not in shards:
+                stale.unlink()
+        for path, text in shards.items():
+            export_chunks(ctx, path, (text,), files, config)
+        export_json(ctx, "previews.json", manifest, files, config)
 
     def adapt_page(self, page: Page, ctx: PipelineContext) -> None:
         pass
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
     from mkdocs_zettelkasten.plugin.pipeline_context import PipelineContext
 
+from mkdocs_zettelkasten.plugin.services.dependency_index import SEQUENCES
 from mkdocs_zettelkasten.plugin.services.sequence_service import SequenceService
 
 
@@ -23,6 +24,8 @@ class SequenceFeature:
 
     def compute(self, ctx: PipelineContext) -> None:
         ctx.sequence_children = SequenceService.build_tree(ctx.store)
+        for members in SequenceService.components(ctx.sequence_children):
+            ctx.dependencies.record_group(SEQUENCES, members)
 
     def export(self, ctx: PipelineContext, files: Files, config: MkDocsConfig) -> None:
         pass
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
     from mkdocs_zettelkasten.plugin.pipeline_context import PipelineContext
 
 from mkdocs_zettelkasten.plugin.pipeline_context import export_json
+from mkdocs_zettelkasten.plugin.services.content_index import ContentIndex
+from mkdocs_zettelkasten.plugin.services.dependency_index import SUGGESTIONS
 from mkdocs_zettelkasten.plugin.services.suggestion_service import SuggestionService
 
 
@@ -21,6 +23,8 @@ class SuggestionFeature:
 
     def __init__(self) -> None:
         self._service = SuggestionService()
+        # Kept across serve rebuilds; loaded from disk on first use.
+        self._content_index: ContentIndex | None = None
 
     def is_enabled(self, config: ZettelkastenConfig) -> bool:
         return config.suggestions_enabled
@@ -32,7 +36,24 @@ class SuggestionFeature:
             ctx.link_map.resolved,
             confidence_threshold=ctx.config.suggestion_confidence_threshold,
             max_suggestions=ctx.config.max_suggestions,
+            stop_ratio=ctx.config.suggestion_stop_ratio,
+            backend=ctx.config.suggestion_backend,
+            content_index=self._update_content_index(ctx),
         )
+        for zid, suggs in ctx.suggestions.items():
+            ctx.dependencies.record(SUGGESTIONS, zid, (s["target_id"] for s in suggs))
+
+    def _update_content_index(self, ctx: PipelineContext) -> ContentIndex | None:
+        if not ctx.config.suggestion_content_enabled:
+            return None
+        if self._content_index is None:
+            self._content_index = ContentIndex(
+                ctx.tags_folder if ctx.config.parse_cache_enabled else None
+            )
+            self._content_index.load()
+        self._content_index.update(ctx.store.zettels)
+        self._content_index.save()
+        return self._content_index
 
     def export(self, ctx: PipelineContext, files: Files, config: MkDocsConfig) -> None:
         sugg_data: dict[str, list[dict]] = {}
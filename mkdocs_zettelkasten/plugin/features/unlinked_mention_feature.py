@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
     from mkdocs_zettelkasten.plugin.pipeline_context import PipelineContext
 
+from mkdocs_zettelkasten.plugin.services.dependency_index import UNLINKED_MENTIONS
 from mkdocs_zettelkasten.plugin.services.unlinked_mention_service import (
     UnlinkedMentionService,
 )
@@ -32,6 +33,10 @@ class UnlinkedMentionFeature:
             ctx.link_map.resolved,
             min_title_len=ctx.config.min_mention_title_length,
         )
+        for target_id, mentions in ctx.unlinked_mentions.items():
+            ctx.dependencies.record(
+                UNLINKED_MENTIONS, target_id, (src_id for src_id, _ in mentions)
+            )
 
     def export(self, ctx: PipelineContext, files: Files, config: MkDocsConfig) -> None:
         pass
@@ -4,7 +4,10 @@ import json
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from mkdocs_zettelkasten.plugin.services.dependency_index import DependencyIndex
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
     from mkdocs.config.defaults import MkDocsConfig
@@ -29,6 +32,26 @@ class PipelineContext:
     unlinked_mentions: dict[int, list[tuple[int, str]]] = field(default_factory=dict)
     sequence_children: dict[int, list[int]] = field(default_factory=dict)
     suggestions: dict[int, list[dict]] = field(default_factory=dict)
+    # Incremental rebuilds (mkdocs serve): IDs whose zettel or resolved links
+    # changed since ``previous`` was computed. None means a full rebuild.
+    changed_ids: set[int] | None = None
+    previous: PipelineContext | None = None
+    # Reverse-dependency edges recorded by features and page transforms.
+    dependencies: DependencyIndex = field(default_factory=DependencyIndex)
+    # Zettels whose relationships must be rebuilt; None means all of them.
+    dirty_ids: set[int] | None = None
+
+    def changed_panels(self, previous: PipelineContext) -> set[int]:
+        """Return IDs whose suggestions or unlinked mentions differ from *previous*."""
+        changed: set[int] = set()
+        for old, new in (
+            (previous.suggestions, self.suggestions),
+            (previous.unlinked_mentions, self.unlinked_mentions),
+        ):
+            changed |= {
+                zid for zid in old.keys() | new.keys() if old.get(zid) != new.get(zid)
+            }
+        return changed
 
 
 def export_json(
@@ -39,10 +62,23 @@ def export_json(
     config: MkDocsConfig,
 ) -> None:
     """Write JSON data to tags_folder and add to MkDocs build."""
+    export_chunks(ctx, filename, (json.dumps(data),), files, config)
+
+
+def export_chunks(
+    ctx: PipelineContext,
+    filename: str,
+    chunks: Iterable[str],
+    files: Files,
+    config: MkDocsConfig,
+) -> None:
+    """Stream text chunks to tags_folder and add the file to MkDocs build."""
     from mkdocs.structure.files import File
 
     path = ctx.tags_folder / filename
-    path.write_text(json.dumps(data), encoding="utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fh:
+        fh.writelines(chunks)
     files.append(
         File(
             path=filename,
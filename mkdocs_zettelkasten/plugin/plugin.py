@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, cast
 if TYPE_CHECKING:
     from mkdocs.config.defaults import MkDocsConfig
     from mkdocs.structure.files import Files
+    from mkdocs.structure.nav import Navigation
     from mkdocs.structure.pages import Page
 
 import logging
@@ -82,7 +83,14 @@ class ZettelkastenPlugin(BasePlugin):
         ("icon_backlinks", config_options.Type(str, default="fa fa-link")),
         ("file_suffix", config_options.Type(str, default=".md")),
         ("graph_enabled", config_options.Type(bool, default=False)),
+        (
+            "graph_format",
+            config_options.Choice(choices=("columnar", "objects"), default="objects"),
+        ),
+        ("graph_layout_enabled", config_options.Type(bool, default=False)),
+        ("graph_local_slices", config_options.Type(bool, default=False)),
         ("preview_enabled", config_options.Type(bool, default=False)),
+        ("preview_shard_size", config_options.Type(int, default=0)),
         ("suggestions_enabled", config_options.Type(bool, default=False)),
         ("workflow_enabled", config_options.Type(bool, default=False)),
         ("transclusion_strip_heading", config_options.Type(bool, default=True)),
@@ -91,9 +99,20 @@ class ZettelkastenPlugin(BasePlugin):
         ("review_stale_days", config_options.Type(int, default=30)),
         ("max_suggestions", config_options.Type(int, default=5)),
         ("suggestion_confidence_threshold", config_options.Type(float, default=0.3)),
+        ("suggestion_stop_ratio", config_options.Type(float, default=1.0)),
+        (
+            "suggestion_backend",
+            config_options.Choice(choices=("python", "sparse"), default="python"),
+        ),
+        ("suggestion_content_enabled", config_options.Type(bool, default=False)),
+        ("link_substring_fallback", config_options.Type(bool, default=False)),
         ("max_excerpt_length", config_options.Type(int, default=200)),
         ("max_embed_depth", config_options.Type(int, default=5)),
         ("min_mention_title_length", config_options.Type(int, default=3)),
+        ("parse_cache_enabled", config_options.Type(bool, default=True)),
+        ("parse_workers", config_options.Type(int, default=0)),
+        ("render_workers", config_options.Type(int, default=0)),
+        ("prerender_panels", config_options.Type(bool, default=False)),
     )
 
     def __init__(self) -> None:
@@ -115,11 +134,15 @@ class ZettelkastenPlugin(BasePlugin):
         self._active_features: list[Feature] = []
         self._ctx: PipelineContext | None = None
         self._is_serve = False
+        self._dirty = False
         self._initialize_logger()
         self.logger.debug("Initialized ZettelkastenPlugin with services and logger.")
 
-    def on_startup(self, *, command: str, dirty: bool) -> None:  # noqa: ARG002
+    def on_startup(self, *, command: str, dirty: bool) -> None:
         self._is_serve = command == "serve"
+        self._dirty = dirty
+        # Keep zettel state between live-reload rebuilds.
+        self.zettel_service.incremental = self._is_serve
 
     def on_config(self, config: MkDocsConfig) -> None:
         self.logger.setLevel(self.config["log_level"])
@@ -138,13 +161,20 @@ class ZettelkastenPlugin(BasePlugin):
             },
             timezone=tz,
         )
-        self.zettel_service.configure(self.zk_config)
         self.tags_service.configure(
             config,
             tags_key=self.zk_config.tags_key,
             file_suffix=self.zk_config.file_suffix,
             role_key=self.zk_config.role_key,
         )
+        self.zettel_service.configure(
+            self.zk_config,
+            cache_dir=(
+                self.tags_service.tags_folder
+                if self.zk_config.parse_cache_enabled
+                else None
+            ),
+        )
         self._active_features = resolve_features(self._features, self.zk_config)
         for f in self._active_features:
             if f.extra_key:
@@ -187,13 +217,53 @@ class ZettelkastenPlugin(BasePlugin):
             tags_metadata=self.tags_service.metadata,
             tags_folder=self.tags_service.tags_folder,
             site_dir=config["site_dir"],
+            changed_ids=self.zettel_service.changed_ids,
+            previous=(
+                self._ctx if self.zettel_service.changed_ids is not None else None
+            ),
         )
         for f in self._active_features:
             f.compute(self._ctx)
             f.export(self._ctx, files, config)
+        self.page_transformer.record_transclusions(self.zettel_service, self._ctx)
+        previous = self._ctx.previous
+        if previous is not None and self._ctx.changed_ids is not None:
+            self._ctx.dirty_ids = self._ctx.dependencies.dirty(
+                self._ctx.changed_ids, previous.dependencies
+            )
+            # Suggestions and unlinked mentions are scored against the whole
+            # vault, so an edit can change them for zettels it does not touch.
+            self._ctx.dirty_ids |= self._ctx.changed_panels(previous)
         RelationshipMaterializer.materialize_all(self._ctx)
+        self._ctx.previous = None
         self.logger.info("Processed %d files in on_files hook.", len(files))
 
+    def on_nav(
+        self,
+        nav: Navigation,  # noqa: ARG002
+        /,
+        *,
+        config: MkDocsConfig,
+        files: Files,
+    ) -> None:
+        workers = self.zk_config.render_workers
+        if workers <= 1 or self._ctx is None:
+            return
+        # With --dirty, MkDocs only renders pages whose source changed.
+        self.page_transformer.precompute(
+            [
+                f.page
+                for f in files.documentation_pages()
+                if f.page is not None and (not self._dirty or f.is_modified())
+            ],
+            config,
+            files,
+            self.zettel_service,
+            self._active_features,
+            self._ctx,
+            workers,
+        )
+
     def on_page_markdown(
         self,
         markdown: str,
@@ -207,15 +277,17 @@ class ZettelkastenPlugin(BasePlugin):
         if self._ctx is None:
             msg = "PipelineContext not initialized; on_files must run first"
             raise RuntimeError(msg)
-        transformed_markdown = self.page_transformer.transform(
-            markdown,
-            page,
-            config,
-            files,
-            self.zettel_service,
-            self._active_features,
-            self._ctx,
-        )
+        transformed_markdown = self.page_transformer.take(markdown, page, files)
+        if transformed_markdown is None:
+            transformed_markdown = self.page_transformer.transform(
+                markdown,
+                page,
+                config,
+                files,
+                self.zettel_service,
+                self._active_features,
+                self._ctx,
+            )
         if self.config["editor_enabled"]:
             page.meta["editor"] = {
                 "repo": self.config["editor_repo"],
@@ -260,6 +332,7 @@ class ZettelkastenPlugin(BasePlugin):
         return handler
 
     def on_post_build(self, *, config: MkDocsConfig) -> None:
+        self.page_transformer.log_stats()
         if self._is_serve or not self.config["minify_js"]:
             return
         import rjsmin
@@ -1,4 +1,5 @@
 import logging
+from bisect import insort
 from collections import defaultdict
 
 from mkdocs_zettelkasten.plugin.entities.zettel import Zettel
@@ -33,3 +34,59 @@ class BacklinkProcessor:
                 backlinks[target_id].append(zettel)
 
         return backlinks
+
+    @classmethod
+    def update(
+        cls,
+        previous: dict[int, list[Zettel]],
+        store: ZettelStore,
+        old_resolved: dict[int, set[int]],
+        new_resolved: dict[int, set[int]],
+        changed_ids: set[int],
+    ) -> dict[int, list[Zettel]]:
+        """Patch a previous backlink map for sources in *changed_ids*.
+
+        Source lists stay ordered by zettel ID, and targets are keyed in the
+        order process() would add them, so both give identical output.
+        """
+        backlinks: dict[int, list[Zettel]] = defaultdict(list, previous)
+        touched: set[int] = set()
+
+        for source_id in changed_ids:
+            touched |= old_resolved.get(source_id, set())
+            touched |= new_resolved.get(source_id, set())
+        for target_id in touched:
+            backlinks[target_id] = [
+                z for z in backlinks[target_id] if z.id not in changed_ids
+            ]
+        for source_id in changed_ids:
+            source = store.get_by_id(source_id)
+            if source is None:
+                continue
+            for target_id in new_resolved.get(source_id, set()):
+                insort(backlinks[target_id], source, key=lambda z: z.id)
+
+        for target_id in touched:
+            if not backlinks[target_id] or store.get_by_id(target_id) is None:
+                del backlinks[target_id]
+
+        logger.debug(
+            "Updated backlinks for %d sources (%d targets touched)",
+            len(changed_ids),
+            len(touched),
+        )
+        return cls._in_process_order(backlinks, store, new_resolved)
+
+    @staticmethod
+    def _in_process_order(
+        backlinks: dict[int, list[Zettel]],
+        store: ZettelStore,
+        resolved_links: dict[int, set[int]],
+    ) -> dict[int, list[Zettel]]:
+        """Re-key *backlinks* in the order process() first reaches each target."""
+        ordered: dict[int, list[Zettel]] = defaultdict(list)
+        for zettel in store.zettels:
+            for target_id in resolved_links.get(zettel.id, set()):
+                if target_id in backlinks and target_id not in ordered:
+                    ordered[target_id] = backlinks[target_id]
+        return ordered
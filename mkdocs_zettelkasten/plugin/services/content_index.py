@@ -0,0 +1,231 @@
+"""Persistent TF-IDF index over zettel bodies for content-based suggestions.
+
+Documents are stored as cosine-normalized log term frequencies. These do
+not depend on the rest of the vault, so between builds only zettels whose
+body changed are tokenized again. Queries weight their terms by IDF at
+search time (the SMART ``lnc.ltc`` scheme), so scores are cosine
+similarities in [0, 1].
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import logging
+import math
+import pickle
+import re
+from collections import Counter
+from typing import TYPE_CHECKING, NamedTuple
+
+from mkdocs_zettelkasten.plugin.entities.body_view import FENCED_CODE
+from mkdocs_zettelkasten.plugin.utils.patterns import EMBED_LINK, MD_LINK, WIKI_LINK
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+    from pathlib import Path
+
+    from mkdocs_zettelkasten.plugin.entities.body_view import BodyView
+    from mkdocs_zettelkasten.plugin.entities.zettel import Zettel
+
+logger = logging.getLogger(
+    __name__.replace("mkdocs_zettelkasten.plugin.", "mkdocs.plugins.zettelkasten.")
+)
+
+INDEX_FILENAME = ".content_index.pickle"
+
+# Bump whenever tokenization or the persisted layout changes.
+_INDEX_VERSION = 1
+
+# Only the highest-weighted terms of a zettel are used to find neighbours.
+# These pruning limits are documented with suggestion_content_enabled.
+_QUERY_TERMS = 16
+# Terms in more than this fraction of the vault do not produce candidates,
+# unless they appear in fewer than _MIN_DF_LIMIT zettels.
+_MAX_DF_RATIO = 0.05
+_MIN_DF_LIMIT = 50
+
+_TOKEN_RE = re.compile(r"[^\W\d_]{3,}")
+_INLINE_CODE = re.compile(r"`[^`\n]*`")
+_URL = re.compile(r"https?://\S+")
+_HTML_TAG = re.compile(r"<[^>\n]+>")
+_STOP_WORDS = frozenset(
+    "about after also and are because been but can could did does for from had "  # noqa: SIM905
+    "has have her his how into its just more most not now only other our out "
+    "over same she some such than that the their them then there these they "
+    "this those through too very was were what when where which while who why "
+    "will with would you your".split()
+)
+
+
+def tokenize(body_view: BodyView) -> list[str]:
+    """Return lowercase word tokens of a body, without code, links and references."""
+    text = FENCED_CODE.sub(" ", body_view.without_refs.body)
+    text = _INLINE_CODE.sub(" ", text)
+    text = EMBED_LINK.sub(" ", text)
+    text = WIKI_LINK.sub(lambda m: m.group("title") or " ", text)
+    text = MD_LINK.sub(lambda m: m.group("title"), text)
+    text = _URL.sub(" ", text)
+    text = _HTML_TAG.sub(" ", text)
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOP_WORDS]
+
+
+def _digest(body: str) -> str:
+    return hashlib.blake2b(body.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _document_weights(tokens: list[str]) -> dict[str, float]:
+    """Cosine-normalized ``1 + log(tf)`` weights."""
+    weights = {term: 1.0 + math.log(tf) for term, tf in Counter(tokens).items()}
+    norm = math.sqrt(sum(w * w for w in weights.values()))
+    return {term: w / norm for term, w in weights.items()} if norm else {}
+
+
+class _Doc(NamedTuple):
+    digest: str
+    weights: dict[str, float]
+
+
+class ContentIndex:
+    """Inverted index from terms to per-zettel weights, kept across builds."""
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self.path = cache_dir / INDEX_FILENAME if cache_dir is not None else None
+        self._docs: dict[int, _Doc] = {}
+        self._postings: dict[str, dict[int, float]] = {}
+        self._modified = False
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def load(self) -> None:
+        """Read persisted documents, dropping them on a version mismatch."""
+        self._docs = {}
+        self._postings = {}
+        self._modified = False
+        if self.path is None or not self.path.is_file():
+            return
+        try:
+            with self.path.open("rb") as fh:
+                # Local build artefact written by save() below.
+                version, docs = pickle.load(fh)  # noqa: S301
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            logger.warning("Discarding unreadable content index %s", self.path)
+            return
+        except (AttributeError, ImportError):
+            logger.warning("Discarding incompatible content index %s", self.path)
+            return
+        if version != _INDEX_VERSION:
+            logger.info("Content index invalidated by version change")
+            return
+        for zettel_id, doc in docs.items():
+            self._add(zettel_id, _Doc(*doc))
+        logger.debug("Loaded %d content index documents", len(docs))
+
+    def save(self) -> None:
+        """Persist the documents if anything changed since the last save."""
+        if self.path is None or not self._modified:
+            return
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("wb") as fh:
+                pickle.dump(
+                    (_INDEX_VERSION, {k: tuple(v) for k, v in self._docs.items()}),
+                    fh,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            tmp_path.replace(self.path)
+        except OSError:
+            logger.warning("Failed to write content index %s", self.path)
+            return
+        self._modified = False
+
+    def update(self, zettels: Iterable[Zettel]) -> int:
+        """Sync the index with *zettels*, re-tokenizing only changed bodies.
+
+        Returns the number of documents that were added, replaced or removed.
+        """
+        seen: set[int] = set()
+        changed = 0
+        for zettel in zettels:
+            seen.add(zettel.id)
+            digest = _digest(zettel.body)
+            doc = self._docs.get(zettel.id)
+            if doc is not None and doc.digest == digest:
+                continue
+            self._remove(zettel.id)
+            self._add(
+                zettel.id, _Doc(digest, _document_weights(tokenize(zettel.body_view)))
+            )
+            changed += 1
+        for zettel_id in self._docs.keys() - seen:
+            self._remove(zettel_id)
+            changed += 1
+        if changed:
+            self._modified = True
+            logger.debug(
+                "Content index: %d of %d documents changed", changed, len(seen)
+            )
+        return changed
+
+    def _add(self, zettel_id: int, doc: _Doc) -> None:
+        self._docs[zettel_id] = doc
+        for term, weight in doc.weights.items():
+            self._postings.setdefault(term, {})[zettel_id] = weight
+
+    def _remove(self, zettel_id: int) -> None:
+        doc = self._docs.pop(zettel_id, None)
+        if doc is None:
+            return
+        for term in doc.weights:
+            posting = self._postings[term]
+            del posting[zettel_id]
+            if not posting:
+                del self._postings[term]
+
+    def neighbours(
+        self,
+        zettel_id: int,
+        k: int,
+        threshold: float = 0.0,
+        exclude: Collection[int] = (),
+    ) -> list[tuple[int, float]]:
+        """Return up to *k* (zettel_id, cosine) pairs most similar to *zettel_id*.
+
+        Zettels in *exclude* are skipped before the top *k* are picked. Only
+        the zettel's top-weighted terms that are not too common are followed,
+        so scores are lower bounds of the full cosine similarity.
+        """
+        doc = self._docs.get(zettel_id)
+        if doc is None:
+            return []
+        n_docs = len(self._docs)
+        df_limit = max(_MAX_DF_RATIO * n_docs, _MIN_DF_LIMIT)
+        query: list[tuple[float, str]] = []
+        norm = 0.0
+        for term, weight in doc.weights.items():
+            df = len(self._postings[term])
+            q_weight = weight * math.log(n_docs / df)
+            norm += q_weight * q_weight
+            if 1 < df <= df_limit:
+                query.append((q_weight, term))
+        if not norm:
+            return []
+        norm = math.sqrt(norm)
+
+        scores: dict[int, float] = {}
+        for q_weight, term in heapq.nlargest(_QUERY_TERMS, query):
+            factor = q_weight / norm
+            for other_id, weight in self._postings[term].items():
+                scores[other_id] = scores.get(other_id, 0.0) + factor * weight
+        scores.pop(zettel_id, None)
+        return heapq.nlargest(
+            k,
+            (
+                (zid, score)
+                for zid, score in scores.items()
+                if score >= threshold and zid not in exclude
+            ),
+            key=lambda item: (item[1], -item[0]),
+        )
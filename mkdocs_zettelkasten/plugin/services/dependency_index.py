@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger(
+    __name__.replace("mkdocs_zettelkasten.plugin.", "mkdocs.plugins.zettelkasten.")
+)
+
+# Edge kinds recorded by the pipeline.
+LINKS = "links"
+BACKLINKS = "backlinks"
+UNLINKED_MENTIONS = "unlinked_mentions"
+SEQUENCES = "sequences"
+SUGGESTIONS = "suggestions"
+TRANSCLUSION = "transclusion"
+
+
+class DependencyIndex:
+    """Reverse-dependency edges between zettels, grouped by kind.
+
+    An edge means the dependent's relationships or rendered page show data
+    (title, URL, snippet, body) taken from the dependency. Sequences are
+    recorded as groups: every member of a tree shows every other member.
+    """
+
+    def __init__(self) -> None:
+        self._dependents: dict[str, dict[int, set[int]]] = {}
+        self._groups: dict[str, dict[int, frozenset[int]]] = {}
+
+    def record(
+        self, kind: str, dependent_id: int, dependency_ids: Iterable[int]
+    ) -> None:
+        """Record that *dependent_id* shows data from each of *dependency_ids*."""
+        edges = self._dependents.setdefault(kind, {})
+        for dependency_id in dependency_ids:
+            if dependency_id != dependent_id:
+                edges.setdefault(dependency_id, set()).add(dependent_id)
+
+    def record_group(self, kind: str, member_ids: Iterable[int]) -> None:
+        """Record that all *member_ids* depend on each other."""
+        group = frozenset(member_ids)
+        groups = self._groups.setdefault(kind, {})
+        for member_id in group:
+            groups[member_id] = group
+
+    def dependents(self, zettel_id: int) -> set[int]:
+        """Return IDs whose derived data depends on *zettel_id*."""
+        result: set[int] = set()
+        for edges in self._dependents.values():
+            result |= edges.get(zettel_id, set())
+        for groups in self._groups.values():
+            result |= groups.get(zettel_id, frozenset())
+        result.discard(zettel_id)
+        return result
+
+    def dirty(
+        self,
+        changed_ids: Iterable[int],
+        previous: DependencyIndex | None = None,
+    ) -> set[int]:
+        """Return *changed_ids* plus every zettel depending on one of them.
+
+        Edges from *previous* are included so that zettels which stopped
+        depending on a changed note (removed link, moved sequence, ...) are
+        refreshed too.
+        """
+        changed = set(changed_ids)
+        dirty = set(changed)
+        for index in (self, previous):
+            if index is None:
+                continue
+            for zettel_id in changed:
+                dirty |= index.dependents(zettel_id)
+        logger.debug("%d changed zettels dirty %d zettels", len(changed), len(dirty))
+        return dirty
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import logging
+from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
+
+from mkdocs_zettelkasten.plugin.services.link_resolver import (
+    is_relative_link,
+    normalize_link,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from mkdocs.structure.files import File
+
+logger = logging.getLogger(
+    __name__.replace("mkdocs_zettelkasten.plugin.", "mkdocs.plugins.zettelkasten.")
+)
+
+
+def _segments(path: str) -> tuple[str, ...]:
+    return tuple(part for part in path.split("/") if part not in {"", "."})
+
+
+class FileIndex:
+    """Lookups over the MkDocs files of one build, computed once.
+
+    Files are indexed by every tail of their ``src_path`` segments, so a
+    link ``sub/note.md`` finds ``docs/sub/note.md``. When several files
+    share a tail, the first one in build order wins.
+    """
+
+    def __init__(self, files: Iterable[File]) -> None:
+        self.files = list(files)
+        self._suffix_index: dict[tuple[str, ...], File] = {}
+        self._src_index: dict[str, File] = {}
+        self._abs_index: dict[str, File] = {}
+        for f in self.files:
+            self._src_index.setdefault(f.src_path, f)
+            if f.abs_src_path:
+                self._abs_index.setdefault(f.abs_src_path, f)
+            parts = _segments(f.src_path)
+            for i in range(len(parts)):
+                self._suffix_index.setdefault(parts[i:], f)
+        logger.debug("Indexed %d files", len(self.files))
+
+    def get_by_src_path(self, src_path: str) -> File | None:
+        """Return the first file with exactly this ``src_path``."""
+        return self._src_index.get(src_path)
+
+    def get_by_abs_src_path(self, abs_src_path: str) -> File | None:
+        """Return the first file read from *abs_src_path*."""
+        return self._abs_index.get(abs_src_path)
+
+    def get_by_suffix(self, path: str) -> File | None:
+        """Return the first file whose ``src_path`` ends with *path*'s segments."""
+        return self._suffix_index.get(_segments(path))
+
+    def get_by_link(self, link: str, file_suffix: str, src_path: str) -> File | None:
+        """Return the file a link in the page at *src_path* points to.
+
+        The link is normalized as for the link map. Explicitly relative
+        links must match their resolved path exactly; others match by
+        trailing segments, as in :meth:`get_by_suffix`.
+        """
+        relative = is_relative_link(link)
+        base = _segments(PurePosixPath(src_path).parent.as_posix()) if relative else ()
+        parts = normalize_link(link, file_suffix, base)
+        if not parts:
+            return None
+        parts = (*parts[:-1], parts[-1] + file_suffix)
+        if relative:
+            return self._src_index.get("/".join(parts))
+        return self._suffix_index.get(parts)
+
+    def find_containing(self, fragment: str) -> File | None:
+        """Return the first file whose ``src_path`` contains *fragment*.
+
+        Linear scan kept for substring-matching compatibility.
+        """
+        return next((f for f in self.files if fragment in f.src_path), None)
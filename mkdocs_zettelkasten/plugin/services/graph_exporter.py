@@ -1,11 +1,223 @@
 from __future__ import annotations
 
+import hashlib
+import json
+from array import array
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from mkdocs_zettelkasten.plugin.entities.zettel import Zettel
     from mkdocs_zettelkasten.plugin.services.zettel_store import ZettelStore
 
+COLUMNAR_FORMAT = "columnar"
+COLUMNAR_VERSION = 1
+
+# Folder of the per-zettel local graph slices.
+SLICE_DIR = "local-graph"
+
+# Values per JSON chunk when streaming columns.
+_CHUNK = 4096
+
+
+def _number_column(values: array | list[int] | list[float]) -> Iterator[str]:
+    yield "["
+    for start in range(0, len(values), _CHUNK):
+        if start:
+            yield ","
+        yield ",".join(map(str, values[start : start + _CHUNK]))
+    yield "]"
+
+
+def _str_column(values: list[str]) -> Iterator[str]:
+    yield "["
+    for start in range(0, len(values), _CHUNK):
+        if start:
+            yield ","
+        yield json.dumps(values[start : start + _CHUNK])[1:-1]
+    yield "]"
+
+
+@dataclass
+class _Categories:
+    """String table plus an index into it per item; -1 means no value."""
+
+    names: list[str] = field(default_factory=list)
+    index: array = field(default_factory=lambda: array("i"))
+    _ids: dict[str, int] = field(default_factory=dict)
+
+    def lookup(self, value: str) -> int:
+        idx = self._ids.get(value)
+        if idx is None:
+            idx = self._ids[value] = len(self.names)
+            self.names.append(value)
+        return idx
+
+    def append(self, value: str | None) -> None:
+        self.index.append(-1 if value is None else self.lookup(value))
+
+    def value(self, i: int) -> str | None:
+        idx = self.index[i]
+        return None if idx < 0 else self.names[idx]
+
+    def iter_json(self) -> Iterator[str]:
+        yield '{"names":'
+        yield from _str_column(self.names)
+        yield ',"index":'
+        yield from _number_column(self.index)
+        yield "}"
+
+
+@dataclass
+class ColumnarGraph:
+    """Graph as parallel columns, encoded to JSON chunk by chunk.
+
+    Strings live in tables (``ids``, ``titles``, ``urls``, tag, type,
+    maturity and role names) and everything else is an integer index
+    into them. Node ``i``'s tags are
+    ``tags.index[tags.offsets[i]:tags.offsets[i + 1]]``; edge ``e`` runs
+    from node ``edges[2e]`` to node ``edges[2e + 1]`` and has kind
+    ``edge_kinds.index[e]``.
+    """
+
+    ids: list[str] = field(default_factory=list)
+    titles: list[str] = field(default_factory=list)
+    urls: list[str] = field(default_factory=list)
+    # Flattened tag indices of all nodes, sliced by tag_offsets.
+    tags: _Categories = field(default_factory=_Categories)
+    tag_offsets: array = field(default_factory=lambda: array("i", [0]))
+    types: _Categories = field(default_factory=_Categories)
+    maturities: _Categories = field(default_factory=_Categories)
+    roles: _Categories = field(default_factory=_Categories)
+    degree: array = field(default_factory=lambda: array("i"))
+    edges: array = field(default_factory=lambda: array("i"))
+    edge_kinds: _Categories = field(default_factory=_Categories)
+    # Precomputed layout: node i sits at (positions[2i], positions[2i + 1]).
+    # Empty when the graph view lays the graph out itself.
+    positions: list[float] = field(default_factory=list)
+
+    def add_node(self, zettel: Zettel, url: str, tags: list[str]) -> None:
+        self.ids.append(str(zettel.id))
+        self.titles.append(zettel.title)
+        self.urls.append(url)
+        for tag in tags:
+            self.tags.append(tag)
+        self.tag_offsets.append(len(self.tags.index))
+        self.types.append(zettel.note_type)
+        self.maturities.append(zettel.maturity)
+        self.roles.append(zettel.role)
+        self.degree.append(0)
+
+    def add_edge(self, source: int, target: int, kind: str) -> None:
+        self.edges.append(source)
+        self.edges.append(target)
+        self.edge_kinds.append(kind)
+        self.degree[source] += 1
+        self.degree[target] += 1
+
+    def subgraph(self, nodes: list[int], edges: list[int]) -> ColumnarGraph:
+        """Graph of *nodes* and the *edges* between them, in the given order.
+
+        Nodes keep their degree in the whole graph.
+        """
+        sub = ColumnarGraph()
+        position: dict[int, int] = {}
+        for i in nodes:
+            position[i] = len(sub.ids)
+            sub.ids.append(self.ids[i])
+            sub.titles.append(self.titles[i])
+            sub.urls.append(self.urls[i])
+            for t in range(self.tag_offsets[i], self.tag_offsets[i + 1]):
+                sub.tags.append(self.tags.value(t))
+            sub.tag_offsets.append(len(sub.tags.index))
+            sub.types.append(self.types.value(i))
+            sub.maturities.append(self.maturities.value(i))
+            sub.roles.append(self.roles.value(i))
+            sub.degree.append(self.degree[i])
+        for e in edges:
+            sub.edges.append(position[self.edges[2 * e]])
+            sub.edges.append(position[self.edges[2 * e + 1]])
+            sub.edge_kinds.append(self.edge_kinds.value(e))
+        return sub
+
+    def iter_json(self) -> Iterator[str]:
+        yield (
+            f'{{"format":"{COLUMNAR_FORMAT}","version":{COLUMNAR_VERSION},'
+            f'"nodeCount":{len(self.ids)},"edgeCount":{len(self.edges) // 2},"ids":'
+        )
+        yield from _str_column(self.ids)
+        yield ',"titles":'
+        yield from _str_column(self.titles)
+        yield ',"urls":'
+        yield from _str_column(self.urls)
+        yield ',"tags":{"names":'
+        yield from _str_column(self.tags.names)
+        yield ',"offsets":'
+        yield from _number_column(self.tag_offsets)
+        yield ',"index":'
+        yield from _number_column(self.tags.index)
+        yield '},"type":'
+        yield from self.types.iter_json()
+        yield ',"maturity":'
+        yield from self.maturities.iter_json()
+        yield ',"role":'
+        yield from self.roles.iter_json()
+        yield ',"degree":'
+        yield from _number_column(self.degree)
+        yield ',"edges":'
+        yield from _number_column(self.edges)
+        yield ',"edgeKinds":'
+        yield from self.edge_kinds.iter_json()
+        if self.positions:
+            yield ',"positions":'
+            yield from _number_column(self.positions)
+        yield "}"
+
+
+def neighbourhood_slices(
+    graph: ColumnarGraph, hops: int = 1
+) -> tuple[dict[str, str], dict[str, str]]:
+    """Cut *graph* into the neighbourhood of each node, for local graph views.
+
+    A slice holds the nodes at most *hops* edges away from its node, in
+    either direction, and every edge between them. Returns the path of
+    each node's slice keyed by node ID, and the JSON text of each slice
+    keyed by path. Paths are named after a hash of their content, so nodes
+    with the same neighbourhood share a file.
+    """
+    incident: list[list[int]] = [[] for _ in graph.ids]
+    for e in range(len(graph.edges) // 2):
+        incident[graph.edges[2 * e]].append(e)
+        incident[graph.edges[2 * e + 1]].append(e)
+
+    paths: dict[str, str] = {}
+    slices: dict[str, str] = {}
+    for center, zid in enumerate(graph.ids):
+        kept = {center}
+        frontier = [center]
+        for _ in range(hops):
+            reached = []
+            for node in frontier:
+                for e in incident[node]:
+                    for end in graph.edges[2 * e : 2 * e + 2]:
+                        if end not in kept:
+                            kept.add(end)
+                            reached.append(end)
+            frontier = reached
+        edges = {
+            e
+            for node in kept
+            for e in incident[node]
+            if graph.edges[2 * e] in kept and graph.edges[2 * e + 1] in kept
+        }
+        text = "".join(graph.subgraph(sorted(kept), sorted(edges)).iter_json())
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+        path = paths[zid] = f"{SLICE_DIR}/{digest}.json"
+        slices[path] = text
+    return paths, slices
+
 
 class GraphExporter:
     """Exports zettel graph data as a JSON-serializable dict."""
@@ -33,6 +245,46 @@ class GraphExporter:
 
         return {"nodes": nodes, "edges": edges}
 
+    def export_columnar(
+        self,
+        store: ZettelStore,
+        tags_metadata: list[dict[str, Any]],
+        backlinks: dict[int, list[Zettel]],
+        file_suffix: str = ".md",
+    ) -> ColumnarGraph:
+        """Same graph as :meth:`export`, in the columnar layout."""
+        tags_by_path = {m["src_path"]: m.get("tags", []) for m in tags_metadata}
+        graph = ColumnarGraph()
+        position: dict[int, int] = {}
+        for z in store.zettels:
+            position[z.id] = len(graph.ids)
+            graph.add_node(
+                z,
+                z.rel_path.removesuffix(file_suffix) + "/",
+                tags_by_path.get(z.rel_path, []) or [],
+            )
+
+        seen: set[tuple[int, int]] = set()
+        for target_zid, source_zettels in backlinks.items():
+            target = position.get(target_zid)
+            if target is None:
+                continue
+            for source_zettel in source_zettels:
+                source = position.get(source_zettel.id)
+                if source is not None and (source, target) not in seen:
+                    seen.add((source, target))
+                    graph.add_edge(source, target, "link")
+        seen.clear()
+        for z in store.zettels:
+            if z.sequence_parent_id is None:
+                continue
+            parent = position.get(z.sequence_parent_id)
+            child = position[z.id]
+            if parent is not None and (child, parent) not in seen:
+                seen.add((child, parent))
+                graph.add_edge(child, parent, "sequence")
+        return graph
+
     @staticmethod
     def _build_nodes(
         store: ZettelStore,
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
 from typing import TYPE_CHECKING, NamedTuple
+from urllib.parse import unquote
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from mkdocs_zettelkasten.plugin.entities.zettel import Zettel
+
     from .zettel_store import ZettelStore
 
 logger = logging.getLogger(
@@ -14,13 +21,63 @@ logger = logging.getLogger(
 _EXTERNAL_PREFIXES = ("http://", "https://", "#", "mailto:")
 
 
-class LinkMap(NamedTuple):
+class LinkStat(NamedTuple):
+    """How a raw link string resolved, and how often it occurs in the vault."""
+
+    target_id: int | None
+    occurrences: int
+
+
+@dataclass(frozen=True)
+class LinkMap:
     resolved: dict[int, set[int]]
     broken: list[tuple[str, str]]
+    # Link key -> resolution statistics; never mutated in place. Keys are raw
+    # links, or the full target path for links relative to their zettel.
+    stats: dict[str, LinkStat] = field(default_factory=dict)
+
+
+def is_external_link(link: str) -> bool:
+    """Return whether *link* leaves the vault (URL, mail or in-page anchor)."""
+    return link.startswith(_EXTERNAL_PREFIXES)
+
+
+def is_relative_link(link: str) -> bool:
+    """Return whether *link* is explicitly relative (``./x`` or ``../x``)."""
+    return link.startswith(("./", "../"))
+
+
+def normalize_link(
+    link: str, file_suffix: str = ".md", base: tuple[str, ...] = ()
+) -> tuple[str, ...]:
+    """Return the path segments a raw internal link refers to.
+
+    Drops a ``#anchor``, decodes URL-encoded characters, strips
+    *file_suffix* and resolves ``.`` and ``..`` segments. Explicitly
+    relative links are resolved against *base*, the directory segments of
+    the linking file, giving the target's full path. Other links are
+    matched by their tail segments, so ``..`` segments leaving them are
+    dropped.
+    """
+    path = unquote(link.partition("#")[0]).removesuffix(file_suffix)
+    parts: list[str] = list(base) if is_relative_link(link) else []
+    for segment in path.split("/"):
+        if segment in {"", "."}:
+            continue
+        if segment == "..":
+            if parts:
+                parts.pop()
+            continue
+        parts.append(segment)
+    return tuple(parts)
 
 
 class LinkResolver:
-    """Builds a pre-resolved link map from the zettel store."""
+    """Builds a pre-resolved link map from the zettel store.
+
+    Each distinct raw link string is normalized and looked up once per
+    resolution; repeated occurrences are served from a memo.
+    """
 
     @classmethod
     def resolve(cls, store: ZettelStore, file_suffix: str = ".md") -> LinkMap:
@@ -29,27 +86,140 @@ class LinkResolver:
         Returns a LinkMap with:
         - resolved: source zettel ID -> set of target zettel IDs
         - broken: list of (source rel_path, raw link) for unresolved internal links
+        - stats: raw link -> (target ID or None, occurrences)
         """
         resolved: dict[int, set[int]] = defaultdict(set)
         broken: list[tuple[str, str]] = []
+        memo: dict[str, int | None] = {}
+        occurrences: Counter[str] = Counter()
 
         for zettel in store.zettels:
-            for link in zettel.links:
-                if link.startswith(_EXTERNAL_PREFIXES):
-                    continue
-                target = store.get_by_partial_path(link, file_suffix)
-                if target is not None:
-                    resolved[zettel.id].add(target.id)
-                else:
-                    broken.append((zettel.rel_path, link))
+            cls._resolve_zettel(
+                zettel,
+                store,
+                file_suffix,
+                resolved[zettel.id],
+                broken,
+                memo,
+                occurrences,
+            )
 
         # Ensure every zettel has an entry even if it has no resolved links
         for zettel in store.zettels:
             resolved.setdefault(zettel.id, set())
 
+        stats = {
+            link: LinkStat(memo[link], count) for link, count in occurrences.items()
+        }
+        cls._log_stats(len(resolved), stats, broken)
+        return LinkMap(resolved=dict(resolved), broken=broken, stats=stats)
+
+    @classmethod
+    def resolve_incremental(
+        cls,
+        previous: LinkMap,
+        store: ZettelStore,
+        zettels: Iterable[Zettel],
+        file_suffix: str = ".md",
+        replaced: Iterable[Zettel] = (),
+    ) -> LinkMap:
+        """Re-resolve only *zettels*' links on top of *previous*.
+
+        Valid only while the store's path-to-ID layout is unchanged, since
+        every other zettel's targets are taken from *previous* as-is. For
+        the same reason the link memo of *previous* stays valid. *replaced*
+        are the previous versions of *zettels*, whose link occurrences are
+        subtracted from the statistics.
+        Returns a new LinkMap; *previous* is left untouched.
+        """
+        zettels = list(zettels)
+        sources = {z.rel_path for z in zettels}
+        resolved = dict(previous.resolved)
+        broken = [entry for entry in previous.broken if entry[0] not in sources]
+        memo = {link: stat.target_id for link, stat in previous.stats.items()}
+        occurrences = Counter(
+            {link: stat.occurrences for link, stat in previous.stats.items()}
+        )
+        for zettel in replaced:
+            occurrences.subtract(
+                cls._link_key(zettel, link, file_suffix)
+                for link in zettel.links
+                if not is_external_link(link)
+            )
+        for zettel in zettels:
+            targets: set[int] = set()
+            cls._resolve_zettel(
+                zettel, store, file_suffix, targets, broken, memo, occurrences
+            )
+            resolved[zettel.id] = targets
+        stats = {
+            link: LinkStat(memo[link], count)
+            for link, count in occurrences.items()
+            if count > 0
+        }
+        return LinkMap(resolved=resolved, broken=broken, stats=stats)
+
+    @staticmethod
+    def _resolve_zettel(
+        zettel: Zettel,
+        store: ZettelStore,
+        file_suffix: str,
+        targets: set[int],
+        broken: list[tuple[str, str]],
+        memo: dict[str, int | None],
+        occurrences: Counter[str],
+    ) -> None:
+        for link in zettel.links:
+            if is_external_link(link):
+                continue
+            key = LinkResolver._link_key(zettel, link, file_suffix)
+            occurrences[key] += 1
+            if key in memo:
+                target_id = memo[key]
+            else:
+                parts = (
+                    PurePosixPath(key).parts
+                    if is_relative_link(link)
+                    else normalize_link(link, file_suffix)
+                )
+                target = store.get_by_suffix(parts)
+                target_id = memo[key] = target.id if target is not None else None
+            if target_id is not None:
+                targets.add(target_id)
+            else:
+                broken.append((zettel.rel_path, link))
+
+    @staticmethod
+    def _link_key(zettel: Zettel, link: str, file_suffix: str) -> str:
+        """Return *link*, or its full target path when relative to *zettel*.
+
+        Relative links resolve differently from different directories, so
+        they are memoized by target path rather than by their raw text.
+        """
+        if not is_relative_link(link):
+            return link
+        base = zettel.path.parent.parts
+        return PurePosixPath(*normalize_link(link, file_suffix, base)).as_posix()
+
+    @staticmethod
+    def _log_stats(
+        sources: int, stats: dict[str, LinkStat], broken: list[tuple[str, str]]
+    ) -> None:
         logger.debug(
-            "Link resolution: %d sources, %d broken links",
-            len(resolved),
+            "Link resolution: %d sources, %d links (%d unique), %d broken",
+            sources,
+            sum(stat.occurrences for stat in stats.values()),
+            len(stats),
             len(broken),
         )
-        return LinkMap(resolved=dict(resolved), broken=broken)
+        if logger.isEnabledFor(logging.DEBUG):
+            most_broken = sorted(
+                (
+                    (stat.occurrences, link)
+                    for link, stat in stats.items()
+                    if stat.target_id is None
+                ),
+                reverse=True,
+            )[:10]
+            for count, link in most_broken:
+                logger.debug("Broken link %r occurs %d times", link, count)
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import copy
 import logging
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from mkdocs.utils import meta as page_meta
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from mkdocs.config.defaults import MkDocsConfig
     from mkdocs.structure.files import Files
     from mkdocs.structure.pages import Page
 
+    from mkdocs_zettelkasten.plugin.adapters.prev_next_page import Navigation
     from mkdocs_zettelkasten.plugin.feature import Feature
     from mkdocs_zettelkasten.plugin.pipeline_context import PipelineContext
     from mkdocs_zettelkasten.plugin.services.zettel_service import ZettelService
@@ -17,14 +24,33 @@ from mkdocs_zettelkasten.plugin.adapters.page_links_to_zettels import (
 )
 from mkdocs_zettelkasten.plugin.adapters.page_ref import get_page_ref
 from mkdocs_zettelkasten.plugin.adapters.page_title import adapt_page_title
-from mkdocs_zettelkasten.plugin.adapters.prev_next_page import get_prev_next_page
-from mkdocs_zettelkasten.plugin.adapters.transclusion import adapt_transclusion
+from mkdocs_zettelkasten.plugin.adapters.prev_next_page import (
+    build_navigation,
+    get_prev_next_page,
+)
+from mkdocs_zettelkasten.plugin.adapters.transclusion import (
+    EmbedCache,
+    adapt_transclusion,
+    embed_targets,
+)
+from mkdocs_zettelkasten.plugin.services.dependency_index import TRANSCLUSION
+from mkdocs_zettelkasten.plugin.services.file_index import FileIndex
 
 logger = logging.getLogger(
     __name__.replace("mkdocs_zettelkasten.plugin.", "mkdocs.plugins.zettelkasten.")
 )
 
 
+class _Prerendered(NamedTuple):
+    """Transform output computed ahead of ``on_page_markdown``."""
+
+    source: str
+    markdown: str
+    meta: dict[str, Any]
+    previous_page: Page | None
+    next_page: Page | None
+
+
 class PageTransformer:
     """
     Applies all Zettelkasten-specific transformations to page markdown.
@@ -40,6 +66,67 @@ class PageTransformer:
     After core adapters, feature.adapt_page() is called for each active feature.
     """
 
+    def __init__(self) -> None:
+        self._files: Files | None = None
+        self._file_index: FileIndex | None = None
+        self._navigation: Navigation | None = None
+        self._embed_cache = EmbedCache()
+        self._prerendered: dict[str, _Prerendered] = {}
+
+    def _index_for(self, files: Files) -> FileIndex:
+        """Return the file index of this build, built on its first page.
+
+        A new *files* collection starts a new build, which also resets the
+        per-build navigation map, embed cache and precomputed pages.
+        """
+        if self._file_index is None or files is not self._files:
+            self._files = files
+            self._file_index = FileIndex(files)
+            self._navigation = None
+            self._embed_cache = EmbedCache()
+            self._prerendered = {}
+        return self._file_index
+
+    def log_stats(self) -> None:
+        """Log per-build cache statistics."""
+        self._embed_cache.log_stats()
+
+    def _navigation_for(
+        self, files: Files, zettel_service: ZettelService
+    ) -> Navigation:
+        """Return the prev/next map of this build, built on its first page."""
+        index = self._index_for(files)
+        if self._navigation is None:
+            self._navigation = build_navigation(
+                index, zettel_service.store.zettels, zettel_service.file_suffix
+            )
+        return self._navigation
+
+    @staticmethod
+    def record_transclusions(
+        zettel_service: ZettelService, ctx: PipelineContext
+    ) -> None:
+        """Record every zettel's embeds, nested up to ``max_embed_depth``.
+
+        Read from the zettel bodies in ``on_files``, so the edges are known
+        before the dirty set of the same build is computed.
+        """
+        suffix = zettel_service.file_suffix
+        direct: dict[int, set[int]] = {}
+        for zettel in zettel_service.store.zettels:
+            targets = (
+                zettel_service.get_zettel_by_partial_path(path)
+                for path in embed_targets(zettel.body, suffix)
+            )
+            direct[zettel.id] = {t.id for t in targets if t is not None}
+        for zettel_id, targets in direct.items():
+            reached = set(targets)
+            frontier = targets
+            for _ in range(ctx.config.max_embed_depth):
+                frontier = {n for t in frontier for n in direct.get(t, ())} - reached
+                reached |= frontier
+            ctx.dependencies.record(TRANSCLUSION, zettel_id, reached)
+
     def transform(
         self,
         markdown: str,
@@ -49,8 +136,14 @@ class PageTransformer:
         zettel_service: ZettelService,
         features: list[Feature],
         ctx: PipelineContext,
+        *,
+        log_errors: bool = True,
     ) -> str:
-        """Apply core adapters and feature adapters to the markdown."""
+        """Apply core adapters and feature adapters to the markdown.
+
+        A failing adapter is logged before its exception is re-raised,
+        unless *log_errors* is false.
+        """
         src = page.file.src_path
         logger.debug("Started %s transformations", src)
 
@@ -58,7 +151,8 @@ class PageTransformer:
             try:
                 return fn(*args, **kwargs)
             except Exception:
-                logger.exception("Adapter %s failed on %s", name, src)
+                if log_errors:
+                    logger.exception("Adapter %s failed on %s", name, src)
                 raise
 
         # Step 1 — no prerequisites; populates page.meta["zettel"]
@@ -71,6 +165,8 @@ class PageTransformer:
             page,
             page.meta.get("zettel"),
         )
+
+        file_index = self._index_for(files)
         # Step 3 — no prerequisites; expands transclusions before link processing
         markdown = _run(
             "adapt_transclusion",
@@ -83,6 +179,7 @@ class PageTransformer:
                 "transclusion_strip_heading", True
             ),
             max_embed_depth=ctx.config.max_embed_depth,
+            cache=self._embed_cache,
         )
         # Step 4 — requires: transclusions resolved (step 3)
         markdown = _run(
@@ -94,6 +191,8 @@ class PageTransformer:
             files,
             zettel_service.get_zettel_by_partial_path,
             file_suffix=zettel_service.file_suffix,
+            file_index=file_index,
+            substring_fallback=ctx.config.link_substring_fallback,
         )
         # Step 5 — requires: links resolved (step 4)
         processed_md, page.meta["ref"] = _run(
@@ -105,8 +204,9 @@ class PageTransformer:
             get_prev_next_page,
             page,
             files,
-            zettel_service.get_zettels(),
+            zettel_service.store.zettels,
             file_suffix=zettel_service.file_suffix,
+            navigation=self._navigation_for(files, zettel_service),
         )
 
         # Feature adapters
@@ -115,3 +215,88 @@ class PageTransformer:
 
         logger.debug("Finished %s transformations", src)
         return processed_md
+
+    def precompute(
+        self,
+        pages: Iterable[Page],
+        config: MkDocsConfig,
+        files: Files,
+        zettel_service: ZettelService,
+        features: list[Feature],
+        ctx: PipelineContext,
+        workers: int,
+    ) -> int:
+        """Transform *pages* across *workers* threads ahead of rendering.
+
+        Each page's source is read the way MkDocs reads it and transformed
+        on a shallow copy of the page, so nothing is visible until
+        :meth:`take` replays the result. Pages that fail are left for
+        ``on_page_markdown`` to transform (and report) serially.
+
+        Returns the number of precomputed pages.
+        """
+        # Build the per-build lazy state before threads race to create it.
+        self._navigation_for(files, zettel_service)
+        self._prerendered = {}
+
+        def _prerender(page: Page) -> _Prerendered | None:
+            try:
+                source = page.file.content_string
+                markdown, meta = page_meta.get_data(source)
+                shadow = copy.copy(page)
+                shadow.meta = dict(meta)
+                # The serial retry in on_page_markdown reports the failure.
+                result = self.transform(
+                    markdown,
+                    shadow,
+                    config,
+                    files,
+                    zettel_service,
+                    features,
+                    ctx,
+                    log_errors=False,
+                )
+            except Exception:  # noqa: BLE001
+                logger.debug("Deferring %s to on_page_markdown", page.file.src_path)
+                return None
+            return _Prerendered(
+                markdown,
+                result,
+                {
+                    k: v
+                    for k, v in shadow.meta.items()
+                    if k not in meta or meta[k] is not v
+                },
+                shadow.previous_page,
+                shadow.next_page,
+            )
+
+        pages = list(pages)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for page, done in zip(pages, executor.map(_prerender, pages), strict=True):
+                if done is not None:
+                    self._prerendered[page.file.src_path] = done
+        logger.info(
+            "Precomputed %d of %d pages across %d threads",
+            len(self._prerendered),
+            len(pages),
+            workers,
+        )
+        return len(self._prerendered)
+
+    def take(self, markdown: str, page: Page, files: Files) -> str | None:
+        """Return the precomputed transform of *page*, applying its side effects.
+
+        Returns None when nothing was precomputed for this build, or when
+        *markdown* is not the source it was computed from (e.g. another
+        plugin changed it).
+        """
+        if files is not self._files:
+            return None
+        done = self._prerendered.pop(page.file.src_path, None)
+        if done is None or done.source != markdown:
+            return None
+        page.meta.update(done.meta)
+        page.previous_page = done.previous_page
+        page.next_page = done.next_page
+        return done.markdown
@@ -0,0 +1,150 @@
+"""Pre-rendered HTML for the relationship panels of a zettel page.
+
+Fragments are rendered once per build instead of through Jinja loops on
+every page. Links point at ``SITE_ROOT``, which the theme replaces with
+the page's ``base_url`` so the same string works from any page.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mkdocs_zettelkasten.plugin.entities.zettel import (
+        LinkRef,
+        SequenceTreeNode,
+        SuggestionRef,
+        Zettel,
+    )
+
+logger = logging.getLogger(
+    __name__.replace("mkdocs_zettelkasten.plugin.", "mkdocs.plugins.zettelkasten.")
+)
+
+# Placeholder for the site root in rendered hrefs; see content.html.
+SITE_ROOT = "@zettelkasten-root@/"
+
+BACKLINKS = "backlinks"
+UNLINKED_MENTIONS = "unlinked_mentions"
+SUGGESTED_LINKS = "suggested_links"
+SEQUENCE_TREE = "sequence_tree"
+
+
+def _anchor(url: str, title: str) -> str:
+    return f'<a href="{SITE_ROOT}{url}">{title}</a>'
+
+
+class PanelRenderer:
+    """Renders panels, sharing the fragments of repeated items.
+
+    List items and sequence trees are cached by content for the lifetime
+    of the renderer (one materialization run): a note linked from many
+    pages is rendered once, and every member of a sequence reuses the
+    same tree with only its own node marked as current.
+    """
+
+    def __init__(self) -> None:
+        self._fragments: dict[tuple, str] = {}
+        self.hits = 0
+
+    def _fragment(self, key: tuple, render) -> str:
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            fragment = self._fragments[key] = render()
+        else:
+            self.hits += 1
+        return fragment
+
+    def render(self, zettel: Zettel) -> dict[str, str]:
+        """Return the ``<li>`` items of each non-empty panel of *zettel*."""
+        panels: dict[str, str] = {}
+        if zettel.backlinks:
+            panels[BACKLINKS] = self._link_list(zettel.backlinks)
+        if zettel.unlinked_mentions:
+            panels[UNLINKED_MENTIONS] = self._link_list(zettel.unlinked_mentions)
+        if zettel.suggested_links:
+            panels[SUGGESTED_LINKS] = self._suggestion_list(zettel.suggested_links)
+        if zettel.sequence_tree:
+            panels[SEQUENCE_TREE] = self._sequence_tree(zettel.sequence_tree)
+        return panels
+
+    def log_stats(self) -> None:
+        logger.debug(
+            "Rendered %d panel fragments, %d reused",
+            len(self._fragments),
+            self.hits,
+        )
+
+    def _link_list(self, links: list[LinkRef]) -> str:
+        items = [
+            self._fragment(
+                ("link", link["url"], link["title"], link["snippet"]),
+                lambda link=link: (
+                    f"<li>{_anchor(link['url'], link['title'])}"
+                    + (
+                        f'<div class="backlink-snippet">{link["snippet"]}</div>'
+                        if link["snippet"]
+                        else ""
+                    )
+                    + "</li>"
+                ),
+            )
+            for link in links
+        ]
+        return "".join(items)
+
+    def _suggestion_list(self, suggestions: list[SuggestionRef]) -> str:
+        items = [
+            self._fragment(
+                (
+                    "suggestion",
+                    sugg["url"],
+                    sugg["title"],
+                    sugg["reason"],
+                    sugg["confidence"],
+                ),
+                lambda sugg=sugg: (
+                    f"<li>{_anchor(sugg['url'], sugg['title'])} "
+                    f'<span class="suggestion-reason">'
+                    f"{sugg['reason']}, {sugg['confidence']}</span></li>"
+                ),
+            )
+            for sugg in suggestions
+        ]
+        return "".join(items)
+
+    def _sequence_tree(self, tree: list[SequenceTreeNode]) -> str:
+        # All members of a sequence share one tree; render it with every
+        # node as a link once, then swap in the current node.
+        shared = self._fragment(
+            ("tree", tree[0]["url"]), lambda: "".join(_tree_items(tree))
+        )
+        current = _find_current(tree)
+        if current is not None:
+            shared = shared.replace(
+                f"<li>{_anchor(current['url'], current['title'])}",
+                f'<li class="current"><strong>{current["title"]}</strong>',
+                1,
+            )
+        return shared
+
+
+def _tree_items(nodes: list[SequenceTreeNode]):
+    for node in nodes:
+        yield f"<li>{_anchor(node['url'], node['title'])}"
+        if node["children"]:
+            yield "<ul>"
+            yield from _tree_items(node["children"])
+            yield "</ul>"
+        yield "</li>"
+
+
+def _find_current(nodes: list[SequenceTreeNode]) -> SequenceTreeNode | None:
+    for node in nodes:
+        if node["current"]:
+            return node
+        found = _find_current(node["children"])
+        if found is not None:
+            return found
+    return None
@@ -0,0 +1,168 @@
+"""Persistent on-disk cache of parsed ZettelMeta records.
+
+Entries are keyed by absolute source path and validated by file size and
+mtime, falling back to a content hash when the stat signature changed (e.g.
+after a fresh checkout). The whole cache is discarded when any config key
+that influences parsing changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import pickle
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
+    from mkdocs_zettelkasten.plugin.entities.zettel import ZettelMeta
+
+logger = logging.getLogger(
+    __name__.replace("mkdocs_zettelkasten.plugin.", "mkdocs.plugins.zettelkasten.")
+)
+
+CACHE_FILENAME = ".zettel_cache.pickle"
+
+# Bump whenever ZettelMeta or the parsing rules change shape.
+_CACHE_VERSION = 1
+
+_FINGERPRINT_KEYS = (
+    "id_key",
+    "date_key",
+    "last_update_key",
+    "type_key",
+    "maturity_key",
+    "role_key",
+    "sequence_key",
+    "id_format",
+    "date_format",
+)
+
+
+class _Entry(NamedTuple):
+    size: int
+    mtime_ns: int
+    digest: str
+    meta: ZettelMeta
+
+
+def config_fingerprint(cfg: ZettelkastenConfig) -> tuple:
+    """Return the subset of config that affects parsed ZettelMeta values."""
+    return (
+        _CACHE_VERSION,
+        *(getattr(cfg, key) for key in _FINGERPRINT_KEYS),
+        str(cfg.timezone),
+    )
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class ParseCache:
+    """Maps source files to previously parsed ZettelMeta across builds."""
+
+    def __init__(self, cache_dir: Path, zettel_config: ZettelkastenConfig) -> None:
+        self.path = cache_dir / CACHE_FILENAME
+        self.fingerprint = config_fingerprint(zettel_config)
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, _Entry] = {}
+        self._fresh: dict[str, _Entry] = {}
+
+    def load(self) -> None:
+        """Read cached entries from disk, dropping them on fingerprint mismatch."""
+        self._entries = {}
+        self._fresh = {}
+        self.hits = 0
+        self.misses = 0
+        if not self.path.is_file():
+            return
+        try:
+            with self.path.open("rb") as fh:
+                # Local build artefact written by save() below.
+                fingerprint, entries = pickle.load(fh)  # noqa: S301
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            logger.warning("Discarding unreadable parse cache %s", self.path)
+            return
+        except (AttributeError, ImportError):
+            logger.warning("Discarding incompatible parse cache %s", self.path)
+            return
+        if fingerprint != self.fingerprint:
+            logger.info("Parse cache invalidated by configuration change")
+            return
+        self._entries = entries
+        logger.debug("Loaded %d parse cache entries", len(entries))
+
+    def get(self, abs_src_path: Path) -> ZettelMeta | None:
+        """Return the cached meta for an unchanged file, or None on a miss.
+
+        Callers recompute the last update date on every hit, since git
+        history can move on without touching the file.
+        """
+        key = str(abs_src_path)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        try:
+            st = abs_src_path.stat()
+        except OSError:
+            self.misses += 1
+            return None
+        if st.st_size == entry.size and st.st_mtime_ns == entry.mtime_ns:
+            self.hits += 1
+            self._fresh[key] = entry
+            return entry.meta
+        try:
+            digest = _digest(abs_src_path.read_bytes())
+        except OSError:
+            self.misses += 1
+            return None
+        if digest != entry.digest:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._fresh[key] = entry._replace(size=st.st_size, mtime_ns=st.st_mtime_ns)
+        return entry.meta
+
+    def put(self, meta: ZettelMeta) -> None:
+        """Record a freshly parsed meta for the file it was read from."""
+        try:
+            st = meta.path.stat()
+            digest = _digest(meta.path.read_bytes())
+        except OSError:
+            return
+        self._fresh[str(meta.path)] = _Entry(st.st_size, st.st_mtime_ns, digest, meta)
+
+    def refresh(self, meta: ZettelMeta) -> None:
+        """Replace the meta of an entry already recorded in this build."""
+        key = str(meta.path)
+        if key in self._fresh:
+            self._fresh[key] = self._fresh[key]._replace(meta=meta)
+
+    def save(self) -> None:
+        """Persist entries touched in this build; stale files are pruned."""
+        self._entries = self._fresh
+        self._fresh = {}
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("wb") as fh:
+                pickle.dump(
+                    (self.fingerprint, self._entries),
+                    fh,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            tmp_path.replace(self.path)
+        except OSError:
+            logger.warning("Failed to write parse cache %s", self.path)
+            return
+        logger.info(
+            "Parse cache: %d hits, %d misses (%d entries)",
+            self.hits,
+            self.misses,
+            len(self._entries),
+        )
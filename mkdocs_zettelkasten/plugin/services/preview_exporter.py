@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import math
 import re
 from typing import TYPE_CHECKING
 
@@ -11,6 +14,37 @@ logger = logging.getLogger(
 if TYPE_CHECKING:
     from mkdocs_zettelkasten.plugin.services.zettel_store import ZettelStore
 
+SHARD_DIR = "previews"
+SHARDED_FORMAT = "sharded"
+
+
+def shard_index(zettel_id: str, shard_count: int) -> int:
+    """Bucket of *zettel_id*; must match ``shardIndex`` in preview.js."""
+    h = 0
+    for ch in zettel_id:
+        h = (h * 31 + ord(ch)) & 0xFFFFFFFF
+    return h % shard_count
+
+
+def shard_previews(previews: dict, shard_size: int) -> tuple[dict, dict[str, str]]:
+    """Split *previews* into buckets of about *shard_size* entries.
+
+    Returns the manifest and the JSON text of each shard keyed by its path.
+    Shard paths contain a hash of their content, so browsers can cache them
+    for as long as they like: a changed shard gets a new name.
+    """
+    shard_count = max(1, math.ceil(len(previews) / shard_size))
+    buckets: list[dict] = [{} for _ in range(shard_count)]
+    for zid, preview in previews.items():
+        buckets[shard_index(zid, shard_count)][zid] = preview
+    shards: dict[str, str] = {}
+    for i, bucket in enumerate(buckets):
+        text = json.dumps(bucket)
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=4).hexdigest()
+        shards[f"{SHARD_DIR}/{i}.{digest}.json"] = text
+    logger.debug("Split %d previews into %d shards", len(previews), shard_count)
+    return {"format": SHARDED_FORMAT, "version": 1, "shards": list(shards)}, shards
+
 
 class PreviewExporter:
     """Exports zettel preview data as a JSON-serializable dict."""
@@ -27,15 +61,15 @@ class PreviewExporter:
         for z in store.zettels:
             zid = str(z.id)
             url = z.rel_path.removesuffix(file_suffix) + "/"
-            excerpt = self._extract_excerpt(z.body, max_excerpt_length)
+            excerpt = self._extract_excerpt(z.body_view.lines, max_excerpt_length)
             previews[zid] = {"title": z.title, "excerpt": excerpt, "url": url}
 
         return previews
 
-    def _extract_excerpt(self, body: str, max_length: int) -> str:
-        """Extract first paragraph from zettel body text."""
+    def _extract_excerpt(self, lines: list[str], max_length: int) -> str:
+        """Extract first paragraph from zettel body lines."""
         paragraph_lines: list[str] = []
-        for line in body.splitlines():
+        for line in lines:
             stripped = line.strip()
             if not stripped:
                 if paragraph_lines:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from mkdocs_zettelkasten.plugin.services.panel_renderer import PanelRenderer
 from mkdocs_zettelkasten.plugin.utils.tree_utils import build_tree_node
 
 if TYPE_CHECKING:
@@ -210,11 +211,22 @@ class RelationshipMaterializer:
     def materialize_all(ctx: PipelineContext) -> None:
         store = ctx.store
         file_suffix = ctx.config.file_suffix
-        for zettel in store.zettels:
+        zettels = store.zettels
+        if ctx.dirty_ids is not None:
+            # Everything else still holds relationships from the last run.
+            zettels = [z for z in zettels if z.id in ctx.dirty_ids]
+        renderer = PanelRenderer() if ctx.config.prerender_panels else None
+        for zettel in zettels:
+            # Zettels survive between incremental rebuilds; start clean.
+            zettel.reset_relationships()
             materialize_backlinks(zettel, ctx.backlinks, file_suffix)
             materialize_sequences(zettel, ctx.sequence_children, store, file_suffix)
             materialize_unlinked_mentions(
                 zettel, ctx.unlinked_mentions, store, file_suffix
             )
             materialize_suggestions(zettel, ctx.suggestions, store, file_suffix)
-        logger.info("Materialized relationships for %d zettels", len(store.zettels))
+            if renderer is not None:
+                zettel.panels = renderer.render(zettel)
+        if renderer is not None:
+            renderer.log_stats()
+        logger.info("Materialized relationships for %d zettels", len(zettels))
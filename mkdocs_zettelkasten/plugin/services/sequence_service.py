@@ -29,3 +29,25 @@ class SequenceService:
         total = sum(len(v) for v in children.values())
         logger.info("Built sequence tree: %d parent-child relations", total)
         return dict(children)
+
+    @staticmethod
+    def components(children: dict[int, list[int]]) -> list[set[int]]:
+        """Group IDs connected by parent-child relations into sequences."""
+        parent_of: dict[int, int] = {}
+
+        def _root(zid: int) -> int:
+            while parent_of.get(zid, zid) != zid:
+                parent_of[zid] = parent_of.get(parent_of[zid], parent_of[zid])
+                zid = parent_of[zid]
+            return zid
+
+        for parent_id, child_ids in children.items():
+            for child_id in child_ids:
+                a, b = _root(parent_id), _root(child_id)
+                if a != b:
+                    parent_of[b] = a
+
+        groups: dict[int, set[int]] = defaultdict(set)
+        for zid in {*children, *(c for cs in children.values() for c in cs)}:
+            groups[_root(zid)].add(zid)
+        return list(groups.values())
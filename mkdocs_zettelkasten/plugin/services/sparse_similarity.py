@@ -0,0 +1,73 @@
+"""Vectorized Jaccard scoring on a sparse zettel x feature incidence matrix.
+
+Requires the optional NumPy and SciPy dependencies
+(``pip install mkdocs-zettelkasten[sparse]``).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from scipy import sparse
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterator
+
+
+def _incidence_matrix(sets: list[frozenset]) -> sparse.csr_matrix:
+    """Build a CSR matrix with one row per set and one column per element."""
+    columns: dict[Hashable, int] = {}
+    indptr = [0]
+    indices: list[int] = []
+    for s in sets:
+        indices.extend(columns.setdefault(key, len(columns)) for key in s)
+        indptr.append(len(indices))
+    return sparse.csr_matrix(
+        (
+            np.ones(len(indices), dtype=np.int32),
+            np.asarray(indices, dtype=np.int64),
+            np.asarray(indptr, dtype=np.int64),
+        ),
+        shape=(len(sets), len(columns)),
+    )
+
+
+def jaccard_pairs(
+    sets: list[frozenset], threshold: float, stop_ratio: float = 1.0
+) -> Iterator[tuple[int, int, int, float]]:
+    """Yield (i, j, shared count, jaccard) for i < j at or above *threshold*.
+
+    Intersection counts come from the sparse product A·Aᵀ. Columns held by
+    more than *stop_ratio* of the rows do not produce candidate pairs but
+    still count towards the intersections of pairs found through other
+    columns. Pairs are yielded ordered by (i, j).
+    """
+    incidence = _incidence_matrix(sets)
+    if incidence.nnz == 0:
+        return
+    sizes = np.diff(incidence.indptr)
+    # Every column holds at least one entry, so this has one count per column.
+    df = np.bincount(incidence.indices)
+    stopped = df > stop_ratio * len(sets)
+
+    kept = incidence[:, np.flatnonzero(~stopped)]
+    product = sparse.triu(kept @ kept.T, k=1).tocoo()
+    rows = product.row.astype(np.int64)
+    cols = product.col.astype(np.int64)
+    counts = product.data.astype(np.int64)
+    if stopped.any():
+        dense = incidence[:, np.flatnonzero(stopped)].toarray().astype(bool)
+        counts += (dense[rows] & dense[cols]).sum(axis=1)
+
+    jaccard = counts / (sizes[rows] + sizes[cols] - counts)
+    keep = jaccard >= threshold
+    rows, cols, counts, jaccard = rows[keep], cols[keep], counts[keep], jaccard[keep]
+    order = np.lexsort((cols, rows))
+    yield from zip(
+        rows[order].tolist(),
+        cols[order].tolist(),
+        counts[order].tolist(),
+        jaccard[order].tolist(),
+        strict=True,
+    )
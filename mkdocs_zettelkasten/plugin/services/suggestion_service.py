@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import heapq
+import logging
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterator
+
+    from mkdocs_zettelkasten.plugin.services.content_index import ContentIndex
     from mkdocs_zettelkasten.plugin.services.zettel_store import ZettelStore
 
+logger = logging.getLogger(
+    __name__.replace("mkdocs_zettelkasten.plugin.", "mkdocs.plugins.zettelkasten.")
+)
+
+PYTHON_BACKEND = "python"
+SPARSE_BACKEND = "sparse"
+
 
 class SuggestionService:
     """Computes link suggestions based on shared links and shared tags."""
@@ -17,10 +30,22 @@ class SuggestionService:
         *,
         confidence_threshold: float = 0.3,
         max_suggestions: int = 5,
+        stop_ratio: float = 1.0,
+        backend: str = PYTHON_BACKEND,
+        content_index: ContentIndex | None = None,
     ) -> dict[int, list[dict]]:
-        """Return {zettel_id: [{target_id, reason, confidence}, ...]}."""
+        """Return {zettel_id: [{target_id, reason, confidence}, ...]}.
+
+        Link targets or tags shared by more than *stop_ratio* of the zettels
+        that have any are too common to be a useful signal and are not used
+        to find candidate pairs. The ``sparse`` *backend* scores pairs with
+        NumPy/SciPy matrix products and gives the same results. With a
+        *content_index*, zettels with similar body text are suggested too.
+        """
         self._confidence_threshold = confidence_threshold
         self._max_suggestions = max_suggestions
+        self._stop_ratio = stop_ratio
+        self._score_pairs = self._select_backend(backend)
         link_sets = {
             zid: {tid for tid in targets if tid != zid}
             for zid, targets in resolved_links.items()
@@ -30,8 +55,27 @@ class SuggestionService:
 
         link_suggs = self._shared_link_suggestions(store, link_sets, linked_pairs)
         tag_suggs = self._shared_tag_suggestions(store, tag_sets, linked_pairs)
+        if content_index is None:
+            return self._merge(link_suggs, tag_suggs)
 
-        return self._merge(link_suggs, tag_suggs)
+        content_suggs = self._content_suggestions(store, content_index, linked_pairs)
+        return self._merge(link_suggs, tag_suggs, content_suggs)
+
+    def _select_backend(self, backend: str):
+        """Return the pair scorer for *backend*, falling back to pure Python."""
+        if backend == SPARSE_BACKEND:
+            try:
+                from mkdocs_zettelkasten.plugin.services import sparse_similarity
+            except ImportError:
+                logger.warning(
+                    "Sparse suggestion backend needs numpy and scipy, "
+                    "falling back to the Python backend"
+                )
+            else:
+                return lambda sets: sparse_similarity.jaccard_pairs(
+                    sets, self._confidence_threshold, self._stop_ratio
+                )
+        return self._python_pairs
 
     def _build_tag_sets(self, store, tags_metadata):
         """Map each zettel ID to its set of tags."""
@@ -62,6 +106,81 @@ class SuggestionService:
         sets = {zid: frozenset(s) for zid, s in tag_sets.items() if s}
         return self._jaccard_suggestions(store, sets, linked_pairs, "shared tag")
 
+    def _content_suggestions(self, store, content_index, linked_pairs):
+        """TF-IDF cosine similarity of zettel bodies."""
+        linked: dict[int, set[int]] = defaultdict(set)
+        for a_id, b_id in linked_pairs:
+            linked[a_id].add(b_id)
+            linked[b_id].add(a_id)
+        suggestions: dict[int, list[dict]] = {}
+        for z in store.zettels:
+            neighbours = content_index.neighbours(
+                z.id,
+                self._max_suggestions,
+                self._confidence_threshold,
+                exclude=linked.get(z.id, ()),
+            )
+            entries = [
+                {
+                    "target_id": other_id,
+                    "reason": "similar content",
+                    "confidence": round(score, 2),
+                }
+                for other_id, score in neighbours
+            ]
+            if entries:
+                suggestions[z.id] = entries
+        return suggestions
+
+    def _build_postings(self, sets: list[frozenset]) -> dict[Hashable, list[int]]:
+        """Map each set element to the positions in *sets* containing it.
+
+        Postings longer than the stop threshold are dropped.
+        """
+        postings: dict[Hashable, list[int]] = defaultdict(list)
+        for pos, z_set in enumerate(sets):
+            for key in z_set:
+                postings[key].append(pos)
+        limit = self._stop_ratio * len(sets)
+        stopped = [key for key, plist in postings.items() if len(plist) > limit]
+        for key in stopped:
+            del postings[key]
+        if stopped:
+            logger.debug(
+                "Ignoring %d postings shared by more than %d zettels",
+                len(stopped),
+                int(limit),
+            )
+        return postings
+
+    def _python_pairs(
+        self, sets: list[frozenset]
+    ) -> Iterator[tuple[int, int, int, float]]:
+        """Yield (i, j, shared count, jaccard) for i < j at or above the threshold.
+
+        Only pairs sharing at least one posting of an inverted index are
+        scored. Pairs are yielded ordered by (i, j).
+        """
+        postings = self._build_postings(sets)
+        threshold = self._confidence_threshold
+        for i, z_set in enumerate(sets):
+            candidates: set[int] = set()
+            for key in z_set:
+                plist = postings.get(key)
+                if plist is not None:
+                    candidates.update(plist)
+            z_len = len(z_set)
+            for j in sorted(c for c in candidates if c > i):
+                other_set = sets[j]
+                other_len = len(other_set)
+                # Jaccard is bounded by the ratio of the set sizes.
+                if min(z_len, other_len) / max(z_len, other_len) < threshold:
+                    continue
+                n = len(z_set & other_set)
+                jaccard = n / (z_len + other_len - n)
+                if jaccard >= threshold:
+                    yield i, j, n, jaccard
+
     def _jaccard_suggestions(
         self,
         store,
@@ -69,61 +188,42 @@ class SuggestionService:
         linked_pairs: set,
         reason_label: str,
     ) -> dict[int, list[dict]]:
-        """Compute Jaccard similarity over arbitrary sets and return suggestions."""
-        suggestions: dict[int, list[dict]] = {}
-        zettels = store.zettels
-        for i, z in enumerate(zettels):
-            z_set = sets.get(z.id)
-            if not z_set:
+        """Compute Jaccard similarity over arbitrary sets and return suggestions.
+
+        Each list is ordered by target position in the store.
+        """
+        member_ids = [z.id for z in store.zettels if sets.get(z.id)]
+        suggestions: dict[int, list[dict]] = {zid: [] for zid in member_ids}
+        for i, j, n, jaccard in self._score_pairs([sets[zid] for zid in member_ids]):
+            z_id = member_ids[i]
+            other_id = member_ids[j]
+            if self._already_linked(z_id, other_id, linked_pairs):
                 continue
-            candidates = []
-            for j, other in enumerate(zettels):
-                if i >= j:
-                    continue
-                other_set = sets.get(other.id)
-                if not other_set:
-                    continue
-                if self._already_linked(z.id, other.id, linked_pairs):
-                    continue
-                intersection = z_set & other_set
-                if not intersection:
-                    continue
-                union = z_set | other_set
-                jaccard = len(intersection) / len(union)
-                if jaccard < self._confidence_threshold:
-                    continue
-                n = len(intersection)
-                reason = f"{n} {reason_label}{'s' if n != 1 else ''}"
-                entry = {
-                    "target_id": other.id,
-                    "reason": reason,
-                    "confidence": round(jaccard, 2),
-                }
-                candidates.append(entry)
-                suggestions.setdefault(other.id, []).append(
-                    {
-                        "target_id": z.id,
-                        "reason": reason,
-                        "confidence": round(jaccard, 2),
-                    }
-                )
-            suggestions.setdefault(z.id, []).extend(candidates)
+            reason = f"{n} {reason_label}{'s' if n != 1 else ''}"
+            confidence = round(jaccard, 2)
+            suggestions[z_id].append(
+                {"target_id": other_id, "reason": reason, "confidence": confidence}
+            )
+            suggestions[other_id].append(
+                {"target_id": z_id, "reason": reason, "confidence": confidence}
+            )
         return suggestions
 
-    def _merge(self, link_suggs, tag_suggs):
-        """Merge both strategy results, dedup by target, keep highest confidence, sort, limit."""
+    def _merge(self, *strategy_suggs):
+        """Merge strategy results, dedup by target, keep highest confidence, limit.
+
+        The top suggestions are selected with a bounded heap; ties keep
+        earlier strategies first, then store order.
+        """
         merged: dict[int, list[dict]] = {}
-        for zid in link_suggs.keys() | tag_suggs.keys():
-            all_suggs = link_suggs.get(zid, []) + tag_suggs.get(zid, [])
+        for zid in set().union(*strategy_suggs):
             # Dedup: keep highest confidence per target
             best: dict[int, dict] = {}
-            for s in all_suggs:
+            for s in (sugg for suggs in strategy_suggs for sugg in suggs.get(zid, ())):
                 tid = s["target_id"]
                 if tid not in best or s["confidence"] > best[tid]["confidence"]:
                     best[tid] = s
-            # Sort by confidence desc, limit
-            sorted_suggs = sorted(
-                best.values(), key=lambda x: x["confidence"], reverse=True
+            merged[zid] = heapq.nsmallest(
+                self._max_suggestions, best.values(), key=lambda x: -x["confidence"]
             )
-            merged[zid] = sorted_suggs[: self._max_suggestions]
         return merged
@@ -4,20 +4,56 @@ import html
 import logging
 import re
 from collections import defaultdict
+from typing import TYPE_CHECKING
 
+from mkdocs_zettelkasten.plugin.utils.aho_corasick import AhoCorasick
 from mkdocs_zettelkasten.plugin.utils.patterns import MD_LINK, WIKI_LINK
 from mkdocs_zettelkasten.plugin.utils.snippet_utils import truncate_around
 
+if TYPE_CHECKING:
+    from mkdocs_zettelkasten.plugin.entities.body_view import BodyView
+
 logger = logging.getLogger(
     __name__.replace("mkdocs_zettelkasten.plugin.", "mkdocs.plugins.zettelkasten.")
 )
 
-_FENCED_CODE = re.compile(r"```.*?```", re.DOTALL)
 _INLINE_CODE = re.compile(r"`[^`]+`")
 
 
+class _CaseFoldTable(dict):
+    """``str.translate`` table mapping characters re.IGNORECASE may treat as equal.
+
+    Characters fold to the uppercase of their lowercase form, so every pair
+    the regex engine matches case-insensitively folds to the same key. The
+    folding is deliberately coarser than re; hits are confirmed with the
+    exact pattern.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._multi: dict[str, str] = {}
+
+    def __missing__(self, code: int) -> str:
+        upper = chr(code).lower()[0].upper()
+        if len(upper) != 1:
+            # Multi-character uppercase: give each distinct one a private key.
+            upper = self._multi.setdefault(upper, chr(0xF0000 + len(self._multi)))
+        self[code] = upper
+        return upper
+
+
+_FOLD = _CaseFoldTable()
+
+_TITLE = 0
+_ID = 1
+
+
 class UnlinkedMentionService:
-    """Detects unlinked mentions of zettel titles/IDs across the store."""
+    """Detects unlinked mentions of zettel titles/IDs across the store.
+
+    Each source body is cleaned and split into paragraphs once, then scanned
+    with a single Aho-Corasick automaton holding every title and ID.
+    """
 
     def find_unlinked_mentions(
         self,
@@ -27,9 +63,35 @@ class UnlinkedMentionService:
         min_title_len: int = 3,
     ) -> dict[int, list[tuple[int, str]]]:
         """Return {target_id: [(source_id, snippet), ...]} for unlinked mentions."""
-        unlinked_mentions: dict[int, list[tuple[int, str]]] = defaultdict(list)
+        targets = store.zettels
+        terms, automaton = self._build_automaton(targets, min_title_len)
+
+        ids = {t.id for t in targets}
+        hits: dict[int, list[tuple[int, str]]] = defaultdict(list)
+        for source in targets:
+            linked = resolved_links.get(source.id, set())
+            if ids <= linked | {source.id}:
+                continue  # links to every other zettel already
+            excluded = linked | {source.id}
+            for target_index, snippet in self._scan_source(
+                source.body_view, targets, terms, automaton, excluded
+            ):
+                hits[targets[target_index].id].append((source.id, snippet))
+
+        unlinked_mentions = {t.id: hits[t.id] for t in targets if t.id in hits}
+        logger.debug("Found unlinked mentions for %d targets", len(unlinked_mentions))
+        return unlinked_mentions
 
-        for target in store.zettels:
+    @staticmethod
+    def _build_automaton(targets, min_title_len: int):
+        """Return per-target (term, exact pattern) pairs and the shared automaton.
+
+        terms[i] holds the title entry (pattern None when too short) and the
+        ID entry of targets[i]; automaton payloads are (i, _TITLE | _ID).
+        """
+        terms: list[tuple[tuple[str, re.Pattern | None], tuple[str, re.Pattern]]] = []
+        patterns: list[tuple[str, tuple[int, int]]] = []
+        for index, target in enumerate(targets):
             title = target.title
             id_str = str(target.id)
             title_pat = (
@@ -38,48 +100,53 @@ class UnlinkedMentionService:
                 else None
             )
             id_pat = re.compile(r"\b" + re.escape(id_str) + r"\b")
-
-            for source in store.zettels:
-                if source.id == target.id:
-                    continue
-                if target.id in resolved_links.get(source.id, set()):
+            terms.append(((title, title_pat), (id_str, id_pat)))
+            if title_pat is not None:
+                if not title:
+                    # An empty title "matches" as an empty term, which has
+                    # always been discarded along with the ID fallback.
                     continue
-                result = self._find_mention_in_body(
-                    source.body, title_pat, title, id_pat, id_str
-                )
-                if result:
-                    unlinked_mentions[target.id].append((source.id, result))
+                patterns.append((title.translate(_FOLD), (index, _TITLE)))
+            patterns.append((id_str.translate(_FOLD), (index, _ID)))
+        return terms, AhoCorasick(patterns)
 
-        logger.debug("Found unlinked mentions for %d targets", len(unlinked_mentions))
-        return dict(unlinked_mentions)
-
-    def _find_mention_in_body(self, body, title_pat, title, id_pat, id_str):
-        """Search body paragraphs for a mention, return snippet or None."""
-        body_clean = _FENCED_CODE.sub(
-            lambda m: "".join("\n" if c == "\n" else "\x00" for c in m.group()), body
-        )
-        orig_paragraphs = self._split_paragraphs(body)
-        cleaned_paragraphs = self._split_paragraphs(body_clean)
-
-        for orig_para, clean_para in zip(
-            orig_paragraphs, cleaned_paragraphs, strict=True
-        ):
-            stripped = self._strip_syntax(clean_para)
-            matched_term = self._match_paragraph(
-                stripped, title_pat, title, id_pat, id_str
-            )
-            if matched_term:
-                return self._make_snippet(orig_para, matched_term)
-        return None
+    def _scan_source(self, body_view, targets, terms, automaton, excluded):
+        """Yield (target index, snippet) for each target mentioned in the body.
 
-    @staticmethod
-    def _match_paragraph(stripped, title_pat, title, id_pat, id_str):
-        """Return matched term if paragraph contains a mention, else None."""
-        if title_pat and title_pat.search(stripped):
-            return title
-        if id_pat.search(stripped):
-            return id_str
-        return None
+        A target is reported for the first paragraph mentioning it, by
+        title if that paragraph contains the title, else by ID.
+        """
+        found: set[int] = set()
+        for orig_para, stripped in self._prepare_paragraphs(body_view):
+            matched: dict[int, int] = {}
+            for start, (index, kind) in automaton.iter_matches(
+                stripped.translate(_FOLD)
+            ):
+                if (
+                    index in found
+                    or targets[index].id in excluded
+                    or matched.get(index) == _TITLE
+                ):
+                    continue
+                # Folding over-approximates; confirm with the exact pattern.
+                if terms[index][kind][1].match(stripped, start):
+                    matched[index] = kind
+            for index, kind in matched.items():
+                found.add(index)
+                yield index, self._make_snippet(orig_para, terms[index][kind][0])
+
+    def _prepare_paragraphs(self, body_view: BodyView) -> list[tuple[str, str]]:
+        """Return (original, searchable) pairs for each paragraph of the body.
+
+        The searchable text has fenced code, links and inline code blanked
+        out while keeping the original offsets.
+        """
+        return [
+            (orig_para, self._strip_syntax(clean_para))
+            for orig_para, clean_para in zip(
+                body_view.paragraphs, body_view.fence_masked_paragraphs, strict=True
+            )
+        ]
 
     @staticmethod
     def _strip_syntax(text: str) -> str:
@@ -89,26 +156,6 @@ class UnlinkedMentionService:
             result = pat.sub(lambda m: " " * len(m.group()), result)
         return result
 
-    @staticmethod
-    def _split_paragraphs(body: str) -> list[str]:
-        """Split body into paragraphs, joined by newlines.
-
-        Newline-joining preserves line structure for regex pattern matching.
-        See also: Zettel._split_paragraphs (space-joined, for snippet matching).
-        """
-        paragraphs = []
-        current: list[str] = []
-        for line in body.splitlines():
-            if line.strip() == "":
-                if current:
-                    paragraphs.append("\n".join(current))
-                    current = []
-            else:
-                current.append(line)
-        if current:
-            paragraphs.append("\n".join(current))
-        return paragraphs
-
     @staticmethod
     def _make_snippet(paragraph: str, term: str) -> str:
         """Create a display snippet with <mark> around the matched term."""
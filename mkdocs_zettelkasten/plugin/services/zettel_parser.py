@@ -1,48 +1,169 @@
+from __future__ import annotations
+
+import dataclasses
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
-
-# module-level: used in function signatures
-from mkdocs.structure.files import File, Files
+from typing import TYPE_CHECKING
 
 from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
 from mkdocs_zettelkasten.plugin.entities.zettel import Zettel, ZettelFormatError
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from mkdocs.structure.files import File
+
+    from mkdocs_zettelkasten.plugin.entities.zettel import ZettelMeta
+    from mkdocs_zettelkasten.plugin.utils.git_utils import GitRevisionIndex
+
+    from .parse_cache import ParseCache
+
 logger = logging.getLogger(
     __name__.replace("mkdocs_zettelkasten.plugin.", "mkdocs.plugins.zettelkasten.")
 )
 
+# Tasks handed to each worker per round-trip, relative to the worker count.
+_CHUNKS_PER_WORKER = 4
+
+
+def _parse_meta(
+    abs_src_path: Path,
+    src_path: str,
+    cfg: ZettelkastenConfig,
+    revision_index: GitRevisionIndex | None = None,
+) -> ZettelMeta | None:
+    """Parse one file into a picklable ZettelMeta, or None if it is invalid.
+
+    Module-level so it can be dispatched to worker processes.
+    """
+    try:
+        return Zettel._build_meta(  # noqa: SLF001
+            abs_src_path, src_path, cfg, revision_index
+        )
+    except ZettelFormatError:
+        return None
+
 
 class ZettelParser:
     """Converts Markdown files into validated Zettel instances."""
 
     @staticmethod
     def parse_files(
-        files: Files,
+        files: Iterable[File],
         zettel_config: ZettelkastenConfig | None = None,
+        cache: ParseCache | None = None,
+        workers: int = 0,
+        revision_index: GitRevisionIndex | None = None,
     ) -> tuple[list[Zettel], list[File]]:
         """
+        Files not served from *cache* are parsed serially, or across a
+        process pool when *workers* > 1. Results keep the order of *files*.
+        Last update dates come from *revision_index* when given, otherwise
+        from per-file git calls.
+
         Returns:
             Tuple of (valid_zettels, invalid_files)
         """
         valid_zettels = []
         invalid_files = []
+        cfg = zettel_config or ZettelkastenConfig()
 
-        for file in files:
-            if not file.is_documentation_page():
-                continue
-            if not file.abs_src_path:
-                continue
-            try:
-                zettel = Zettel(
-                    Path(file.abs_src_path),
-                    file.src_path,
-                    zettel_config=zettel_config,
+        candidates = [
+            (file, Path(file.abs_src_path))
+            for file in files
+            if file.is_documentation_page() and file.abs_src_path
+        ]
+        metas: list[ZettelMeta | None] = [None] * len(candidates)
+        pending: list[int] = []
+        for i, (file, abs_src_path) in enumerate(candidates):
+            if cache is not None:
+                metas[i] = ZettelParser._from_cache(
+                    cache, abs_src_path, file.src_path, cfg, revision_index
                 )
-            except ZettelFormatError:
+            if metas[i] is None:
+                pending.append(i)
+            else:
+                logger.debug("Reused cached zettel for %s", file.src_path)
+
+        parsed = ZettelParser._parse_pending(
+            [(candidates[i][1], candidates[i][0].src_path) for i in pending],
+            cfg,
+            workers,
+            revision_index,
+        )
+        for i, meta in zip(pending, parsed, strict=True):
+            metas[i] = meta
+            if meta is not None and cache is not None:
+                cache.put(meta)
+
+        for (file, _), meta in zip(candidates, metas, strict=True):
+            if meta is None:
                 invalid_files.append(file)
                 logger.debug("Ignoring invalid zettel: %s", file.src_path)
             else:
-                valid_zettels.append(zettel)
+                valid_zettels.append(Zettel.from_parts(meta))
                 logger.debug("Added zettel from %s", file.src_path)
 
+        if cache is not None:
+            cache.save()
+
         return valid_zettels, invalid_files
+
+    @staticmethod
+    def _parse_pending(
+        tasks: list[tuple[Path, str]],
+        cfg: ZettelkastenConfig,
+        workers: int,
+        revision_index: GitRevisionIndex | None = None,
+    ) -> list[ZettelMeta | None]:
+        """Parse (abs_src_path, src_path) tasks, preserving task order."""
+        if workers > 1 and len(tasks) > 1:
+            paths = [t[0] for t in tasks]
+            src_paths = [t[1] for t in tasks]
+            chunksize = max(1, len(tasks) // (workers * _CHUNKS_PER_WORKER))
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = list(
+                        executor.map(
+                            partial(
+                                _parse_meta, cfg=cfg, revision_index=revision_index
+                            ),
+                            paths,
+                            src_paths,
+                            chunksize=chunksize,
+                        )
+                    )
+            except (BrokenProcessPool, OSError):
+                logger.warning("Parallel parsing failed, falling back to serial")
+            else:
+                logger.info(
+                    "Parsed %d files across %d worker processes", len(tasks), workers
+                )
+                return results
+        return [
+            _parse_meta(path, src_path, cfg, revision_index) for path, src_path in tasks
+        ]
+
+    @staticmethod
+    def _from_cache(
+        cache: ParseCache,
+        abs_src_path: Path,
+        src_path: str,
+        cfg: ZettelkastenConfig,
+        revision_index: GitRevisionIndex | None = None,
+    ) -> ZettelMeta | None:
+        meta = cache.get(abs_src_path)
+        if meta is None or meta.rel_path != src_path:
+            return None
+        # Content unchanged, but a commit can land without touching the file,
+        # so the date is recomputed on every hit, not only when mtime moved.
+        last_update_date = Zettel._determine_last_update_date(  # noqa: SLF001
+            meta.meta, meta.id, abs_src_path, src_path, cfg, revision_index
+        )
+        if last_update_date != meta.last_update_date:
+            meta = dataclasses.replace(meta, last_update_date=last_update_date)
+            cache.refresh(meta)
+        return meta
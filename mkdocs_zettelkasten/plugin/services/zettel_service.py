@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from mkdocs.config.defaults import MkDocsConfig
-    from mkdocs.structure.files import Files
+    from mkdocs.structure.files import File, Files
     from mkdocs.structure.pages import Page
 
     from mkdocs_zettelkasten.plugin.entities.zettel import Zettel
@@ -13,8 +13,10 @@ if TYPE_CHECKING:
 import logging
 
 from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
+from mkdocs_zettelkasten.plugin.utils.git_utils import GitRevisionIndex
 
 from .link_resolver import LinkMap, LinkResolver
+from .parse_cache import ParseCache
 from .zettel_parser import ZettelParser
 from .zettel_store import ZettelStore
 
@@ -23,8 +25,22 @@ logger = logging.getLogger(
 )
 
 
+def _signature(path: str) -> tuple[int, int] | None:
+    try:
+        st = Path(path).stat()
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
 class ZettelService:
-    """Orchestrates core zettel processing pipeline: parse, store, resolve links."""
+    """Orchestrates core zettel processing pipeline: parse, store, resolve links.
+
+    With ``incremental`` set (``mkdocs serve``), state from the previous
+    run is kept and later runs only reparse files whose size or mtime
+    changed. ``changed_ids`` then holds the IDs whose zettel or resolved
+    links differ from the previous run; it is None after a full rebuild.
+    """
 
     def __init__(self) -> None:
         self.store = ZettelStore()
@@ -32,21 +48,142 @@ class ZettelService:
         self.zettel_config = ZettelkastenConfig()
         self.file_suffix: str = ".md"
         self.link_map: LinkMap | None = None
-
-    def configure(self, zettel_config: ZettelkastenConfig) -> None:
+        self.parse_cache: ParseCache | None = None
+        self.cache_dir: Path | None = None
+        self.incremental = False
+        self.changed_ids: set[int] | None = None
+        self._signatures: dict[str, tuple[int, int] | None] = {}
+        self._invalid_paths: set[str] = set()
+        self._revision_index: GitRevisionIndex | None = None
+
+    def configure(
+        self,
+        zettel_config: ZettelkastenConfig,
+        cache_dir: Path | None = None,
+    ) -> None:
+        if zettel_config != self.zettel_config:
+            # Parsing rules may differ; the next run must start from scratch.
+            self.link_map = None
         self.zettel_config = zettel_config
         self.file_suffix = zettel_config.file_suffix
+        self.cache_dir = cache_dir
+        self.parse_cache = (
+            ParseCache(cache_dir, zettel_config) if cache_dir is not None else None
+        )
 
     def process_files(self, files: Files, config: MkDocsConfig) -> None:
         """Core pipeline: parse → store → resolve links."""
+        if self.incremental and self.link_map is not None:
+            self._process_changed_files(files)
+            return
+
         docs_dir = config["docs_dir"]
         logger.info("Scanning `%s` for zettels", docs_dir)
+        if self.parse_cache is not None:
+            self.parse_cache.load()
+        revision_index = GitRevisionIndex.build(docs_dir, cache_dir=self.cache_dir)
         valid_zettels, self.invalid_files = ZettelParser.parse_files(
-            files, self.zettel_config
+            files,
+            self.zettel_config,
+            cache=self.parse_cache,
+            workers=self.zettel_config.parse_workers,
+            revision_index=revision_index,
         )
         logger.info("Found %s zettels in `%s`", len(valid_zettels), docs_dir)
         self.store.update(valid_zettels)
         self.link_map = LinkResolver.resolve(self.store, file_suffix=self.file_suffix)
+        self.changed_ids = None
+
+        if self.incremental:
+            self._revision_index = revision_index
+            self._signatures = {
+                path: _signature(path) for path in self._documentation_files(files)
+            }
+            self._invalid_paths = {str(f.abs_src_path) for f in self.invalid_files}
+
+    def _process_changed_files(self, files: Files) -> None:
+        """Reparse only added/modified files and patch store and link map."""
+        candidates = self._documentation_files(files)
+        signatures = {path: _signature(path) for path in candidates}
+        changed = [
+            f
+            for path, f in candidates.items()
+            if path not in self._signatures
+            or signatures[path] != self._signatures[path]
+        ]
+        removed = self._signatures.keys() - signatures.keys()
+        self._signatures = signatures
+
+        if not changed and not removed:
+            self.invalid_files = [
+                f for path, f in candidates.items() if path in self._invalid_paths
+            ]
+            self.changed_ids = set()
+            logger.info("No zettel changes detected")
+            return
+
+        valid, invalid = ZettelParser.parse_files(
+            changed,
+            self.zettel_config,
+            revision_index=self._revision_index,
+        )
+        stale = {Path(p) for p in removed} | {
+            Path(str(f.abs_src_path)) for f in changed
+        }
+        replaced = [z for p in stale if (z := self.store.get_by_path(p)) is not None]
+        changes: dict[Path, Zettel | None] = dict.fromkeys(stale)
+        changes.update((z.path, z) for z in valid)
+        self.store.bulk_apply(changes)
+
+        self._invalid_paths = (
+            self._invalid_paths - removed - {str(f.abs_src_path) for f in changed}
+        ) | {str(f.abs_src_path) for f in invalid}
+        self.invalid_files = [
+            f for path, f in candidates.items() if path in self._invalid_paths
+        ]
+
+        old_map = self.link_map
+        if old_map is None:
+            msg = "link_map not initialized; full process_files must run first"
+            raise RuntimeError(msg)
+        changed_ids = {z.id for z in replaced} | {z.id for z in valid}
+        same_layout = {(z.path, z.id) for z in replaced} == {
+            (z.path, z.id) for z in valid
+        }
+        if same_layout:
+            # Link targets resolve by path, so only the reparsed sources move.
+            self.link_map = LinkResolver.resolve_incremental(
+                old_map,
+                self.store,
+                valid,
+                file_suffix=self.file_suffix,
+                replaced=replaced,
+            )
+        else:
+            self.link_map = LinkResolver.resolve(
+                self.store, file_suffix=self.file_suffix
+            )
+            new_resolved = self.link_map.resolved
+            changed_ids |= {
+                zid
+                for zid in old_map.resolved.keys() | new_resolved.keys()
+                if old_map.resolved.get(zid) != new_resolved.get(zid)
+            }
+        self.changed_ids = changed_ids
+        logger.info(
+            "Incremental update: %d changed, %d removed files (%d zettels affected)",
+            len(changed),
+            len(removed),
+            len(changed_ids),
+        )
+
+    @staticmethod
+    def _documentation_files(files: Files) -> dict[str, File]:
+        return {
+            str(f.abs_src_path): f
+            for f in files
+            if f.is_documentation_page() and f.abs_src_path
+        }
 
     def add_zettel_to_page(self, page: Page) -> Page:
         enriched_page = page
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from pathlib import PurePosixPath
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Mapping
     from pathlib import Path
 
     from mkdocs_zettelkasten.plugin.entities.zettel import Zettel
@@ -15,6 +16,18 @@ logger = logging.getLogger(
     __name__.replace("mkdocs_zettelkasten.plugin.", "mkdocs.plugins.zettelkasten.")
 )
 
+# Above this share of the store, bulk_apply() rebuilds from scratch instead.
+_BULK_REBUILD_RATIO = 0.25
+
+
+def _zettel_id(zettel: Zettel) -> int:
+    return zettel.id
+
+
+def _suffix_keys(zettel: Zettel) -> list[tuple[str, ...]]:
+    parts = zettel.path.with_suffix("").parts
+    return [parts[i:] for i in range(len(parts))]
+
 
 class ZettelStore:
     """Storage for zettels with efficient lookup capabilities."""
@@ -24,6 +37,9 @@ class ZettelStore:
         self._path_index: dict[Path, Zettel] = {}
         self._id_index: dict[int, Zettel] = {}
         self._suffix_index: dict[tuple[str, ...], Zettel] = {}
+        # Zettels sharing a suffix key with the indexed (lowest-ID) owner,
+        # sorted by ID, so removing the owner can promote the next one.
+        self._suffix_shadowed: dict[tuple[str, ...], list[Zettel]] = {}
         self.update(zettels)
 
     @property
@@ -36,19 +52,45 @@ class ZettelStore:
         path_index: dict[Path, Zettel] = {}
         id_index: dict[int, Zettel] = {}
         suffix_index: dict[tuple[str, ...], Zettel] = {}
+        suffix_shadowed: dict[tuple[str, ...], list[Zettel]] = {}
 
         for z in self._zettels:
             path_index[z.path] = z
             id_index[z.id] = z
-            parts = z.path.with_suffix("").parts
-            for i in range(len(parts)):
-                key = parts[i:]
+            for key in _suffix_keys(z):
                 if key not in suffix_index:
                     suffix_index[key] = z
+                else:
+                    suffix_shadowed.setdefault(key, []).append(z)
 
         self._path_index = path_index
         self._id_index = id_index
         self._suffix_index = suffix_index
+        self._suffix_shadowed = suffix_shadowed
+
+    def _index_suffixes(self, zettel: Zettel) -> None:
+        for key in _suffix_keys(zettel):
+            owner = self._suffix_index.get(key)
+            if owner is None:
+                self._suffix_index[key] = zettel
+                continue
+            loser = owner if zettel.id < owner.id else zettel
+            if loser is owner:
+                self._suffix_index[key] = zettel
+            insort(self._suffix_shadowed.setdefault(key, []), loser, key=_zettel_id)
+
+    def _unindex_suffixes(self, zettel: Zettel) -> None:
+        for key in _suffix_keys(zettel):
+            shadowed = self._suffix_shadowed.get(key)
+            if self._suffix_index.get(key) is zettel:
+                if shadowed:
+                    self._suffix_index[key] = shadowed.pop(0)
+                else:
+                    del self._suffix_index[key]
+            elif shadowed:
+                self._suffix_shadowed[key] = [z for z in shadowed if z is not zettel]
+            if key in self._suffix_shadowed and not self._suffix_shadowed[key]:
+                del self._suffix_shadowed[key]
 
     def get_by_path(self, path: Path) -> Zettel | None:
         """Retrieve zettel by filesystem path."""
@@ -64,9 +106,71 @@ class ZettelStore:
         partial_parts = PurePosixPath(partial_path.removesuffix(file_suffix)).parts
         return self._suffix_index.get(partial_parts)
 
+    def get_by_suffix(self, parts: tuple[str, ...]) -> Zettel | None:
+        """Retrieve zettel whose suffix-less path ends with *parts*."""
+        return self._suffix_index.get(parts)
+
     def update(self, zettels: Iterable[Zettel]) -> None:
         """Replace stored zettels with new collection."""
         sorted_zettels = sorted(zettels, key=lambda z: z.id)
         self._zettels = list(dict.fromkeys(sorted_zettels))
         self._rebuild_indexes()
         logger.info("Zettel store updated with %d zettels.", len(self._zettels))
+
+    def upsert(self, zettel: Zettel) -> None:
+        """Insert *zettel*, replacing any stored zettel with its path or ID."""
+        by_path = self._path_index.get(zettel.path)
+        by_id = self._id_index.get(zettel.id)
+        if by_path is not None:
+            self._discard(by_path)
+        if by_id is not None and by_id is not by_path:
+            self._discard(by_id)
+        insort(self._zettels, zettel, key=_zettel_id)
+        self._path_index[zettel.path] = zettel
+        self._id_index[zettel.id] = zettel
+        self._index_suffixes(zettel)
+
+    def remove(self, path: Path) -> Zettel | None:
+        """Remove and return the zettel stored for *path*, if any."""
+        zettel = self._path_index.get(path)
+        if zettel is not None:
+            self._discard(zettel)
+        return zettel
+
+    def bulk_apply(self, changes: Mapping[Path, Zettel | None]) -> None:
+        """Apply per-path changes: a zettel upserts, None removes.
+
+        Falls back to a single rebuild when the batch is a large share of
+        the store, where per-item list insertion would cost more.
+        """
+        if len(changes) > len(self._zettels) * _BULK_REBUILD_RATIO:
+            upserts = {z.id: z for z in changes.values() if z is not None}
+            kept = [
+                z
+                for z in self._zettels
+                if z.path not in changes and z.id not in upserts
+            ]
+            self.update([*kept, *upserts.values()])
+            return
+        for path, zettel in changes.items():
+            if zettel is None:
+                self.remove(path)
+        for zettel in changes.values():
+            if zettel is not None:
+                self.upsert(zettel)
+        logger.debug(
+            "Applied %d changes to zettel store (%d zettels).",
+            len(changes),
+            len(self._zettels),
+        )
+
+    def _discard(self, zettel: Zettel) -> None:
+        i = bisect_left(self._zettels, zettel.id, key=_zettel_id)
+        while self._zettels[i] is not zettel:
+            i += 1
+        del self._zettels[i]
+        if self._path_index.get(zettel.path) is zettel:
+            del self._path_index[zettel.path]
+        if self._id_index.get(zettel.id) is zettel:
+            del self._id_index[zettel.id]
+        self._unindex_suffixes(zettel)
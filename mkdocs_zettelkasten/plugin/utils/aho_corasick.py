@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+_P = TypeVar("_P")
+
+
+class AhoCorasick(Generic[_P]):
+    """Multi-pattern matcher finding every occurrence of every pattern in one pass.
+
+    Patterns are matched literally. Each pattern carries a payload; equal
+    patterns may be added with different payloads and are all reported.
+    """
+
+    def __init__(self, patterns: Iterable[tuple[str, _P]]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # (pattern length, payload) pairs ending at each state.
+        self._out: list[list[tuple[int, _P]]] = [[]]
+        # Nearest state on the failure chain that has output, or -1.
+        self._out_link: list[int] = [-1]
+        for pattern, payload in patterns:
+            if pattern:
+                self._add(pattern, payload)
+        self._build()
+
+    def __bool__(self) -> bool:
+        return len(self._goto) > 1
+
+    def _add(self, pattern: str, payload: _P) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._out_link.append(-1)
+            state = nxt
+        self._out[state].append((len(pattern), payload))
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = fail
+                self._out_link[nxt] = fail if self._out[fail] else self._out_link[fail]
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, _P]]:
+        """Yield (start index, payload) for every pattern occurrence in *text*."""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        out_link = self._out_link
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            hit = state if out[state] else out_link[state]
+            while hit > 0:
+                for length, payload in out[hit]:
+                    yield i - length + 1, payload
+                hit = out_link[hit]
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import datetime
+import json
 import logging
+import os
 from pathlib import Path
 
-from git import Git, GitCommandError, InvalidGitRepositoryError, Repo
+from git import Git, GitCommandError, InvalidGitRepositoryError, NoSuchPathError, Repo
 
 logger = logging.getLogger(
     __name__.replace("mkdocs_zettelkasten.plugin.", "mkdocs.plugins.zettelkasten.")
@@ -27,3 +29,177 @@ class GitUtil:
             return bool(repo.git.ls_files(path))
         except (InvalidGitRepositoryError, GitCommandError):
             return False
+
+
+_LOG_DATE_MARKER = "\x1e"
+
+INDEX_FILENAME = ".git_revision_index.json"
+
+# Bump whenever the persisted index layout changes.
+_INDEX_VERSION = 1
+
+
+class GitRevisionIndex:
+    """Last commit date per tracked file, collected in two git calls.
+
+    Replaces the per-file ``is_tracked`` + ``git log -n1`` subprocess pair
+    with one ``git ls-files`` and one ``git log --name-only`` walk over a
+    directory. Keys are real (symlink-resolved) absolute paths.
+
+    When given a cache directory, the dates are persisted together with the
+    HEAD commit they were computed at. Later builds only walk the commits
+    added since then, or nothing at all when HEAD has not moved.
+    """
+
+    def __init__(
+        self,
+        dates: dict[str, datetime.datetime] | None = None,
+        tracked: set[str] | None = None,
+        head: str | None = None,
+    ) -> None:
+        self.dates = dates or {}
+        self.tracked = tracked or set()
+        self.head = head
+
+    @classmethod
+    def build(
+        cls,
+        directory: str,
+        cache_dir: Path | None = None,
+    ) -> GitRevisionIndex | None:
+        """Index *directory*, or return None when it is not inside a git repo."""
+        directory = os.path.realpath(directory)
+        try:
+            repo = Repo(directory, search_parent_directories=True)
+            root = repo.working_tree_dir
+            if root is None:
+                return None
+            git = repo.git
+            # The index is cheap to list and reflects staged/removed files.
+            ls_output = git.ls_files("-z", "--full-name", "--", directory)
+            head = cls._resolve_head(git)
+            cache_path = cache_dir / INDEX_FILENAME if cache_dir else None
+            previous = (
+                cls._load(cache_path, directory)
+                if cache_path is not None and head is not None
+                else None
+            )
+            root = os.path.realpath(root)
+            dates = cls._collect_dates(git, directory, root, head, previous)
+        except (InvalidGitRepositoryError, NoSuchPathError, GitCommandError) as err:
+            logger.debug("No git revision index for %s: %s", directory, err)
+            return None
+
+        tracked = {str(Path(root, rel)) for rel in ls_output.split("\0") if rel}
+        index = cls(dates, tracked, head)
+        if cache_path is not None and head is not None:
+            index._save(cache_path, directory)
+        logger.debug(
+            "Indexed git revision dates: %d tracked, %d dated", len(tracked), len(dates)
+        )
+        return index
+
+    @classmethod
+    def _collect_dates(
+        cls,
+        git: Git,
+        directory: str,
+        root: str,
+        head: str | None,
+        previous: GitRevisionIndex | None,
+    ) -> dict[str, datetime.datetime]:
+        if previous is not None and previous.head == head:
+            logger.info("Reusing git revision index at %s", head)
+            return dict(previous.dates)
+        if previous is not None and cls._is_ancestor(git, previous.head, head):
+            changed = git.diff(
+                "-z", "--name-only", previous.head, head, "--", directory
+            )
+            dates = dict(previous.dates)
+            if changed:
+                log_output = cls._log(git, directory, f"{previous.head}..{head}")
+                dates.update(cls._parse_log(log_output, root))
+            logger.info(
+                "Updated git revision index %s..%s (%d paths changed)",
+                str(previous.head)[:12],
+                str(head)[:12],
+                len([p for p in changed.split("\0") if p]),
+            )
+            return dates
+        return cls._parse_log(cls._log(git, directory), root)
+
+    @staticmethod
+    def _log(git: Git, directory: str, revision_range: str | None = None) -> str:
+        args = ["-z", "--name-only", f"--format={_LOG_DATE_MARKER}%cI"]
+        if revision_range:
+            args.append(revision_range)
+        return git.log(*args, "--", directory)
+
+    @staticmethod
+    def _resolve_head(git: Git) -> str | None:
+        try:
+            return git.rev_parse("--verify", "HEAD")
+        except GitCommandError:
+            # Unborn branch: nothing committed yet.
+            return None
+
+    @staticmethod
+    def _is_ancestor(git: Git, old: str | None, new: str | None) -> bool:
+        if old is None or new is None:
+            return False
+        try:
+            git.merge_base("--is-ancestor", old, new)
+        except GitCommandError:
+            # Exit status 1 (history rewritten) or unknown commit.
+            return False
+        return True
+
+    @staticmethod
+    def _parse_log(output: str, root: str) -> dict[str, datetime.datetime]:
+        """Map each path to the date of the first (newest) commit listing it."""
+        dates: dict[str, datetime.datetime] = {}
+        current: datetime.datetime | None = None
+        # With -z every field is NUL-terminated; the first path of each
+        # commit is separated from its date header by a newline.
+        for field in output.split("\0"):
+            token = field.lstrip("\n")
+            if token.startswith(_LOG_DATE_MARKER):
+                current = datetime.datetime.fromisoformat(token[1:])
+            elif token and current is not None:
+                dates.setdefault(str(Path(root, token)), current)
+        return dates
+
+    @classmethod
+    def _load(cls, path: Path, directory: str) -> GitRevisionIndex | None:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data["version"] != _INDEX_VERSION or data["directory"] != directory:
+                return None
+            dates = {
+                p: datetime.datetime.fromisoformat(d) for p, d in data["dates"].items()
+            }
+            return cls(dates, head=data["head"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            logger.warning("Discarding unreadable git revision index %s", path)
+            return None
+
+    def _save(self, path: Path, directory: str) -> None:
+        data = {
+            "version": _INDEX_VERSION,
+            "directory": directory,
+            "head": self.head,
+            "dates": {p: d.isoformat() for p, d in self.dates.items()},
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(data), encoding="utf-8")
+        except OSError:
+            logger.warning("Failed to write git revision index %s", path)
+
+    def is_tracked(self, path: str) -> bool:
+        return os.path.realpath(path) in self.tracked
+
+    def get_revision_date(self, path: str) -> datetime.datetime | None:
+        return self.dates.get(os.path.realpath(path))
@@ -1,8 +1,206 @@
 (() => {
   'use strict';
 
+  /* ── force simulation ───────────────────────────────────── */
+
+  const REPULSION = 800;
+  const ATTRACTION = 0.005;
+  const CENTER_GRAVITY = 0.01;
+  const DAMPING = 0.9;
+  const BH_THETA = 0.5;
+
+  /* Physics over nodes with x, y, vx, vy and edges { source, target, type }.
+     The pinned node (the one being dragged) feels forces but does not move.
+     Runs on the page for the local graph and in a worker for the full one. */
+  const createSimulation = (nodes, edges, alpha) => {
+    const sim = { alpha, pinned: null };
+
+    /* Barnes-Hut quadtree for O(n log n) repulsion */
+    const buildQuadtree = (pts) => {
+      if (pts.length === 0) return null;
+      let minX = Infinity, minY = Infinity, maxX = -Infinity, maxY = -Infinity;
+      for (let i = 0; i < pts.length; i++) {
+        const p = pts[i];
+        if (p.x < minX) minX = p.x;
+        if (p.y < minY) minY = p.y;
+        if (p.x > maxX) maxX = p.x;
+        if (p.y > maxY) maxY = p.y;
+      }
+      const pad = 1;
+      const size = Math.max(maxX - minX, maxY - minY) + pad;
+      const cx = (minX + maxX) / 2;
+      const cy = (minY + maxY) / 2;
+      const root = { cx, cy, size, mass: 0, comX: 0, comY: 0, body: null, children: null };
+      for (let i = 0; i < pts.length; i++) insert(root, pts[i]);
+      return root;
+    };
+
+    const insert = (quad, p) => {
+      if (quad.mass === 0) {
+        quad.body = p;
+        quad.mass = 1;
+        quad.comX = p.x;
+        quad.comY = p.y;
+        return;
+      }
+      if (quad.children === null) {
+        quad.children = subdivide(quad);
+        const old = quad.body;
+        quad.body = null;
+        insert(childFor(quad, old), old);
+      }
+      quad.comX = (quad.comX * quad.mass + p.x) / (quad.mass + 1);
+      quad.comY = (quad.comY * quad.mass + p.y) / (quad.mass + 1);
+      quad.mass += 1;
+      insert(childFor(quad, p), p);
+    };
+
+    const subdivide = (q) => {
+      const hs = q.size / 2;
+      const qs = hs / 2;
+      return [
+        { cx: q.cx - qs, cy: q.cy - qs, size: hs, mass: 0, comX: 0, comY: 0, body: null, children: null },
+        { cx: q.cx + qs, cy: q.cy - qs, size: hs, mass: 0, comX: 0, comY: 0, body: null, children: null },
+        { cx: q.cx - qs, cy: q.cy + qs, size: hs, mass: 0, comX: 0, comY: 0, body: null, children: null },
+        { cx: q.cx + qs, cy: q.cy + qs, size: hs, mass: 0, comX: 0, comY: 0, body: null, children: null },
+      ];
+    };
+
+    const childFor = (quad, p) => {
+      const i = (p.x > quad.cx ? 1 : 0) + (p.y > quad.cy ? 2 : 0);
+      return quad.children[i];
+    };
+
+    const applyRepulsion = (node, quad) => {
+      if (quad === null || quad.mass === 0) return;
+      if (quad.body === node) return;
+      const dx = node.x - quad.comX;
+      const dy = node.y - quad.comY;
+      const d2 = dx * dx + dy * dy || 1;
+      if (quad.body !== null || quad.size * quad.size / d2 < BH_THETA * BH_THETA) {
+        const f = REPULSION * quad.mass / d2;
+        node.vx += dx * f;
+        node.vy += dy * f;
+        return;
+      }
+      for (let c = 0; c < 4; c++) applyRepulsion(node, quad.children[c]);
+    };
+
+    sim.tick = () => {
+      if (sim.alpha < 0.001) { sim.alpha = 0; return; }
+      sim.alpha *= 0.995;
+
+      const qt = buildQuadtree(nodes);
+      for (let i = 0; i < nodes.length; i++) {
+        const a = nodes[i];
+        /* center gravity */
+        a.vx -= a.x * CENTER_GRAVITY;
+        a.vy -= a.y * CENTER_GRAVITY;
+
+        /* repulsion (Barnes-Hut) */
+        applyRepulsion(a, qt);
+      }
+
+      /* attraction along edges */
+      for (let e = 0; e < edges.length; e++) {
+        const edge = edges[e];
+        const dx2 = edge.target.x - edge.source.x;
+        const dy2 = edge.target.y - edge.source.y;
+        const k = edge.type === 'sequence' ? ATTRACTION * 3 : ATTRACTION;
+        edge.source.vx += dx2 * k;
+        edge.source.vy += dy2 * k;
+        edge.target.vx -= dx2 * k;
+        edge.target.vy -= dy2 * k;
+      }
+
+      /* integrate */
+      for (let k = 0; k < nodes.length; k++) {
+        const n = nodes[k];
+        if (n === sim.pinned) continue;
+        n.vx *= DAMPING;
+        n.vy *= DAMPING;
+        n.x += n.vx * sim.alpha;
+        n.y += n.vy * sim.alpha;
+      }
+    };
+
+    return sim;
+  };
+
+  /* ── worker ─────────────────────────────────────────────── */
+
+  /* When loaded as a worker, this script only runs the simulation of the
+     full graph view. Positions travel as x, y pairs in two Float32Arrays
+     that are transferred back and forth, so the page draws one frame while
+     the next one is computed. */
+  const runWorker = () => {
+    let nodes = [];
+    let sim = null;
+    const free = [];
+    let timer = null;
+
+    const step = () => {
+      timer = null;
+      if (!sim || sim.alpha === 0 || free.length === 0) return;
+      sim.tick();
+      const out = free.pop();
+      for (let i = 0; i < nodes.length; i++) {
+        out[2 * i] = nodes[i].x;
+        out[2 * i + 1] = nodes[i].y;
+      }
+      self.postMessage({ positions: out }, [out.buffer]);
+      schedule();
+    };
+    const schedule = () => {
+      if (timer === null) timer = setTimeout(step, 0);
+    };
+
+    self.onmessage = (ev) => {
+      const msg = ev.data;
+      if (msg.type === 'init') {
+        const pos = msg.positions;
+        nodes = new Array(pos.length / 2);
+        for (let i = 0; i < nodes.length; i++) {
+          nodes[i] = { x: pos[2 * i], y: pos[2 * i + 1], vx: 0, vy: 0 };
+        }
+        const edges = new Array(msg.edgeSeq.length);
+        for (let e = 0; e < edges.length; e++) {
+          edges[e] = {
+            source: nodes[msg.edgePairs[2 * e]],
+            target: nodes[msg.edgePairs[2 * e + 1]],
+            type: msg.edgeSeq[e] ? 'sequence' : null,
+          };
+        }
+        sim = createSimulation(nodes, edges, msg.alpha);
+        for (let w = 0; w < msg.warmup; w++) sim.tick();
+        free.push(pos, new Float32Array(pos.length));
+      } else if (msg.type === 'buffer') {
+        free.push(msg.positions);
+      } else if (msg.type === 'drag') {
+        const n = nodes[msg.index];
+        n.x = msg.x;
+        n.y = msg.y;
+        n.vx = 0;
+        n.vy = 0;
+        sim.pinned = n;
+        sim.alpha = Math.max(sim.alpha, 0.3);
+      } else if (msg.type === 'release') {
+        sim.pinned = null;
+      }
+      schedule();
+    };
+  };
+
+  if (typeof document === 'undefined') {
+    runWorker();
+    return;
+  }
+
   /* ── helpers ─────────────────────────────────────────────── */
 
+  /* URL of this script, loaded again as the simulation worker */
+  const scriptUrl = document.currentScript ? document.currentScript.src : null;
+
   const cssVar = (name) => getComputedStyle(document.documentElement).getPropertyValue(name).trim();
 
   const tagHue = (tag) => {
@@ -36,19 +234,315 @@
     return nodeColor(node);
   };
 
-  /* ── force simulation ───────────────────────────────────── */
+  /* ── graph data ─────────────────────────────────────────── */
+
+  /* Decode graph.json into { nodes, edgePairs, edgeSeq, positions }: edge e
+     joins nodes[edgePairs[2e]] and nodes[edgePairs[2e + 1]], and edgeSeq[e]
+     is 1 for sequence edges. positions holds the x, y pairs of a layout
+     computed at build time, or is null. Reads the columnar layout, or the
+     older one with lists of node and edge objects. */
+  const decodeGraph = (data) => {
+    if (!data) return null;
+    if (data.format === 'columnar') return decodeColumnar(data);
+    if (!Array.isArray(data.nodes) || !Array.isArray(data.edges)) return null;
+    const index = {};
+    for (let i = 0; i < data.nodes.length; i++) index[data.nodes[i].id] = i;
+    const pairs = [];
+    const seq = [];
+    for (let e = 0; e < data.edges.length; e++) {
+      const s = index[data.edges[e].source];
+      const t = index[data.edges[e].target];
+      if (s === undefined || t === undefined) continue;
+      pairs.push(s, t);
+      seq.push(data.edges[e].type === 'sequence' ? 1 : 0);
+    }
+    let positions = null;
+    if (data.nodes.length && data.nodes.every((n) => typeof n.x === 'number' && typeof n.y === 'number')) {
+      positions = new Float32Array(2 * data.nodes.length);
+      for (let i = 0; i < data.nodes.length; i++) {
+        positions[2 * i] = data.nodes[i].x;
+        positions[2 * i + 1] = data.nodes[i].y;
+      }
+    }
+    return { nodes: data.nodes, edgePairs: Int32Array.from(pairs), edgeSeq: Uint8Array.from(seq), positions };
+  };
+
+  const decodeColumnar = (data) => {
+    const count = data.nodeCount;
+    const tagNames = data.tags.names;
+    const tagOffsets = Int32Array.from(data.tags.offsets);
+    const tagIndex = Int32Array.from(data.tags.index);
+    const degree = Int32Array.from(data.degree);
+    const category = (column) => ({ names: column.names, index: Int32Array.from(column.index) });
+    const types = category(data.type);
+    const maturities = category(data.maturity);
+    const roles = category(data.role);
+
+    const nodes = new Array(count);
+    for (let i = 0; i < count; i++) {
+      const tags = [];
+      for (let t = tagOffsets[i]; t < tagOffsets[i + 1]; t++) tags.push(tagNames[tagIndex[t]]);
+      const n = { id: data.ids[i], title: data.titles[i], url: data.urls[i], tags, degree: degree[i] };
+      if (types.index[i] >= 0) n.type = types.names[types.index[i]];
+      if (maturities.index[i] >= 0) n.maturity = maturities.names[maturities.index[i]];
+      if (roles.index[i] >= 0) n.role = roles.names[roles.index[i]];
+      nodes[i] = n;
+    }
+
+    const kinds = category(data.edgeKinds);
+    const seqKind = kinds.names.indexOf('sequence');
+    const edgeSeq = new Uint8Array(data.edgeCount);
+    for (let e = 0; e < edgeSeq.length; e++) edgeSeq[e] = kinds.index[e] === seqKind ? 1 : 0;
+    const positions = data.positions ? Float32Array.from(data.positions) : null;
+    return { nodes, edgePairs: Int32Array.from(data.edges), edgeSeq, positions };
+  };
+
+  /* ── WebGL renderer ─────────────────────────────────────── */
+
+  /* Graphs with at least this many nodes are drawn with WebGL when the
+     browser supports it; 2D canvas calls per node and edge get too slow. */
+  const WEBGL_MIN_NODES = 5000;
+
+  const EDGE_VERTEX_SHADER = `
+    attribute vec2 aPos;
+    attribute float aDist;
+    uniform vec2 uCam;
+    uniform vec2 uScale;
+    varying float vDist;
+    void main() {
+      vDist = aDist;
+      gl_Position = vec4((aPos - uCam) * uScale, 0.0, 1.0);
+    }`;
+
+  /* uDash: 1 for the 4px on, 3px off pattern of sequence edges */
+  const EDGE_FRAGMENT_SHADER = `
+    precision mediump float;
+    uniform vec4 uColor;
+    uniform float uZoom;
+    uniform float uDash;
+    varying float vDist;
+    void main() {
+      if (uDash > 0.5 && mod(vDist * uZoom, 7.0) >= 4.0) discard;
+      gl_FragColor = uColor;
+    }`;
+
+  /* Nodes are point sprites with room for the MOC ring around the disc. */
+  const NODE_VERTEX_SHADER = `
+    attribute vec2 aPos;
+    attribute float aRadius;
+    attribute vec3 aColor;
+    attribute float aRing;
+    uniform vec2 uCam;
+    uniform vec2 uScale;
+    uniform float uDpr;
+    varying float vRadius;
+    varying vec3 vColor;
+    varying float vRing;
+    void main() {
+      vRadius = aRadius;
+      vColor = aColor;
+      vRing = aRing;
+      gl_Position = vec4((aPos - uCam) * uScale, 0.0, 1.0);
+      gl_PointSize = (aRadius + 3.0) * 2.0 * uDpr;
+    }`;
+
+  const NODE_FRAGMENT_SHADER = `
+    precision mediump float;
+    uniform vec3 uRingColor;
+    varying float vRadius;
+    varying vec3 vColor;
+    varying float vRing;
+    void main() {
+      float d = length(gl_PointCoord - 0.5) * 2.0 * (vRadius + 3.0);
+      float fill = clamp(vRadius - d + 0.5, 0.0, 1.0);
+      float ring = vRing * clamp(1.25 - abs(d - vRadius - 2.0), 0.0, 1.0);
+      if (fill + ring <= 0.0) discard;
+      gl_FragColor = fill > 0.0 ? vec4(vColor, fill) : vec4(uRingColor, ring);
+    }`;
+
+  /* CSS colour to [r, g, b] in 0..1, resolved by a 1x1 2D canvas */
+  const rgbCache = new Map();
+  let rgbCtx = null;
+  const cssRgb = (color) => {
+    let rgb = rgbCache.get(color);
+    if (rgb) return rgb;
+    if (!rgbCtx) {
+      const c = document.createElement('canvas');
+      c.width = 1;
+      c.height = 1;
+      rgbCtx = c.getContext('2d', { willReadFrequently: true });
+    }
+    rgbCtx.clearRect(0, 0, 1, 1);
+    rgbCtx.fillStyle = '#000';
+    rgbCtx.fillStyle = color;
+    rgbCtx.fillRect(0, 0, 1, 1);
+    const d = rgbCtx.getImageData(0, 0, 1, 1).data;
+    rgb = [d[0] / 255, d[1] / 255, d[2] / 255];
+    rgbCache.set(color, rgb);
+    return rgb;
+  };
+
+  /* Draws all edges and nodes of a scene in three batched calls. Returns
+     null when WebGL or the shaders are unavailable. */
+  const createGlRenderer = (canvas) => {
+    let gl = null;
+    try {
+      gl = canvas.getContext('webgl', { premultipliedAlpha: false });
+    } catch (e) {
+      gl = null;
+    }
+    if (!gl) return null;
+
+    const program = (vertexSrc, fragmentSrc) => {
+      const prog = gl.createProgram();
+      for (const [type, src] of [[gl.VERTEX_SHADER, vertexSrc], [gl.FRAGMENT_SHADER, fragmentSrc]]) {
+        const shader = gl.createShader(type);
+        gl.shaderSource(shader, src);
+        gl.compileShader(shader);
+        if (!gl.getShaderParameter(shader, gl.COMPILE_STATUS)) return null;
+        gl.attachShader(prog, shader);
+      }
+      gl.linkProgram(prog);
+      return gl.getProgramParameter(prog, gl.LINK_STATUS) ? prog : null;
+    };
+    const edgeProg = program(EDGE_VERTEX_SHADER, EDGE_FRAGMENT_SHADER);
+    const nodeProg = program(NODE_VERTEX_SHADER, NODE_FRAGMENT_SHADER);
+    if (!edgeProg || !nodeProg) return null;
+
+    const uniforms = (prog, names) => {
+      const u = {};
+      for (const name of names) u[name] = gl.getUniformLocation(prog, name);
+      return u;
+    };
+    const edgeU = uniforms(edgeProg, ['uCam', 'uScale', 'uColor', 'uZoom', 'uDash']);
+    const nodeU = uniforms(nodeProg, ['uCam', 'uScale', 'uDpr', 'uRingColor']);
+
+    const edgeBuffer = gl.createBuffer();
+    const nodeBuffer = gl.createBuffer();
+    let edgeData = new Float32Array(0);
+    let nodeData = new Float32Array(0);
+
+    /* bind float attributes laid out back to back in each vertex; arrays
+       left enabled by the other program would fail the draw's bounds check */
+    let enabled = [];
+    const attributes = (prog, layout) => {
+      for (const loc of enabled) gl.disableVertexAttribArray(loc);
+      enabled = [];
+      const stride = layout.reduce((sum, a) => sum + a[1], 0) * 4;
+      let offset = 0;
+      for (const [name, size] of layout) {
+        const loc = gl.getAttribLocation(prog, name);
+        gl.enableVertexAttribArray(loc);
+        gl.vertexAttribPointer(loc, size, gl.FLOAT, false, stride, offset);
+        enabled.push(loc);
+        offset += size * 4;
+      }
+    };
+
+    const draw = (scene) => {
+      const { nodes, edges, cam, W, H, dpr } = scene;
+      gl.viewport(0, 0, canvas.width, canvas.height);
+      gl.clearColor(0, 0, 0, 0);
+      gl.clear(gl.COLOR_BUFFER_BIT);
+      gl.enable(gl.BLEND);
+      gl.blendFunc(gl.SRC_ALPHA, gl.ONE_MINUS_SRC_ALPHA);
+      const scaleX = 2 * cam.zoom / W;
+      const scaleY = -2 * cam.zoom / H;
+
+      /* edges: links from the front of the buffer, sequences from the back */
+      if (edgeData.length < edges.length * 6) edgeData = new Float32Array(edges.length * 6);
+      let links = 0;
+      let seqs = 0;
+      for (let e = 0; e < edges.length; e++) {
+        const edge = edges[e];
+        if (!edge.source._visible || !edge.target._visible) continue;
+        const isSeq = edge.type === 'sequence';
+        const at = isSeq ? edgeData.length - 6 * ++seqs : 6 * links++;
+        edgeData[at] = edge.source.x;
+        edgeData[at + 1] = edge.source.y;
+        edgeData[at + 2] = 0;
+        edgeData[at + 3] = edge.target.x;
+        edgeData[at + 4] = edge.target.y;
+        edgeData[at + 5] = Math.hypot(edge.target.x - edge.source.x, edge.target.y - edge.source.y);
+      }
+      gl.useProgram(edgeProg);
+      gl.bindBuffer(gl.ARRAY_BUFFER, edgeBuffer);
+      gl.bufferData(gl.ARRAY_BUFFER, edgeData, gl.STREAM_DRAW);
+      attributes(edgeProg, [['aPos', 2], ['aDist', 1]]);
+      gl.uniform2f(edgeU.uCam, cam.x, cam.y);
+      gl.uniform2f(edgeU.uScale, scaleX, scaleY);
+      gl.uniform1f(edgeU.uZoom, cam.zoom);
+      /* lines are 1px wide, so thin links are drawn fainter instead */
+      const [er, eg, eb] = cssRgb(scene.edgeColor);
+      gl.uniform4f(edgeU.uColor, er, eg, eb, 0.2);
+      gl.uniform1f(edgeU.uDash, 0);
+      gl.drawArrays(gl.LINES, 0, 2 * links);
+      const [sr, sg, sb] = cssRgb(scene.seqColor);
+      gl.uniform4f(edgeU.uColor, sr, sg, sb, 0.7);
+      gl.uniform1f(edgeU.uDash, 1);
+      gl.drawArrays(gl.LINES, edgeData.length / 3 - 2 * seqs, 2 * seqs);
+
+      /* nodes */
+      if (nodeData.length < nodes.length * 7) nodeData = new Float32Array(nodes.length * 7);
+      let count = 0;
+      for (let i = 0; i < nodes.length; i++) {
+        const n = nodes[i];
+        if (!n._visible) continue;
+        const [r, g, b] = cssRgb(scene.fill(n));
+        const at = 7 * count++;
+        nodeData[at] = n.x;
+        nodeData[at + 1] = n.y;
+        nodeData[at + 2] = scene.radius(n);
+        nodeData[at + 3] = r;
+        nodeData[at + 4] = g;
+        nodeData[at + 5] = b;
+        nodeData[at + 6] = n.role === 'moc' ? 1 : 0;
+      }
+      gl.useProgram(nodeProg);
+      gl.bindBuffer(gl.ARRAY_BUFFER, nodeBuffer);
+      gl.bufferData(gl.ARRAY_BUFFER, nodeData, gl.STREAM_DRAW);
+      attributes(nodeProg, [['aPos', 2], ['aRadius', 1], ['aColor', 3], ['aRing', 1]]);
+      gl.uniform2f(nodeU.uCam, cam.x, cam.y);
+      gl.uniform2f(nodeU.uScale, scaleX, scaleY);
+      gl.uniform1f(nodeU.uDpr, dpr);
+      gl.uniform3fv(nodeU.uRingColor, cssRgb(scene.ringColor));
+      gl.drawArrays(gl.POINTS, 0, count);
+    };
+
+    return { draw };
+  };
+
+  /* ── graph view ─────────────────────────────────────────── */
 
   const ForceGraph = (container, data, opts) => {
     opts = opts || {};
     const nodes = data.nodes;
-    const edges = data.edges;
     const idMap = {};
     const currentId = opts.currentId || null;
     let W, H, dpr;
 
+    /* large graphs draw nodes and edges with WebGL on a canvas underneath;
+       the 2D canvas on top then only takes input and draws labels */
+    let glCanvas = null;
+    let glView = null;
+    if (data.nodes.length >= WEBGL_MIN_NODES) {
+      glCanvas = document.createElement('canvas');
+      glView = createGlRenderer(glCanvas);
+      if (glView) {
+        glCanvas.style.position = 'absolute';
+        glCanvas.style.left = '0';
+        glCanvas.style.top = '0';
+        glCanvas.style.pointerEvents = 'none';
+        container.appendChild(glCanvas);
+      } else {
+        glCanvas = null;
+      }
+    }
+
     const canvas = document.createElement('canvas');
     container.appendChild(canvas);
     const ctx = canvas.getContext('2d');
+    if (glCanvas) canvas.style.position = 'relative';
 
     const tooltip = document.createElement('div');
     tooltip.className = 'graph-tooltip';
@@ -64,24 +558,28 @@
     srAnnounce.setAttribute('aria-atomic', 'true');
     container.appendChild(srAnnounce);
 
-    /* init node positions */
+    /* init node positions, from the build-time layout if there is one */
+    const laidOut = !!data.positions;
     for (let i = 0; i < nodes.length; i++) {
       const n = nodes[i];
-      n.x = (Math.random() - 0.5) * 300;
-      n.y = (Math.random() - 0.5) * 300;
+      n.x = laidOut ? data.positions[2 * i] : (Math.random() - 0.5) * 300;
+      n.y = laidOut ? data.positions[2 * i + 1] : (Math.random() - 0.5) * 300;
       n.vx = 0;
       n.vy = 0;
+      n._index = i;
       idMap[n.id] = n;
       n._visible = true;
       n._degree = 0;
     }
 
     /* resolve edge references */
-    const resolvedEdges = [];
-    for (let e = 0; e < edges.length; e++) {
-      const src = idMap[edges[e].source];
-      const tgt = idMap[edges[e].target];
-      if (src && tgt) resolvedEdges.push({ source: src, target: tgt, type: edges[e].type || null });
+    const resolvedEdges = new Array(data.edgeSeq.length);
+    for (let e = 0; e < resolvedEdges.length; e++) {
+      resolvedEdges[e] = {
+        source: nodes[data.edgePairs[2 * e]],
+        target: nodes[data.edgePairs[2 * e + 1]],
+        type: data.edgeSeq[e] ? 'sequence' : null,
+      };
     }
 
     /* compute degree */
@@ -116,6 +614,8 @@
           }
         }
         dragging = null;
+        sim.pinned = null;
+        if (worker) worker.postMessage({ type: 'release' });
       }
       panning = false;
     };
@@ -129,6 +629,12 @@
       canvas.height = H * dpr;
       canvas.style.width = `${W}px`;
       canvas.style.height = `${H}px`;
+      if (glCanvas) {
+        glCanvas.width = W * dpr;
+        glCanvas.height = H * dpr;
+        glCanvas.style.width = `${W}px`;
+        glCanvas.style.height = `${H}px`;
+      }
     };
     resize();
     window.addEventListener('resize', resize);
@@ -143,125 +649,76 @@
       y: (sy - H / 2) / cam.zoom + cam.y
     });
 
-    /* physics */
-    let alpha = 1;
-    const REPULSION = 800;
-    const ATTRACTION = 0.005;
-    const CENTER_GRAVITY = 0.01;
-    const DAMPING = 0.9;
+    /* physics; a precomputed layout starts at rest */
     const NODE_RADIUS = 5;
-    const BH_THETA = 0.5;
-
-    /* Barnes-Hut quadtree for O(n log n) repulsion */
-    const buildQuadtree = (pts) => {
-      if (pts.length === 0) return null;
-      let minX = Infinity, minY = Infinity, maxX = -Infinity, maxY = -Infinity;
-      for (let i = 0; i < pts.length; i++) {
-        const p = pts[i];
-        if (p.x < minX) minX = p.x;
-        if (p.y < minY) minY = p.y;
-        if (p.x > maxX) maxX = p.x;
-        if (p.y > maxY) maxY = p.y;
+    const sim = createSimulation(nodes, resolvedEdges, laidOut ? 0 : 1);
+
+    /* the full graph simulates in a worker, if the browser lets us start one */
+    let worker = null;
+    if (opts.useWorker && scriptUrl && typeof Worker !== 'undefined') {
+      try {
+        worker = new Worker(scriptUrl);
+      } catch (e) {
+        worker = null;
       }
-      const pad = 1;
-      const size = Math.max(maxX - minX, maxY - minY) + pad;
-      const cx = (minX + maxX) / 2;
-      const cy = (minY + maxY) / 2;
-      const root = { cx, cy, size, mass: 0, comX: 0, comY: 0, body: null, children: null };
-      for (let i = 0; i < pts.length; i++) insert(root, pts[i]);
-      return root;
-    };
+    }
 
-    const insert = (quad, p) => {
-      if (quad.mass === 0) {
-        quad.body = p;
-        quad.mass = 1;
-        quad.comX = p.x;
-        quad.comY = p.y;
+    /* pin the dragged node where it is and wake the simulation */
+    const pinDragged = () => {
+      if (worker) {
+        worker.postMessage({ type: 'drag', index: dragging._index, x: dragging.x, y: dragging.y });
         return;
       }
-      if (quad.children === null) {
-        quad.children = subdivide(quad);
-        const old = quad.body;
-        quad.body = null;
-        insert(childFor(quad, old), old);
-      }
-      quad.comX = (quad.comX * quad.mass + p.x) / (quad.mass + 1);
-      quad.comY = (quad.comY * quad.mass + p.y) / (quad.mass + 1);
-      quad.mass += 1;
-      insert(childFor(quad, p), p);
+      sim.pinned = dragging;
+      sim.alpha = Math.max(sim.alpha, 0.3);
+      ensureRunning();
     };
 
-    const subdivide = (q) => {
-      const hs = q.size / 2;
-      const qs = hs / 2;
-      return [
-        { cx: q.cx - qs, cy: q.cy - qs, size: hs, mass: 0, comX: 0, comY: 0, body: null, children: null },
-        { cx: q.cx + qs, cy: q.cy - qs, size: hs, mass: 0, comX: 0, comY: 0, body: null, children: null },
-        { cx: q.cx - qs, cy: q.cy + qs, size: hs, mass: 0, comX: 0, comY: 0, body: null, children: null },
-        { cx: q.cx + qs, cy: q.cy + qs, size: hs, mass: 0, comX: 0, comY: 0, body: null, children: null },
-      ];
-    };
-
-    const childFor = (quad, p) => {
-      const i = (p.x > quad.cx ? 1 : 0) + (p.y > quad.cy ? 2 : 0);
-      return quad.children[i];
+    /* rendering */
+    const nodeRadius = (n) => {
+      const degScale = Math.min(1 + n._degree * 0.15, 3);
+      const baseR = NODE_RADIUS * degScale;
+      if (currentId && n.id === currentId) return baseR * 1.5;
+      return (n === hovered || n === selected) ? baseR * 1.3 : baseR;
     };
 
-    const applyRepulsion = (node, quad) => {
-      if (quad === null || quad.mass === 0) return;
-      if (quad.body === node) return;
-      const dx = node.x - quad.comX;
-      const dy = node.y - quad.comY;
-      const d2 = dx * dx + dy * dy || 1;
-      if (quad.body !== null || quad.size * quad.size / d2 < BH_THETA * BH_THETA) {
-        const f = REPULSION * quad.mass / d2;
-        node.vx += dx * f;
-        node.vy += dy * f;
-        return;
+    /* edges to the hovered node's neighbours, over the others */
+    const drawHoverEdges = (color) => {
+      if (!hovered || !hovered._visible) return;
+      const from = toScreen(hovered.x, hovered.y);
+      ctx.strokeStyle = color;
+      ctx.lineWidth = 1.5;
+      ctx.globalAlpha = 0.9;
+      ctx.beginPath();
+      for (const id of adjacency[hovered.id] || []) {
+        const n = idMap[id];
+        if (!n._visible) continue;
+        const to = toScreen(n.x, n.y);
+        ctx.moveTo(from.x, from.y);
+        ctx.lineTo(to.x, to.y);
       }
-      for (let c = 0; c < 4; c++) applyRepulsion(node, quad.children[c]);
+      ctx.stroke();
+      ctx.globalAlpha = 1;
     };
 
-    const tick = () => {
-      if (alpha < 0.001) { alpha = 0; return; }
-      alpha *= 0.995;
-
-      const qt = buildQuadtree(nodes);
-      for (let i = 0; i < nodes.length; i++) {
-        const a = nodes[i];
-        /* center gravity */
-        a.vx -= a.x * CENTER_GRAVITY;
-        a.vy -= a.y * CENTER_GRAVITY;
-
-        /* repulsion (Barnes-Hut) */
-        applyRepulsion(a, qt);
-      }
-
-      /* attraction along edges */
-      for (let e = 0; e < resolvedEdges.length; e++) {
-        const edge = resolvedEdges[e];
-        const dx2 = edge.target.x - edge.source.x;
-        const dy2 = edge.target.y - edge.source.y;
-        const k = edge.type === 'sequence' ? ATTRACTION * 3 : ATTRACTION;
-        edge.source.vx += dx2 * k;
-        edge.source.vy += dy2 * k;
-        edge.target.vx -= dx2 * k;
-        edge.target.vy -= dy2 * k;
-      }
-
-      /* integrate */
-      for (let k = 0; k < nodes.length; k++) {
-        const n = nodes[k];
-        if (n === dragging) continue;
-        n.vx *= DAMPING;
-        n.vy *= DAMPING;
-        n.x += n.vx * alpha;
-        n.y += n.vy * alpha;
+    /* keyboard selection ring and label of a hovered, selected or current node */
+    const drawHighlight = (n, p, radius, labelColor) => {
+      if (n === selected) {
+        ctx.beginPath();
+        ctx.arc(p.x, p.y, radius + 3, 0, Math.PI * 2);
+        ctx.strokeStyle = cssVar('--text-link') || '#0066cc';
+        ctx.lineWidth = 2;
+        ctx.setLineDash([3, 2]);
+        ctx.stroke();
+        ctx.setLineDash([]);
       }
+      const rootFontSize = parseFloat(getComputedStyle(document.documentElement).fontSize);
+      ctx.font = `${rootFontSize * 0.75}px sans-serif`;
+      ctx.fillStyle = labelColor;
+      ctx.textAlign = 'center';
+      ctx.fillText(n.title, p.x, p.y - radius - 4);
     };
 
-    /* rendering */
     const draw = () => {
       ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
       ctx.clearRect(0, 0, W, H);
@@ -269,9 +726,30 @@
       const edgeColor = cssVar('--graph-edge') || '#ddd';
       const labelColor = cssVar('--graph-label') || '#333';
       const currentColor = cssVar('--graph-node-current') || '#333';
+      const seqColor = cssVar('--text-link') || '#0066cc';
+
+      if (glView) {
+        glView.draw({
+          nodes,
+          edges: resolvedEdges,
+          cam,
+          W,
+          H,
+          dpr,
+          radius: nodeRadius,
+          fill: (n) => (currentId && n.id === currentId ? currentColor : nodeColorByMode(n)),
+          edgeColor,
+          seqColor,
+          ringColor: currentColor,
+        });
+        drawHoverEdges(seqColor);
+        for (const n of new Set([hovered, selected, idMap[currentId]])) {
+          if (n && n._visible) drawHighlight(n, toScreen(n.x, n.y), nodeRadius(n), labelColor);
+        }
+        return;
+      }
 
       /* edges */
-      const seqColor = cssVar('--text-link') || '#0066cc';
       for (let e = 0; e < resolvedEdges.length; e++) {
         const edge = resolvedEdges[e];
         if (!edge.source._visible || !edge.target._visible) continue;
@@ -293,9 +771,9 @@
       }
       ctx.globalAlpha = 1;
       ctx.setLineDash([]);
+      drawHoverEdges(seqColor);
 
       /* nodes */
-      const r = NODE_RADIUS;
       for (let i = 0; i < nodes.length; i++) {
         const n = nodes[i];
         if (!n._visible) continue;
@@ -303,9 +781,7 @@
         const isCurrent = currentId && n.id === currentId;
         const isHovered = n === hovered;
         const isSelected = n === selected;
-        const degScale = Math.min(1 + n._degree * 0.15, 3);
-        const baseR = r * degScale;
-        const radius = isCurrent ? baseR * 1.5 : ((isHovered || isSelected) ? baseR * 1.3 : baseR);
+        const radius = nodeRadius(n);
 
         ctx.beginPath();
         ctx.arc(p.x, p.y, radius, 0, Math.PI * 2);
@@ -321,28 +797,21 @@
           ctx.stroke();
         }
 
-        /* keyboard selection ring */
-        if (isSelected) {
-          ctx.beginPath();
-          ctx.arc(p.x, p.y, radius + 3, 0, Math.PI * 2);
-          ctx.strokeStyle = cssVar('--text-link') || '#0066cc';
-          ctx.lineWidth = 2;
-          ctx.setLineDash([3, 2]);
-          ctx.stroke();
-          ctx.setLineDash([]);
-        }
-
-        /* label for hovered, selected, or current */
-        if (isHovered || isSelected || isCurrent) {
-          const rootFontSize = parseFloat(getComputedStyle(document.documentElement).fontSize);
-          ctx.font = `${rootFontSize * 0.75}px sans-serif`;
-          ctx.fillStyle = labelColor;
-          ctx.textAlign = 'center';
-          ctx.fillText(n.title, p.x, p.y - radius - 4);
-        }
+        if (isHovered || isSelected || isCurrent) drawHighlight(n, p, radius, labelColor);
       }
     };
 
+    /* on a lost WebGL context, draw everything on the 2D canvas instead */
+    if (glCanvas) {
+      glCanvas.addEventListener('webglcontextlost', () => {
+        glCanvas.remove();
+        glCanvas = null;
+        glView = null;
+        canvas.style.position = '';
+        draw();
+      });
+    }
+
     /* hit test */
     const nodeAt = (sx, sy) => {
       const w = toWorld(sx, sy);
@@ -367,8 +836,7 @@
       const hit = nodeAt(sx, sy);
       if (hit) {
         dragging = hit;
-        alpha = Math.max(alpha, 0.3);
-        ensureRunning();
+        pinDragged();
       } else {
         panning = true;
         panStart = { x: ev.clientX, y: ev.clientY, camX: cam.x, camY: cam.y };
@@ -386,8 +854,7 @@
         dragging.y = w.y;
         dragging.vx = 0;
         dragging.vy = 0;
-        alpha = Math.max(alpha, 0.3);
-        ensureRunning();
+        pinDragged();
       } else if (panning) {
         const dx = (ev.clientX - panStart.x) / cam.zoom;
         const dy = (ev.clientY - panStart.y) / cam.zoom;
@@ -472,16 +939,16 @@
     /* animation loop */
     let animId = null;
     const loop = () => {
-      tick();
+      sim.tick();
       draw();
-      if (alpha > 0.001) {
+      if (sim.alpha > 0.001) {
         animId = requestAnimationFrame(loop);
       } else {
         animId = null;
       }
     };
     const ensureRunning = () => {
-      if (!animId) loop();
+      if (!animId && !worker) loop();
     };
 
     /* auto-fit after simulation settles */
@@ -505,9 +972,70 @@
     const adjacency = buildAdjacency(resolvedEdges);
 
     /* run warmup then fit */
-    for (let w = 0; w < 200; w++) tick();
-    autoFit();
-    loop();
+    const runHere = () => {
+      if (!laidOut) for (let w = 0; w < 200; w++) sim.tick();
+      autoFit();
+      loop();
+    };
+
+    /* Worker frames, drawn on the next animation frame. Buffers go back
+       once drawn, so the worker never runs more than two ticks ahead. */
+    let frames = [];
+    let fitted = laidOut;
+    const drawFrame = () => {
+      animId = null;
+      const p = frames[frames.length - 1];
+      for (let i = 0; i < nodes.length; i++) {
+        const n = nodes[i];
+        if (n === dragging) continue;
+        /* displacement stands in for velocity in the click check */
+        n.vx = p[2 * i] - n.x;
+        n.vy = p[2 * i + 1] - n.y;
+        n.x = p[2 * i];
+        n.y = p[2 * i + 1];
+      }
+      for (let f = 0; f < frames.length; f++) {
+        worker.postMessage({ type: 'buffer', positions: frames[f] }, [frames[f].buffer]);
+      }
+      frames = [];
+      if (!fitted) { fitted = true; autoFit(); }
+      draw();
+    };
+
+    const startWorker = () => {
+      worker.onmessage = (ev) => {
+        frames.push(ev.data.positions);
+        if (!animId) animId = requestAnimationFrame(drawFrame);
+      };
+      worker.onerror = (ev) => {
+        ev.preventDefault();
+        worker.terminate();
+        worker = null;
+        frames = [];
+        if (animId) { cancelAnimationFrame(animId); animId = null; }
+        runHere();
+      };
+      const positions = new Float32Array(2 * nodes.length);
+      for (let i = 0; i < nodes.length; i++) {
+        positions[2 * i] = nodes[i].x;
+        positions[2 * i + 1] = nodes[i].y;
+      }
+      worker.postMessage({
+        type: 'init',
+        positions,
+        edgePairs: data.edgePairs,
+        edgeSeq: data.edgeSeq,
+        alpha: sim.alpha,
+        warmup: laidOut ? 0 : 200,
+      }, [positions.buffer]);
+    };
+
+    if (worker) {
+      startWorker();
+      if (laidOut) { autoFit(); draw(); }
+    } else {
+      runHere();
+    }
 
     return {
       nodes,
@@ -533,9 +1061,11 @@
       setOnFocus: (cb) => { onFocusCb = cb; },
       destroy: () => {
         if (animId) { cancelAnimationFrame(animId); animId = null; }
+        if (worker) { worker.terminate(); worker = null; }
         window.removeEventListener('resize', resize);
         window.removeEventListener('mouseup', onMouseUp);
         canvas.remove();
+        if (glCanvas) glCanvas.remove();
         tooltip.remove();
         srAnnounce.remove();
       },
@@ -802,8 +1332,10 @@
     fetch(url).then((res) => {
       if (!res.ok) return;
       return res.json();
-    }).then((data) => {
-      if (!data || !Array.isArray(data.nodes) || !Array.isArray(data.edges)) return;
+    }).then((raw) => {
+      let data = decodeGraph(raw);
+      if (!data) return;
+      /* a local graph slice is already the neighbourhood; filtering keeps it whole */
       if (opts && opts.currentId) {
         data = filterNeighborhood(data, opts.currentId);
       }
@@ -829,16 +1361,30 @@
   };
 
   const filterNeighborhood = (data, centerId) => {
-    const neighborIds = {};
-    neighborIds[centerId] = true;
-    for (let i = 0; i < data.edges.length; i++) {
-      const e = data.edges[i];
-      if (e.source === centerId) neighborIds[e.target] = true;
-      if (e.target === centerId) neighborIds[e.source] = true;
+    const pairs = data.edgePairs;
+    const keep = new Uint8Array(data.nodes.length);
+    const center = data.nodes.findIndex((n) => n.id === centerId);
+    if (center >= 0) keep[center] = 1;
+    for (let e = 0; e < data.edgeSeq.length; e++) {
+      if (pairs[2 * e] === center) keep[pairs[2 * e + 1]] = 1;
+      if (pairs[2 * e + 1] === center) keep[pairs[2 * e]] = 1;
+    }
+    const remap = new Int32Array(data.nodes.length).fill(-1);
+    const nodes = [];
+    for (let i = 0; i < data.nodes.length; i++) {
+      if (keep[i]) { remap[i] = nodes.length; nodes.push(data.nodes[i]); }
+    }
+    const edgePairs = [];
+    const edgeSeq = [];
+    for (let e = 0; e < data.edgeSeq.length; e++) {
+      const s = remap[pairs[2 * e]];
+      const t = remap[pairs[2 * e + 1]];
+      if (s < 0 || t < 0) continue;
+      edgePairs.push(s, t);
+      edgeSeq.push(data.edgeSeq[e]);
     }
-    const nodes = data.nodes.filter((n) => neighborIds[n.id]);
-    const edges = data.edges.filter((e) => neighborIds[e.source] && neighborIds[e.target]);
-    return { nodes, edges };
+    /* no positions: the few neighbours lay themselves out around the center */
+    return { nodes, edgePairs: Int32Array.from(edgePairs), edgeSeq: Uint8Array.from(edgeSeq), positions: null };
   };
 
   /* ── page init ──────────────────────────────────────────── */
@@ -847,7 +1393,7 @@
     /* full graph page */
     const full = document.getElementById('graph-container');
     if (full && full.getAttribute('data-graph-url')) {
-      initGraph(full, {});
+      initGraph(full, { useWorker: true });
     }
 
     /* local graph on zettel pages */
@@ -8,6 +8,8 @@
   let showTimer = null;
   let hideTimer = null;
   let previews = {};
+  let manifest = null; // set when previews are sharded
+  const shards = {}; // shard index -> Promise of its previews
   const linkAC = new AbortController();
 
   /* ── helpers ─────────────────────────────────────────────── */
@@ -93,21 +95,44 @@
     }, POP_HIDE_DELAY);
   };
 
-  /* ── init ────────────────────────────────────────────────── */
+  /* ── data ────────────────────────────────────────────────── */
 
-  const initPreviews = () => {
+  const siteUrl = (path) => {
     const root = (typeof base_url !== 'undefined' && base_url) || '';
-    let url = `${root}/previews.json`;
-    if (root.slice(-1) === '/') {
-       url = `${root}previews.json`;
+    return root.slice(-1) === '/' ? `${root}${path}` : `${root}/${path}`;
+  };
+
+  // Must match shard_index() in preview_exporter.py.
+  const shardIndex = (id, count) => {
+    let h = 0;
+    for (let i = 0; i < id.length; i++) h = (Math.imul(h, 31) + id.charCodeAt(i)) >>> 0;
+    return h % count;
+  };
+
+  const lookup = (id) => {
+    if (!manifest) return Promise.resolve(previews[id]);
+    const i = shardIndex(id, manifest.shards.length);
+    if (!shards[i]) {
+      shards[i] = fetch(siteUrl(manifest.shards[i]))
+        .then((res) => (res.ok ? res.json() : {}))
+        .catch(() => ({}));
     }
+    return shards[i].then((shard) => shard[id]);
+  };
+
+  /* ── init ────────────────────────────────────────────────── */
 
-    fetch(url).then((res) => {
+  const initPreviews = () => {
+    fetch(siteUrl('previews.json')).then((res) => {
       if (!res.ok) return;
       return res.json();
     }).then((data) => {
       if (!data) return;
-      previews = data;
+      if (data.format === 'sharded' && Array.isArray(data.shards) && data.shards.length) {
+        manifest = data;
+      } else {
+        previews = data;
+      }
       bindLinks();
     }).catch(() => {
       /* previews unavailable — degrade silently */
@@ -132,22 +157,28 @@
       const match = href.match(idRegex);
       if (match) {
         const id = match[1];
-        if (previews[id]) {
+        // Sharded previews are only known once their shard is loaded.
+        if (manifest || previews[id]) {
           link.setAttribute('data-preview-bound', '');
-          ((l, d) => {
+          ((l, zid) => {
             const lOpt = {signal: linkAC.signal};
             l.addEventListener('mouseenter', () => {
               if (showTimer) clearTimeout(showTimer);
-              showTimer = setTimeout(() => {
-                show(l, d);
+              const pending = lookup(zid);
+              const timer = setTimeout(() => {
+                pending.then((d) => {
+                  if (d && showTimer === timer) show(l, d);
+                });
               }, POP_DELAY);
+              showTimer = timer;
             }, lOpt);
 
             l.addEventListener('mouseleave', () => {
               if (showTimer) clearTimeout(showTimer);
+              showTimer = null;
               hide();
             }, lOpt);
-          })(link, previews[id]);
+          })(link, id);
         }
       }
     }
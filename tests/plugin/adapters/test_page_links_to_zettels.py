@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 from mkdocs_zettelkasten.plugin.adapters.page_links_to_zettels import (
     adapt_page_links_to_zettels,
 )
+from mkdocs_zettelkasten.plugin.services.file_index import FileIndex
 
 
 def _make_file(src_path: str, url: str) -> MagicMock:
@@ -87,3 +88,84 @@ class TestAdaptPageLinksToZettels:
             "[note.md](note.md)", page, config, files, zettel_lookup
         )
         assert "[Zettel Title](https://example.com/note/)" in result
+
+    def test_wiki_link_without_alias_uses_zettel_title(self) -> None:
+        page, config = _make_context()
+        files = [_make_file("target.md", "target/")]
+        target = MagicMock()
+        target.title = "Target Title"
+
+        result = adapt_page_links_to_zettels(
+            "see [[target]]", page, config, files, MagicMock(return_value=target)
+        )
+        assert "[Target Title](https://example.com/target/)" in result
+
+    def test_matches_whole_path_segments(self) -> None:
+        page, config = _make_context()
+        files = [_make_file("ab.md", "ab/"), _make_file("sub/b.md", "sub/b/")]
+
+        result = adapt_page_links_to_zettels(
+            "[text](b.md)", page, config, files, MagicMock(return_value=None)
+        )
+        assert "[text](https://example.com/sub/b/)" in result
+
+    def test_relative_encoded_and_anchored_links(self) -> None:
+        page, config = _make_context()
+        page.file.src_path = "sub/current.md"
+        files = [_make_file("b c.md", "b c/"), _make_file("sub/d.md", "sub/d/")]
+
+        result = adapt_page_links_to_zettels(
+            "[one](../b%20c.md#intro) [two](./d.md) [[#local]]",
+            page,
+            config,
+            files,
+            MagicMock(return_value=None),
+        )
+        assert "[one](https://example.com/b c/#intro)" in result
+        assert "[two](https://example.com/sub/d/)" in result
+        assert "[#local](#local)" in result
+
+    def test_wiki_link_keeps_section(self) -> None:
+        page, config = _make_context()
+        files = [_make_file("20240101000001.md", "20240101000001/")]
+
+        result = adapt_page_links_to_zettels(
+            "[[20240101000001#intro|Intro]]",
+            page,
+            config,
+            files,
+            MagicMock(return_value=None),
+        )
+        assert result == "[Intro](https://example.com/20240101000001/#intro)"
+
+    def test_substring_fallback(self) -> None:
+        page, config = _make_context()
+        files = [_make_file("2024-ab.md", "2024-ab/")]
+
+        strict = adapt_page_links_to_zettels(
+            "[text](ab.md)", page, config, files, MagicMock(return_value=None)
+        )
+        assert strict == "[text](ab.md)"
+        fallback = adapt_page_links_to_zettels(
+            "[text](ab.md)",
+            page,
+            config,
+            files,
+            MagicMock(return_value=None),
+            substring_fallback=True,
+        )
+        assert fallback == "[text](https://example.com/2024-ab/)"
+
+    def test_uses_given_file_index(self) -> None:
+        page, config = _make_context()
+        index = FileIndex([_make_file("note.md", "note/")])
+
+        result = adapt_page_links_to_zettels(
+            "[text](note.md)",
+            page,
+            config,
+            [],
+            MagicMock(return_value=None),
+            file_index=index,
+        )
+        assert "[text](https://example.com/note/)" in result
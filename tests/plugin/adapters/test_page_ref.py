@@ -1,7 +1,9 @@
+import threading
 from unittest.mock import MagicMock
 
 from mkdocs_zettelkasten.plugin.adapters.page_ref import (
     _find_divider_indices,
+    _MarkdownPool,
     get_page_ref,
 )
 
@@ -173,3 +175,56 @@ class TestGetPageRef:
         assert ref is not None
         assert "ref line" in page.meta["ref"]
         assert "```" in md
+
+
+class TestMarkdownPool:
+    def _make_config(self, extensions: list) -> MagicMock:
+        config = MagicMock()
+        config.__getitem__ = lambda self, key: {
+            "markdown_extensions": extensions,
+            "mdx_configs": {},
+        }[key]
+        return config
+
+    def test_processor_reused_and_reset(self) -> None:
+        pool = _MarkdownPool()
+        config = self._make_config(["toc"])
+        with pool.borrow(config) as first:
+            first.convert("# Heading")
+        with pool.borrow(config) as second:
+            assert second is first
+            assert second.toc_tokens == []
+
+    def test_config_change_creates_new_processor(self) -> None:
+        pool = _MarkdownPool()
+        with pool.borrow(self._make_config([])) as first:
+            pass
+        with pool.borrow(self._make_config(["toc"])) as second:
+            assert second is not first
+
+    def test_concurrent_borrowers_get_distinct_processors(self) -> None:
+        pool = _MarkdownPool()
+        config = self._make_config([])
+        barrier = threading.Barrier(4)
+        borrowed = []
+
+        def worker() -> None:
+            with pool.borrow(config) as processor:
+                borrowed.append(processor)
+                barrier.wait()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len({id(p) for p in borrowed}) == 4
+
+    def test_get_page_ref_renders_with_pooled_processor(self) -> None:
+        page = MagicMock()
+        page.meta = {"is_zettel": True}
+        page.file.src_path = "test.md"
+        config = self._make_config([])
+        for _ in range(2):
+            _md, ref = get_page_ref("Body\n---\n- source: book", page, config)
+            assert ref == "<ul>\n<li>source: book</li>\n</ul>"
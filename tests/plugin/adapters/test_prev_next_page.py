@@ -2,7 +2,10 @@ from unittest.mock import MagicMock
 
 from mkdocs.structure.files import File
 
-from mkdocs_zettelkasten.plugin.adapters.prev_next_page import get_prev_next_page
+from mkdocs_zettelkasten.plugin.adapters.prev_next_page import (
+    build_navigation,
+    get_prev_next_page,
+)
 from tests.plugin.conftest import _make_zettel_mock
 
 
@@ -106,3 +109,51 @@ class TestGetPrevNextPage:
         prev, next_p = get_prev_next_page(page, files, [z1, z2])
         assert prev is f1.page
         assert next_p is None
+
+
+class TestBuildNavigation:
+    def _vault(self):
+        zettels = [
+            _make_zettel_mock(i, path=f"/docs/{name}.md")
+            for i, name in enumerate("abc", start=1)
+        ]
+        f_index = _make_file("index.md")
+        files = [f_index] + [_make_file(f"{n}.md", f"/docs/{n}.md") for n in "abc"]
+        return zettels, files
+
+    def test_neighbours(self) -> None:
+        zettels, (f_index, f1, f2, f3) = self._vault()
+        navigation = build_navigation([f_index, f1, f2, f3], zettels)
+        assert navigation.first is f1.page
+        assert navigation.neighbours == {
+            1: (f_index.page, f2.page),
+            2: (f1.page, f3.page),
+            3: (f2.page, None),
+        }
+
+    def test_missing_file_falls_back_to_homepage(self) -> None:
+        zettels, (f_index, _, f2, f3) = self._vault()
+        navigation = build_navigation([f_index, f2, f3], zettels)
+        assert navigation.first is None
+        assert navigation.neighbours[2] == (f_index.page, f3.page)
+
+    def test_precomputed_navigation_used(self) -> None:
+        zettels, files = self._vault()
+        navigation = build_navigation(files, zettels)
+        page = _make_page("b.md", zettel_id=2)
+
+        prev, next_p = get_prev_next_page(page, [], [], navigation=navigation)
+
+        assert prev is files[1].page
+        assert next_p is files[3].page
+        index_page = _make_page("index.md", is_zettel=False)
+        assert get_prev_next_page(index_page, [], [], navigation=navigation) == (
+            None,
+            files[1].page,
+        )
+
+    def test_unknown_zettel_has_no_neighbours(self) -> None:
+        zettels, files = self._vault()
+        navigation = build_navigation(files, zettels)
+        page = _make_page("x.md", zettel_id=99)
+        assert get_prev_next_page(page, [], [], navigation=navigation) == (None, None)
@@ -1,6 +1,9 @@
+import logging
+from pathlib import Path
 from unittest.mock import MagicMock
 
 from mkdocs_zettelkasten.plugin.adapters.transclusion import (
+    EmbedCache,
     _body_without_refs,
     _extract_section,
     adapt_transclusion,
@@ -252,3 +255,82 @@ class TestAdaptTransclusion:
         )
         # Leaf content should NOT appear because chain exceeds max depth
         assert "Leaf content." not in result
+
+
+class TestEmbedCache:
+    def _vault(self) -> dict:
+        return {
+            "a.md": _make_zettel_mock(
+                1, title="A", path=Path("/d/a.md"), body="# A\n\nA text ![[b]]\n"
+            ),
+            "b.md": _make_zettel_mock(
+                2, title="B", path=Path("/d/b.md"), body="# B\n\nB text ![[a]]\n"
+            ),
+            "c.md": _make_zettel_mock(
+                3, title="C", path=Path("/d/c.md"), body="# C\n\nC text\n"
+            ),
+        }
+
+    def _render(self, markdown, vault, cache, lookups=None):
+        def lookup(path):
+            if lookups is not None:
+                lookups.append(path)
+            return vault.get(path)
+
+        return adapt_transclusion(markdown, lookup, "https://example.com/", cache=cache)
+
+    def test_repeated_embed_served_from_cache(self) -> None:
+        vault = self._vault()
+        cache = EmbedCache()
+        first = self._render("![[c]]", vault, cache)
+        second = self._render("![[c]]", vault, cache)
+        assert first == second
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_matches_uncached_output(self) -> None:
+        vault = self._vault()
+        cache = EmbedCache()
+        for markdown in ["![[a]] ![[c]]", "![[b]]", "![[a]]", "![[b]] ![[a]]"]:
+            assert self._render(markdown, vault, cache) == self._render(
+                markdown, vault, None
+            )
+
+    def test_cycle_still_detected_from_each_page(self) -> None:
+        vault = self._vault()
+        cache = EmbedCache()
+        self._render("![[a]]", vault, cache)
+        # A page that is itself on the stack must see the circular warning.
+        result = adapt_transclusion(
+            "![[a]]",
+            vault.get,
+            "https://example.com/",
+            cache=cache,
+            _embed_stack=frozenset({"/d/b.md"}),
+        )
+        assert "Circular embed" in result
+        assert "A text" in result
+
+    def test_cache_hit_replays_nested_lookups(self) -> None:
+        vault = self._vault()
+        cache = EmbedCache()
+        uncached: list[str] = []
+        cached: list[str] = []
+        self._render("![[a]]", vault, cache)
+        self._render("![[a]]", vault, None, uncached)
+        self._render("![[a]]", vault, cache, cached)
+        assert cache.hits == 1
+        assert cached == uncached
+
+    def test_missing_section_cached(self) -> None:
+        vault = self._vault()
+        cache = EmbedCache()
+        for _ in range(2):
+            assert "Section not found" in self._render("![[c#nope]]", vault, cache)
+        assert cache.hits == 1
+
+    def test_stats_logged(self, caplog) -> None:
+        cache = EmbedCache()
+        self._render("![[c]]", self._vault(), cache)
+        with caplog.at_level(logging.DEBUG):
+            cache.log_stats()
+        assert "Embed cache: 0 hits, 1 misses (1 entries)" in caplog.text
@@ -4,6 +4,7 @@ from pathlib import Path, PurePosixPath
 from unittest.mock import MagicMock
 
 from mkdocs_zettelkasten.plugin.constants import MOC_ROLES
+from mkdocs_zettelkasten.plugin.entities.body_view import BodyView
 
 
 def _make_zettel_mock(
@@ -46,6 +47,7 @@ def _make_zettel_mock(
     z.role = role
     z.is_moc = role in MOC_ROLES if role else False
     z.body = body
+    z.body_view = BodyView(body)
     z.sequence_parent_id = sequence_parent_id
     z.source = source
     z.backlinks = backlinks if backlinks is not None else []
@@ -0,0 +1,73 @@
+from mkdocs_zettelkasten.plugin.entities.body_view import BodyView
+
+BODY = """# Title
+
+First line
+  second line
+
+```
+code [[1]]
+
+more code
+```
+
+## Notes
+
+Text here
+
+---
+
+- ref
+"""
+
+
+class TestBodyView:
+    def test_paragraphs(self) -> None:
+        view = BodyView("a\nb\n\n\nc\n")
+        assert view.paragraphs == ["a\nb", "c"]
+
+    def test_flat_paragraphs_strip_and_join(self) -> None:
+        view = BodyView("  a  \n b\n\nc")
+        assert view.flat_paragraphs == ["a b", "c"]
+
+    def test_fence_masked_paragraphs_align_with_paragraphs(self) -> None:
+        view = BodyView(BODY)
+        masked = view.fence_masked_paragraphs
+        assert len(masked) == len(view.paragraphs)
+        assert "[[1]]" not in "".join(masked)
+        assert all(
+            len(m) == len(p) for m, p in zip(masked, view.paragraphs, strict=True)
+        )
+
+    def test_fence_masked_whitespace_line_keeps_paragraph_split(self) -> None:
+        view = BodyView("```\ncode\n  \nmore\n```\n\ntext")
+        masked = view.fence_masked_paragraphs
+        assert len(masked) == len(view.paragraphs) == 3
+        assert masked[2] == "text"
+
+    def test_fence_masked_without_fences_is_paragraphs(self) -> None:
+        view = BodyView("a\n\nb")
+        assert view.fence_masked_paragraphs is view.paragraphs
+
+    def test_without_refs(self) -> None:
+        view = BodyView(BODY)
+        assert view.ref_divider is not None
+        assert "- ref" not in view.without_refs.body
+        assert view.without_refs.body.endswith("Text here\n\n")
+
+    def test_without_refs_no_divider_is_self(self) -> None:
+        view = BodyView("plain")
+        assert view.ref_divider is None
+        assert view.without_refs is view
+
+    def test_section(self) -> None:
+        view = BodyView("# A\n\nx\n\n## B\n\ny\n\n# C\n\nz\n")
+        assert view.section("b") == "## B\n\ny\n\n"
+        assert view.section("A") == "# A\n\nx\n\n## B\n\ny\n\n"
+        assert view.section("missing") is None
+
+    def test_parts_are_memoized(self) -> None:
+        view = BodyView(BODY)
+        assert view.paragraphs is view.paragraphs
+        assert view.headings is view.headings
+        assert view.without_refs is view.without_refs
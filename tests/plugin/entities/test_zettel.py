@@ -185,6 +185,11 @@ class TestZettelInit:
         assert z.title == "My Zettel"
         assert z.last_update_date == "2024-01-01"
 
+    def test_body_view_is_memoized(self, tmp_path: Path) -> None:
+        z = _make_zettel(tmp_path, VALID_ZETTEL)
+        assert z.body_view is z.body_view
+        assert z.body_view.body == z.body
+
     def test_missing_id_raises(self, tmp_path: Path) -> None:
         with pytest.raises(ZettelFormatError, match="Missing zettel ID"):
             _make_zettel(tmp_path, MISSING_ID_ZETTEL)
@@ -1,13 +1,14 @@
 import datetime
 from collections.abc import Callable
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from zoneinfo import ZoneInfo
 
 import pytest
 
 from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
 from mkdocs_zettelkasten.plugin.entities.zettel import Zettel, ZettelFormatError
+from mkdocs_zettelkasten.plugin.utils.git_utils import GitRevisionIndex
 
 UTC = ZoneInfo("UTC")
 
@@ -136,3 +137,31 @@ def test_falls_back_to_mtime_when_git_returns_none(tmp_path: Path) -> None:
     import re
 
     assert re.match(r"\d{4}-\d{2}-\d{2}", zettel.last_update_date)
+
+
+def test_uses_revision_index_without_git_calls(tmp_path: Path) -> None:
+    file_path = tmp_path / "test.md"
+    file_path.write_text(ID_CONTENT)
+    git_date = datetime.datetime(2025, 6, 15, 12, 0, 0, tzinfo=datetime.timezone.utc)
+    key = str(file_path.resolve())
+    index = GitRevisionIndex({key: git_date}, {key})
+
+    with patch(
+        "mkdocs_zettelkasten.plugin.entities.zettel.GitUtil.is_tracked"
+    ) as mock_tracked:
+        zettel = Zettel(file_path, "test.md", revision_index=index, zettel_config=None)
+
+    mock_tracked.assert_not_called()
+    assert zettel.last_update_date == "2025-06-15"
+
+
+def test_revision_index_untracked_falls_back_to_mtime(tmp_path: Path) -> None:
+    file_path = tmp_path / "test.md"
+    file_path.write_text(ID_CONTENT)
+    mock_stat = Mock()
+    mock_stat.st_mtime = _ts(2024, 3, 4)
+
+    with patch.object(Path, "stat", return_value=mock_stat):
+        zettel = Zettel(file_path, "test.md", revision_index=GitRevisionIndex())
+
+    assert zettel.last_update_date == "2024-03-04"
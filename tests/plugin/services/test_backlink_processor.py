@@ -51,3 +51,65 @@ class TestBacklinkProcessor:
         result = BacklinkProcessor.process(store, {1: {99}})
         assert 99 in result
         assert z1 in result[99]
+
+
+class TestBacklinkProcessorUpdate:
+    def _store(self) -> tuple[ZettelStore, list]:
+        zettels = [
+            _make_zettel_mock(i, path=Path(f"/docs/{i}.md"), rel_path=f"{i}.md")
+            for i in range(1, 5)
+        ]
+        return ZettelStore(zettels), zettels
+
+    def test_matches_full_process(self) -> None:
+        store, _ = self._store()
+        old = {1: {4}, 2: {4}, 3: {1}, 4: set()}
+        new = {1: {2}, 2: {4}, 3: {4}, 4: set()}
+        previous = BacklinkProcessor.process(store, old)
+
+        result = BacklinkProcessor.update(previous, store, old, new, {1, 3})
+
+        expected = BacklinkProcessor.process(store, new)
+        assert list(result.items()) == list(expected.items())
+
+    def test_target_order_matches_full_process(self) -> None:
+        store, _ = self._store()
+        old = {1: {4}, 2: {3}, 3: set(), 4: set()}
+        new = {1: {3, 4}, 2: {3}, 3: set(), 4: set()}
+        previous = BacklinkProcessor.process(store, old)
+
+        result = BacklinkProcessor.update(previous, store, old, new, {1})
+
+        expected = BacklinkProcessor.process(store, new)
+        assert list(result.items()) == list(expected.items())
+
+    def test_sources_stay_sorted_by_id(self) -> None:
+        store, zettels = self._store()
+        old = {1: set(), 2: {4}, 3: {4}, 4: set()}
+        new = {1: {4}, 2: {4}, 3: {4}, 4: set()}
+        previous = BacklinkProcessor.process(store, old)
+
+        result = BacklinkProcessor.update(previous, store, old, new, {1})
+
+        assert result[4] == zettels[:3]
+
+    def test_removed_source_dropped(self) -> None:
+        store, zettels = self._store()
+        old = {1: {2}, 2: set(), 3: set(), 4: set()}
+        previous = BacklinkProcessor.process(store, old)
+        store.update(zettels[1:])
+        new = {2: set(), 3: set(), 4: set()}
+
+        result = BacklinkProcessor.update(previous, store, old, new, {1})
+
+        assert 2 not in result
+
+    def test_previous_map_not_mutated(self) -> None:
+        store, zettels = self._store()
+        old = {1: {2}, 2: set(), 3: set(), 4: set()}
+        previous = BacklinkProcessor.process(store, old)
+        new = {1: set(), 2: set(), 3: set(), 4: set()}
+
+        BacklinkProcessor.update(previous, store, old, new, {1})
+
+        assert previous[2] == [zettels[0]]
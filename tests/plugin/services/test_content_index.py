@@ -0,0 +1,95 @@
+from pathlib import Path
+
+from mkdocs_zettelkasten.plugin.entities.body_view import BodyView
+from mkdocs_zettelkasten.plugin.services.content_index import (
+    INDEX_FILENAME,
+    ContentIndex,
+    tokenize,
+)
+from tests.plugin.conftest import _make_zettel_mock
+
+BODIES = {
+    1: "Gardening tomatoes needs compost, sunlight and patient watering.",
+    2: "Tomatoes love compost. Watering tomatoes daily helps the garden.",
+    3: "Rust ownership and borrowing rules prevent data races.",
+    4: "Borrowing in Rust: ownership moves, references borrow.",
+}
+
+
+def _zettels(bodies=BODIES):
+    return [
+        _make_zettel_mock(zid, rel_path=f"{zid}.md", body=body)
+        for zid, body in bodies.items()
+    ]
+
+
+class TestTokenize:
+    def test_strips_code_links_and_refs(self):
+        body = (
+            "Alpha [[20240101|beta]] [gamma](delta.md) `epsilon` ![[embed]]\n\n"
+            "```\nzeta\n```\n\nhttps://example.com/theta\n\n---\n\nreference"
+        )
+        assert tokenize(BodyView(body)) == ["alpha", "beta", "gamma"]
+
+    def test_drops_stop_words_short_tokens_and_numbers(self):
+        assert tokenize(BodyView("The cat is on 2024 mats")) == ["cat", "mats"]
+
+
+class TestContentIndex:
+    def test_neighbours_ranked_by_similarity(self):
+        index = ContentIndex()
+        index.update(_zettels())
+        assert [zid for zid, _ in index.neighbours(1, 5)] == [2]
+        assert [zid for zid, _ in index.neighbours(3, 5)] == [4]
+
+    def test_scores_are_cosines(self):
+        index = ContentIndex()
+        index.update(_zettels())
+        ((_, score),) = index.neighbours(1, 5)
+        assert 0 < score <= 1
+
+    def test_threshold_and_limit(self):
+        index = ContentIndex()
+        index.update(_zettels())
+        assert index.neighbours(1, 5, threshold=1.0) == []
+        assert index.neighbours(1, 0) == []
+
+    def test_excluded_zettels_do_not_take_slots(self):
+        bodies = {**BODIES, 5: "Compost and watering for tomatoes in the garden."}
+        index = ContentIndex()
+        index.update(_zettels(bodies))
+        (nearest,) = index.neighbours(1, 1)
+        (other,) = index.neighbours(1, 1, exclude={nearest[0]})
+        assert other[0] != nearest[0]
+        assert other[0] in {2, 5}
+
+    def test_unknown_zettel(self):
+        assert ContentIndex().neighbours(1, 5) == []
+
+    def test_update_only_reindexes_changed_bodies(self):
+        index = ContentIndex()
+        assert index.update(_zettels()) == 4
+        assert index.update(_zettels()) == 0
+        changed = {**BODIES, 2: "Completely unrelated astronomy telescopes."}
+        del changed[4]
+        assert index.update(_zettels(changed)) == 2
+        assert len(index) == 3
+        assert index.neighbours(1, 5) == []
+
+    def test_persisted_between_builds(self, tmp_path: Path):
+        index = ContentIndex(tmp_path)
+        index.update(_zettels())
+        index.save()
+        assert (tmp_path / INDEX_FILENAME).is_file()
+
+        reloaded = ContentIndex(tmp_path)
+        reloaded.load()
+        assert len(reloaded) == 4
+        assert reloaded.update(_zettels()) == 0
+        assert reloaded.neighbours(1, 5) == index.neighbours(1, 5)
+
+    def test_unreadable_file_is_discarded(self, tmp_path: Path):
+        (tmp_path / INDEX_FILENAME).write_bytes(b"garbage")
+        index = ContentIndex(tmp_path)
+        index.load()
+        assert len(index) == 0
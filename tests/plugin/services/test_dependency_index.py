@@ -0,0 +1,49 @@
+from mkdocs_zettelkasten.plugin.services.dependency_index import (
+    BACKLINKS,
+    SEQUENCES,
+    TRANSCLUSION,
+    DependencyIndex,
+)
+
+
+class TestDependencyIndex:
+    def test_empty_index(self) -> None:
+        index = DependencyIndex()
+        assert index.dependents(1) == set()
+        assert index.dirty({1}) == {1}
+
+    def test_record_edges(self) -> None:
+        index = DependencyIndex()
+        index.record(BACKLINKS, 2, [1, 3])
+        index.record(TRANSCLUSION, 4, [1])
+
+        assert index.dependents(1) == {2, 4}
+        assert index.dependents(3) == {2}
+        assert index.dependents(2) == set()
+
+    def test_self_edges_ignored(self) -> None:
+        index = DependencyIndex()
+        index.record(BACKLINKS, 1, [1])
+        assert index.dependents(1) == set()
+
+    def test_groups(self) -> None:
+        index = DependencyIndex()
+        index.record_group(SEQUENCES, [10, 11, 12])
+
+        assert index.dependents(11) == {10, 12}
+        assert index.dirty({12}) == {10, 11, 12}
+
+    def test_dirty_is_not_transitive(self) -> None:
+        index = DependencyIndex()
+        index.record(BACKLINKS, 2, [1])
+        index.record(BACKLINKS, 3, [2])
+
+        assert index.dirty({1}) == {1, 2}
+
+    def test_dirty_includes_previous_edges(self) -> None:
+        previous = DependencyIndex()
+        previous.record(BACKLINKS, 2, [1])
+        current = DependencyIndex()
+        current.record(BACKLINKS, 3, [1])
+
+        assert current.dirty({1}, previous) == {1, 2, 3}
@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock
+
+from mkdocs_zettelkasten.plugin.services.file_index import FileIndex
+
+
+def _make_file(src_path: str) -> MagicMock:
+    f = MagicMock()
+    f.src_path = src_path
+    return f
+
+
+class TestFileIndex:
+    def test_lookup_by_tail_segments(self) -> None:
+        f = _make_file("notes/sub/a.md")
+        index = FileIndex([f])
+        assert index.get_by_suffix("a.md") is f
+        assert index.get_by_suffix("sub/a.md") is f
+        assert index.get_by_suffix("./notes/sub/a.md") is f
+        assert index.get_by_suffix("b/a.md") is None
+
+    def test_partial_segment_does_not_match(self) -> None:
+        index = FileIndex([_make_file("ab.md")])
+        assert index.get_by_suffix("b.md") is None
+
+    def test_first_file_wins(self) -> None:
+        first = _make_file("x/a.md")
+        second = _make_file("a.md")
+        index = FileIndex([first, second])
+        assert index.get_by_suffix("a.md") is first
+
+    def test_get_by_link_normalizes(self) -> None:
+        f = _make_file("notes/my note.md")
+        index = FileIndex([f])
+        assert index.get_by_link("my%20note.md#intro", ".md", "x.md") is f
+        assert index.get_by_link("notes/../my note", ".md", "x.md") is f
+        assert index.get_by_link("", ".md", "x.md") is None
+
+    def test_get_by_link_relative_is_exact(self) -> None:
+        near = _make_file("x/a/b.md")
+        far = _make_file("other/a/b.md")
+        index = FileIndex([far, near])
+        assert index.get_by_link("../a/b.md", ".md", "x/y/src.md") is near
+        assert index.get_by_link("./b.md", ".md", "x/a/src.md") is near
+        assert index.get_by_link("../a/b.md", ".md", "z/y/src.md") is None
+
+    def test_find_containing(self) -> None:
+        f = _make_file("ab.md")
+        index = FileIndex([_make_file("c.md"), f])
+        assert index.find_containing("b.md") is f
+        assert index.find_containing("z.md") is None
@@ -1,7 +1,12 @@
+import json
 from pathlib import Path
 
 from mkdocs_zettelkasten.plugin.services.backlink_processor import BacklinkProcessor
-from mkdocs_zettelkasten.plugin.services.graph_exporter import GraphExporter
+from mkdocs_zettelkasten.plugin.services.graph_exporter import (
+    SLICE_DIR,
+    GraphExporter,
+    neighbourhood_slices,
+)
 from mkdocs_zettelkasten.plugin.services.link_resolver import LinkResolver
 from mkdocs_zettelkasten.plugin.services.zettel_store import ZettelStore
 from tests.plugin.conftest import _make_zettel_mock
@@ -283,3 +288,202 @@ class TestGraphExporter:
 
         link_edges = [e for e in result["edges"] if "type" not in e]
         assert len(link_edges) == 1
+
+
+def _decode_columnar(data: dict) -> dict:
+    """Rebuild the object layout from the columnar one."""
+
+    def name(column: dict, i: int) -> str | None:
+        idx = column["index"][i]
+        return None if idx < 0 else column["names"][idx]
+
+    nodes = []
+    for i, zid in enumerate(data["ids"]):
+        tags = data["tags"]
+        start, end = tags["offsets"][i], tags["offsets"][i + 1]
+        node = {
+            "id": zid,
+            "title": data["titles"][i],
+            "url": data["urls"][i],
+            "tags": [tags["names"][t] for t in tags["index"][start:end]],
+        }
+        for key in ("type", "maturity", "role"):
+            if (value := name(data[key], i)) is not None:
+                node[key] = value
+        node["degree"] = data["degree"][i]
+        nodes.append(node)
+    edges = []
+    for e in range(data["edgeCount"]):
+        edge = {
+            "source": data["ids"][data["edges"][2 * e]],
+            "target": data["ids"][data["edges"][2 * e + 1]],
+        }
+        if name(data["edgeKinds"], e) == "sequence":
+            edge["type"] = "sequence"
+        edges.append(edge)
+    return {"nodes": nodes, "edges": edges}
+
+
+class TestColumnarExport:
+    def _roundtrip(self, store, tags_metadata, backlinks) -> dict:
+        graph = GraphExporter().export_columnar(store, tags_metadata, backlinks)
+        data = json.loads("".join(graph.iter_json()))
+        assert data["format"] == "columnar"
+        assert data["nodeCount"] == len(store.zettels)
+        return data
+
+    def test_empty_store(self) -> None:
+        data = self._roundtrip(ZettelStore(), [], {})
+        assert _decode_columnar(data) == {"nodes": [], "edges": []}
+        assert data["tags"]["offsets"] == [0]
+
+    def test_matches_object_export(self) -> None:
+        z1 = _make_zettel_mock(
+            1,
+            title='Say "hi"',
+            rel_path="a.md",
+            path=Path("/docs/a.md"),
+            links=["b.md", "c.md"],
+            note_type="permanent",
+            role="moc",
+        )
+        z2 = _make_zettel_mock(
+            2,
+            title="B",
+            rel_path="b.md",
+            path=Path("/docs/b.md"),
+            links=["a.md"],
+            sequence_parent_id=1,
+            maturity="draft",
+        )
+        z3 = _make_zettel_mock(
+            3, title="Ünïcode", rel_path="sub/c.md", path=Path("/docs/sub/c.md")
+        )
+        store = ZettelStore([z1, z2, z3])
+        tags = [
+            {"src_path": "a.md", "tags": ["x", "y"]},
+            {"src_path": "sub/c.md", "tags": ["y"]},
+        ]
+        backlinks = _build_backlinks(store)
+
+        data = self._roundtrip(store, tags, backlinks)
+
+        assert _decode_columnar(data) == GraphExporter().export(store, tags, backlinks)
+        assert data["tags"]["names"] == ["x", "y"]
+
+    def test_columns_stream_in_chunks(self, monkeypatch) -> None:
+        from mkdocs_zettelkasten.plugin.services import graph_exporter
+
+        monkeypatch.setattr(graph_exporter, "_CHUNK", 2)
+        zettels = [
+            _make_zettel_mock(
+                i,
+                title=f"N{i}",
+                rel_path=f"{i}.md",
+                path=Path(f"/docs/{i}.md"),
+                links=[f"{i + 1}.md"],
+            )
+            for i in range(1, 8)
+        ]
+        store = ZettelStore(zettels)
+        backlinks = _build_backlinks(store)
+
+        data = self._roundtrip(store, [], backlinks)
+
+        assert _decode_columnar(data) == GraphExporter().export(store, [], backlinks)
+
+
+def _neighbourhood(graph: dict, center: str) -> dict:
+    """The local graph view's own filter: a node, its neighbours, their edges."""
+    keep = {center}
+    for edge in graph["edges"]:
+        if edge["source"] == center:
+            keep.add(edge["target"])
+        if edge["target"] == center:
+            keep.add(edge["source"])
+    return {
+        "nodes": [n for n in graph["nodes"] if n["id"] in keep],
+        "edges": [
+            e for e in graph["edges"] if e["source"] in keep and e["target"] in keep
+        ],
+    }
+
+
+class TestNeighbourhoodSlices:
+    @staticmethod
+    def _store() -> ZettelStore:
+        return ZettelStore(
+            [
+                _make_zettel_mock(
+                    1, rel_path="a.md", path=Path("/docs/a.md"), links=["b.md", "c.md"]
+                ),
+                _make_zettel_mock(
+                    2, rel_path="b.md", path=Path("/docs/b.md"), links=["c.md"]
+                ),
+                _make_zettel_mock(
+                    3, rel_path="c.md", path=Path("/docs/c.md"), sequence_parent_id=4
+                ),
+                _make_zettel_mock(4, rel_path="d.md", path=Path("/docs/d.md")),
+                _make_zettel_mock(
+                    5, rel_path="e.md", path=Path("/docs/e.md"), links=["f.md"]
+                ),
+                _make_zettel_mock(6, rel_path="f.md", path=Path("/docs/f.md")),
+            ]
+        )
+
+    def test_slices_match_local_graph_filter(self) -> None:
+        store = self._store()
+        tags = [{"src_path": "a.md", "tags": ["x"]}]
+        backlinks = _build_backlinks(store)
+        graph = GraphExporter().export_columnar(store, tags, backlinks)
+        full = _decode_columnar(json.loads("".join(graph.iter_json())))
+
+        paths, slices = neighbourhood_slices(graph)
+
+        assert set(paths) == {"1", "2", "3", "4", "5", "6"}
+        for zid, path in paths.items():
+            sliced = _decode_columnar(json.loads(slices[path]))
+            assert sliced == _neighbourhood(full, zid)
+
+    def test_same_neighbourhood_shares_a_file(self) -> None:
+        store = self._store()
+        graph = GraphExporter().export_columnar(store, [], _build_backlinks(store))
+        paths, slices = neighbourhood_slices(graph)
+        # 1, 2 and 3 form a triangle; 5 and 6 are a pair.
+        assert paths["1"] == paths["2"]
+        assert paths["5"] == paths["6"]
+        assert len(slices) == 4
+        assert all(p.startswith(f"{SLICE_DIR}/") for p in slices)
+
+    def test_more_hops(self) -> None:
+        store = self._store()
+        graph = GraphExporter().export_columnar(store, [], _build_backlinks(store))
+        paths, slices = neighbourhood_slices(graph, hops=2)
+        assert json.loads(slices[paths["4"]])["ids"] == ["1", "2", "3", "4"]
+
+    def test_feature_points_pages_at_their_slice(self, tmp_path) -> None:
+        from unittest.mock import MagicMock
+
+        from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
+        from mkdocs_zettelkasten.plugin.features.graph_feature import GraphFeature
+
+        store = self._store()
+        ctx = MagicMock()
+        ctx.store = store
+        ctx.tags_metadata = []
+        ctx.backlinks = _build_backlinks(store)
+        ctx.tags_folder = tmp_path
+        ctx.config = ZettelkastenConfig(graph_format="objects", graph_local_slices=True)
+        (tmp_path / SLICE_DIR).mkdir()
+        (tmp_path / SLICE_DIR / "stale.json").write_text("{}")
+        feature = GraphFeature()
+
+        feature.compute(ctx)
+        feature.export(ctx, MagicMock(), {"site_dir": str(tmp_path / "site")})
+        page = MagicMock()
+        page.meta = {"zettel": store.get_by_id(5)}
+        feature.adapt_page(page, ctx)
+
+        path = page.meta["local_graph"]
+        assert json.loads((tmp_path / path).read_text())["ids"] == ["5", "6"]
+        assert len(list((tmp_path / SLICE_DIR).iterdir())) == 4
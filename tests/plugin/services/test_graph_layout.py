@@ -0,0 +1,156 @@
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import numpy as np
+
+from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
+from mkdocs_zettelkasten.plugin.features.graph_feature import (
+    LAYOUT_FILENAME,
+    GraphFeature,
+)
+from mkdocs_zettelkasten.plugin.services import graph_layout
+from mkdocs_zettelkasten.plugin.services.backlink_processor import BacklinkProcessor
+from mkdocs_zettelkasten.plugin.services.graph_layout import compute_layout
+from mkdocs_zettelkasten.plugin.services.link_resolver import LinkResolver
+from mkdocs_zettelkasten.plugin.services.zettel_store import ZettelStore
+from tests.plugin.conftest import _make_zettel_mock
+
+
+def _chain(count: int) -> list[int]:
+    edges: list[int] = []
+    for i in range(count - 1):
+        edges += (i, i + 1)
+    return edges
+
+
+class TestComputeLayout:
+    def test_empty_graph(self) -> None:
+        assert compute_layout(0, [], []).shape == (0, 2)
+
+    def test_deterministic(self) -> None:
+        edges = _chain(20)
+        first = compute_layout(20, edges, [False] * 19)
+        second = compute_layout(20, edges, [False] * 19)
+        assert first.shape == (20, 2)
+        assert np.isfinite(first).all()
+        np.testing.assert_array_equal(first, second)
+
+    def test_linked_nodes_end_up_closer(self) -> None:
+        # Two cliques joined by nothing.
+        edges = [i for a in range(5) for b in range(a + 1, 5) for i in (a, b)]
+        edges += [i + 5 for i in edges]
+        pos = compute_layout(10, edges, [False] * (len(edges) // 2))
+        within = np.linalg.norm(pos[0] - pos[1])
+        across = np.linalg.norm(pos[0] - pos[5])
+        assert within < across
+
+    def test_fully_seeded_layout_stays_put(self) -> None:
+        edges = _chain(30)
+        sequence = [False] * 29
+        first = compute_layout(30, edges, sequence)
+        seeds = {i: tuple(p) for i, p in enumerate(first.tolist())}
+        second = compute_layout(30, edges, sequence, seeds)
+        span = np.ptp(first, axis=0).max()
+        assert np.linalg.norm(second - first, axis=1).max() < 0.1 * span
+
+    def test_new_node_starts_near_seeded_neighbour(self, monkeypatch) -> None:
+        monkeypatch.setattr(graph_layout, "SEEDED_TICKS", 0)
+        seeds = {0: (1000.0, 1000.0), 1: (-1000.0, -1000.0)}
+        pos = compute_layout(3, [0, 2], [False], seeds)
+        assert np.linalg.norm(pos[2] - pos[0]) < 100
+        np.testing.assert_array_equal(pos[:2], [[1000, 1000], [-1000, -1000]])
+
+    def test_grid_repulsion_approximates_exact(self) -> None:
+        pos = np.random.default_rng(3).normal(scale=300, size=(600, 2))
+        exact = graph_layout._exact_repulsion(pos)
+        grid = graph_layout._grid_repulsion(pos, 128)
+        error = np.linalg.norm(grid - exact, axis=1).mean()
+        assert error < 0.1 * np.linalg.norm(exact, axis=1).mean()
+
+    def test_large_graph_uses_grid(self, monkeypatch) -> None:
+        monkeypatch.setattr(graph_layout, "EXACT_LIMIT", 10)
+        monkeypatch.setattr(graph_layout, "FRESH_TICKS", 20)
+        pos = compute_layout(50, _chain(50), [True] * 49)
+        assert pos.shape == (50, 2)
+        assert np.isfinite(pos).all()
+
+
+class TestGraphFeatureLayout:
+    @staticmethod
+    def _ctx(tmp_path: Path, **config) -> MagicMock:
+        zettels = [
+            _make_zettel_mock(
+                1, rel_path="a.md", path=Path("/docs/a.md"), links=["b.md"]
+            ),
+            _make_zettel_mock(2, rel_path="b.md", path=Path("/docs/b.md")),
+            _make_zettel_mock(
+                3, rel_path="c.md", path=Path("/docs/c.md"), sequence_parent_id=1
+            ),
+        ]
+        store = ZettelStore(zettels)
+        resolved = LinkResolver.resolve(store).resolved
+        ctx = MagicMock()
+        ctx.store = store
+        ctx.tags_metadata = []
+        ctx.backlinks = BacklinkProcessor.process(store, resolved)
+        ctx.tags_folder = tmp_path
+        ctx.config = ZettelkastenConfig(graph_layout_enabled=True, **config)
+        return ctx
+
+    @staticmethod
+    def _written(feature: GraphFeature, ctx: MagicMock, tmp_path: Path) -> dict:
+        feature.export(ctx, MagicMock(), {"site_dir": str(tmp_path / "site")})
+        return json.loads((tmp_path / "graph.json").read_text())
+
+    def test_columnar_positions(self, tmp_path) -> None:
+        ctx = self._ctx(tmp_path, graph_format="columnar")
+        feature = GraphFeature()
+        feature.compute(ctx)
+        data = self._written(feature, ctx, tmp_path)
+        assert len(data["positions"]) == 2 * data["nodeCount"]
+
+        saved = json.loads((tmp_path / LAYOUT_FILENAME).read_text())
+        assert saved == {
+            zid: data["positions"][2 * i : 2 * i + 2]
+            for i, zid in enumerate(data["ids"])
+        }
+
+    def test_object_positions_by_default(self, tmp_path) -> None:
+        ctx = self._ctx(tmp_path)
+        feature = GraphFeature()
+        feature.compute(ctx)
+        data = self._written(feature, ctx, tmp_path)
+        assert all(isinstance(n["x"], float) for n in data["nodes"])
+        assert all(isinstance(n["y"], float) for n in data["nodes"])
+
+    def test_seeded_from_previous_build(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(graph_layout, "SEEDED_TICKS", 0)
+        previous = {"1": [10.0, 20.0], "2": [30.0, 40.0], "3": [50.0, 60.0]}
+        (tmp_path / LAYOUT_FILENAME).write_text(json.dumps(previous))
+        ctx = self._ctx(tmp_path, graph_format="columnar")
+        feature = GraphFeature()
+        feature.compute(ctx)
+        data = self._written(feature, ctx, tmp_path)
+        assert data["positions"] == [10.0, 20.0, 30.0, 40.0, 50.0, 60.0]
+
+    def test_seeded_across_builds_without_parse_cache(self, tmp_path) -> None:
+        ctx = self._ctx(tmp_path, parse_cache_enabled=False)
+        first = GraphFeature()
+        first.compute(ctx)
+        assert (tmp_path / LAYOUT_FILENAME).is_file()
+
+        second = GraphFeature()
+        second.compute(ctx)
+        assert second._positions == first._positions
+
+    def test_disabled_by_default(self, tmp_path) -> None:
+        ctx = self._ctx(tmp_path)
+        ctx.config = ZettelkastenConfig()
+        feature = GraphFeature()
+        feature.compute(ctx)
+        assert "positions" not in self._written(feature, ctx, tmp_path)
@@ -1,6 +1,13 @@
 from pathlib import Path
 
-from mkdocs_zettelkasten.plugin.services.link_resolver import LinkResolver
+import pytest
+
+from mkdocs_zettelkasten.plugin.services.link_resolver import (
+    LinkMap,
+    LinkResolver,
+    LinkStat,
+    normalize_link,
+)
 from mkdocs_zettelkasten.plugin.services.zettel_store import ZettelStore
 from tests.plugin.conftest import _make_zettel_mock
 
@@ -110,3 +117,147 @@ class TestLinkResolver:
 
         assert result.resolved[1] == {2}
         assert result.broken == [("a.md", "missing")]
+
+    def test_resolve_incremental_matches_full(self) -> None:
+        z1 = _make_zettel_mock(
+            1, path=Path("/docs/a.md"), rel_path="a.md", links=["b.md"]
+        )
+        z2 = _make_zettel_mock(
+            2, path=Path("/docs/b.md"), rel_path="b.md", links=["missing"]
+        )
+        store = ZettelStore([z1, z2])
+        previous = LinkResolver.resolve(store)
+
+        z1b = _make_zettel_mock(
+            1, path=Path("/docs/a.md"), rel_path="a.md", links=["gone", "a.md"]
+        )
+        store.update([z1b, z2])
+        result = LinkResolver.resolve_incremental(previous, store, [z1b], replaced=[z1])
+
+        full = LinkResolver.resolve(store)
+        assert result.resolved == full.resolved
+        assert sorted(result.broken) == sorted(full.broken)
+        assert result.stats == full.stats
+        assert previous.resolved[1] == {2}
+
+
+class TestNormalizeLink:
+    @pytest.mark.parametrize(
+        ("link", "expected"),
+        [
+            ("a.md", ("a",)),
+            ("./a.md", ("a",)),
+            ("../notes/a.md", ("notes", "a")),
+            ("notes/../other/a.md", ("other", "a")),
+            ("a.md#section", ("a",)),
+            ("my%20note.md", ("my note",)),
+            ("/docs//a", ("docs", "a")),
+            ("20240101120000", ("20240101120000",)),
+            ("", ()),
+        ],
+    )
+    def test_normalize(self, link: str, expected: tuple[str, ...]) -> None:
+        assert normalize_link(link) == expected
+
+    def test_custom_suffix(self) -> None:
+        assert normalize_link("a.markdown", ".markdown") == ("a",)
+
+    def test_relative_links_resolve_against_base(self) -> None:
+        assert normalize_link("../a/b.md", base=("x", "y")) == ("x", "a", "b")
+        assert normalize_link("./b.md", base=("x",)) == ("x", "b")
+        assert normalize_link("a/b.md", base=("x",)) == ("a", "b")
+
+
+class TestLinkResolverNormalization:
+    def test_relative_encoded_and_anchored_links_resolve(self) -> None:
+        z1 = _make_zettel_mock(
+            1,
+            path=Path("/docs/sub/a.md"),
+            rel_path="sub/a.md",
+            links=["../b%20c.md#intro", "./d.md"],
+        )
+        z2 = _make_zettel_mock(2, path=Path("/docs/b c.md"))
+        z3 = _make_zettel_mock(3, path=Path("/docs/sub/d.md"))
+        store = ZettelStore([z1, z2, z3])
+
+        result = LinkResolver.resolve(store)
+
+        assert result.resolved[1] == {2, 3}
+        assert result.broken == []
+
+    def test_parent_link_does_not_match_unrelated_tail(self) -> None:
+        source = _make_zettel_mock(
+            1,
+            path=Path("/docs/x/y/src.md"),
+            rel_path="x/y/src.md",
+            links=["../a/b.md"],
+        )
+        other = _make_zettel_mock(2, path=Path("/docs/other/a/b.md"))
+        store = ZettelStore([source, other])
+
+        result = LinkResolver.resolve(store)
+        assert result.resolved[1] == set()
+        assert result.broken == [("x/y/src.md", "../a/b.md")]
+
+        target = _make_zettel_mock(3, path=Path("/docs/x/a/b.md"))
+        result = LinkResolver.resolve(ZettelStore([source, other, target]))
+        assert result.resolved[1] == {3}
+
+    def test_same_relative_link_from_different_folders(self) -> None:
+        z1 = _make_zettel_mock(1, path=Path("/docs/p/a.md"), links=["./n.md"])
+        z2 = _make_zettel_mock(2, path=Path("/docs/q/a.md"), links=["./n.md"])
+        z3 = _make_zettel_mock(3, path=Path("/docs/p/n.md"))
+        z4 = _make_zettel_mock(4, path=Path("/docs/q/n.md"))
+
+        result = LinkResolver.resolve(ZettelStore([z1, z2, z3, z4]))
+
+        assert result.resolved[1] == {3}
+        assert result.resolved[2] == {4}
+
+
+class TestLinkStats:
+    def test_stats_count_occurrences_once_per_link(self) -> None:
+        z1 = _make_zettel_mock(
+            1,
+            path=Path("/docs/a.md"),
+            rel_path="a.md",
+            links=["b.md", "missing", "https://example.com"],
+        )
+        z2 = _make_zettel_mock(
+            2, path=Path("/docs/b.md"), rel_path="b.md", links=["b.md", "missing"]
+        )
+        store = ZettelStore([z1, z2])
+
+        result = LinkResolver.resolve(store)
+
+        assert result.stats == {
+            "b.md": LinkStat(target_id=2, occurrences=2),
+            "missing": LinkStat(target_id=None, occurrences=2),
+        }
+        assert result.broken == [("a.md", "missing"), ("b.md", "missing")]
+
+    def test_lookup_once_per_unique_link(self, monkeypatch) -> None:
+        zettels = [
+            _make_zettel_mock(
+                i, path=Path(f"/docs/{i}.md"), rel_path=f"{i}.md", links=["1.md"] * 3
+            )
+            for i in range(1, 5)
+        ]
+        store = ZettelStore(zettels)
+        calls = []
+        original = store.get_by_suffix
+        monkeypatch.setattr(
+            store, "get_by_suffix", lambda parts: calls.append(parts) or original(parts)
+        )
+
+        LinkResolver.resolve(store)
+
+        assert calls == [("1",)]
+
+
+class TestLinkMap:
+    def test_stats_default_not_shared(self) -> None:
+        first = LinkMap(resolved={}, broken=[])
+        second = LinkMap(resolved={}, broken=[])
+        assert first.stats == {}
+        assert first.stats is not second.stats
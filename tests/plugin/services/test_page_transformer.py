@@ -21,7 +21,7 @@ def _make_transform_fixtures():
     files = MagicMock()
     zettel_service = MagicMock()
     zettel_service.add_zettel_to_page.return_value = page
-    zettel_service.get_zettels.return_value = []
+    zettel_service.store.zettels = []
     zettel_service.file_suffix = ".md"
     features = []
     ctx = MagicMock()
@@ -144,3 +144,23 @@ class TestPageTransformer:
             transformer.transform("original", page, config, files, svc, [feature], ctx)
 
         assert "my_feature" in caplog.text
+
+
+class TestFileIndexReuse:
+    def test_index_built_once_per_files(self) -> None:
+        transformer, _, _, files, _, _, _ = _make_transform_fixtures()
+        with patch(f"{MODULE}.FileIndex") as file_index:
+            transformer._index_for(files)
+            transformer._index_for(files)
+            assert file_index.call_count == 1
+            transformer._index_for(MagicMock())
+            assert file_index.call_count == 2
+
+    def test_navigation_built_once_per_build(self) -> None:
+        transformer, _, _, files, svc, _, _ = _make_transform_fixtures()
+        with patch(f"{MODULE}.build_navigation") as build:
+            transformer._navigation_for(files, svc)
+            transformer._navigation_for(files, svc)
+            assert build.call_count == 1
+            transformer._navigation_for(MagicMock(), svc)
+            assert build.call_count == 2
@@ -0,0 +1,102 @@
+"""Tests for PanelRenderer."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from mkdocs_zettelkasten.plugin.entities.zettel import Zettel, ZettelMeta
+from mkdocs_zettelkasten.plugin.services.panel_renderer import (
+    SITE_ROOT,
+    PanelRenderer,
+)
+
+
+def _make_zettel(zettel_id: int) -> Zettel:
+    meta = ZettelMeta(
+        id=zettel_id,
+        title=f"Note {zettel_id}",
+        path=Path(f"/tmp/{zettel_id}.md"),
+        rel_path=f"{zettel_id}.md",
+        body="",
+        last_update_date="2024-01-01",
+        meta={"id": zettel_id},
+        links=[],
+        link_snippets={},
+    )
+    return Zettel.from_parts(meta)
+
+
+def _node(zettel_id: int, current: bool = False, children=None) -> dict:
+    return {
+        "url": f"{zettel_id}/",
+        "title": f"Note {zettel_id}",
+        "current": current,
+        "children": children or [],
+    }
+
+
+class TestPanelRenderer:
+    def test_empty_zettel_has_no_panels(self) -> None:
+        assert PanelRenderer().render(_make_zettel(1)) == {}
+
+    def test_backlinks_with_and_without_snippet(self) -> None:
+        zettel = _make_zettel(1)
+        zettel.backlinks = [
+            {"url": "2/", "title": "Two", "snippet": "see <mark>it</mark>"},
+            {"url": "3/", "title": "Three", "snippet": None},
+        ]
+
+        panels = PanelRenderer().render(zettel)
+
+        assert panels == {
+            "backlinks": (
+                f'<li><a href="{SITE_ROOT}2/">Two</a>'
+                '<div class="backlink-snippet">see <mark>it</mark></div></li>'
+                f'<li><a href="{SITE_ROOT}3/">Three</a></li>'
+            )
+        }
+
+    def test_suggestions(self) -> None:
+        zettel = _make_zettel(1)
+        zettel.suggested_links = [
+            {"url": "2/", "title": "Two", "reason": "shared tags", "confidence": "50%"}
+        ]
+
+        panels = PanelRenderer().render(zettel)
+
+        assert panels["suggested_links"] == (
+            f'<li><a href="{SITE_ROOT}2/">Two</a> '
+            '<span class="suggestion-reason">shared tags, 50%</span></li>'
+        )
+
+    def test_repeated_items_share_fragments(self) -> None:
+        renderer = PanelRenderer()
+        link = {"url": "9/", "title": "Hub", "snippet": None}
+        a, b = _make_zettel(1), _make_zettel(2)
+        a.unlinked_mentions = [dict(link)]
+        b.unlinked_mentions = [dict(link)]
+
+        first = renderer.render(a)["unlinked_mentions"]
+        second = renderer.render(b)["unlinked_mentions"]
+
+        assert first is second
+        assert renderer.hits == 1
+
+    def test_sequence_tree_marks_each_member_current(self) -> None:
+        renderer = PanelRenderer()
+        root, child = _make_zettel(1), _make_zettel(2)
+        root.sequence_tree = [_node(1, current=True, children=[_node(2)])]
+        child.sequence_tree = [_node(1, children=[_node(2, current=True)])]
+
+        root_html = renderer.render(root)["sequence_tree"]
+        child_html = renderer.render(child)["sequence_tree"]
+
+        assert root_html == (
+            '<li class="current"><strong>Note 1</strong>'
+            f'<ul><li><a href="{SITE_ROOT}2/">Note 2</a></li></ul></li>'
+        )
+        assert child_html == (
+            f'<li><a href="{SITE_ROOT}1/">Note 1</a>'
+            '<ul><li class="current"><strong>Note 2</strong></li></ul></li>'
+        )
+        assert renderer.hits == 1
@@ -7,6 +7,7 @@ rendering and that page transformation is read-only.
 from __future__ import annotations
 
 import copy
+import logging
 from dataclasses import FrozenInstanceError
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -176,3 +177,88 @@ class TestParallelSafety:
 
         with __import__("pytest").raises(AttributeError):
             zettel.id = 99  # type: ignore[misc]
+
+
+class TestPrecompute:
+    def _setup(self, tmp_path: Path):
+        from mkdocs.structure.files import File, Files
+        from mkdocs.structure.pages import Page
+
+        file_map = {"1.md": ZETTEL_A, "2.md": ZETTEL_B}
+        svc = _build_service(tmp_path, file_map)
+        ctx = _build_ctx(svc)
+        files = Files(
+            [
+                File(name, str(tmp_path), str(tmp_path / "site"), True)
+                for name in file_map
+            ]
+        )
+        config = _make_full_config(tmp_path)
+        pages = [Page(None, f, config) for f in files]
+        return svc, ctx, files, config, pages
+
+    def _read(self, page):
+        from mkdocs.utils import meta
+
+        page.markdown, page.meta = meta.get_data(page.file.content_string)
+        return page.markdown
+
+    def test_matches_serial_transform(self, tmp_path: Path) -> None:
+        features = [BacklinkFeature(), UnlinkedMentionFeature(), SequenceFeature()]
+        svc, ctx, files, config, pages = self._setup(tmp_path)
+        serial = PageTransformer()
+        expected = []
+        for page in pages:
+            markdown = serial.transform(
+                self._read(page), page, config, files, svc, features, ctx
+            )
+            expected.append((markdown, dict(page.meta), page.next_page))
+
+        svc, ctx, files, config, pages = self._setup(tmp_path)
+        transformer = PageTransformer()
+        count = transformer.precompute(
+            pages, config, files, svc, features, ctx, workers=4
+        )
+        assert count == 2
+        for page, (markdown, meta, next_page) in zip(pages, expected, strict=True):
+            assert page.meta == {}
+            assert transformer.take(self._read(page), page, files) == markdown
+            assert page.meta.keys() == meta.keys()
+            assert page.meta["zettel"].id == meta["zettel"].id
+            assert (page.next_page is None) == (next_page is None)
+
+    def test_changed_source_falls_back(self, tmp_path: Path) -> None:
+        svc, ctx, files, config, pages = self._setup(tmp_path)
+        transformer = PageTransformer()
+        transformer.precompute(pages, config, files, svc, [], ctx, workers=2)
+        assert transformer.take("edited by another plugin", pages[0], files) is None
+        assert pages[0].meta == {}
+
+    def test_other_build_not_served(self, tmp_path: Path) -> None:
+        from mkdocs.structure.files import Files
+
+        svc, ctx, files, config, pages = self._setup(tmp_path)
+        transformer = PageTransformer()
+        transformer.precompute(pages, config, files, svc, [], ctx, workers=2)
+        other = Files(list(files))
+        assert transformer.take(self._read(pages[0]), pages[0], other) is None
+
+    def test_failed_page_deferred(self, tmp_path: Path) -> None:
+        svc, ctx, files, config, pages = self._setup(tmp_path)
+        (tmp_path / "2.md").unlink()
+        transformer = PageTransformer()
+        assert transformer.precompute(pages, config, files, svc, [], ctx, 2) == 1
+        assert transformer.take("anything", pages[1], files) is None
+
+    def test_failed_adapter_left_to_serial_report(self, tmp_path: Path, caplog) -> None:
+        svc, ctx, files, config, pages = self._setup(tmp_path)
+        feature = MagicMock()
+        feature.name = "broken"
+        feature.adapt_page.side_effect = RuntimeError("boom")
+        transformer = PageTransformer()
+        with caplog.at_level(logging.ERROR):
+            assert (
+                transformer.precompute(pages, config, files, svc, [feature], ctx, 2)
+                == 0
+            )
+        assert not caplog.records
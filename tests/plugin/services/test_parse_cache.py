@@ -0,0 +1,158 @@
+import datetime
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from mkdocs.structure.files import File
+
+from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
+from mkdocs_zettelkasten.plugin.services.parse_cache import CACHE_FILENAME, ParseCache
+from mkdocs_zettelkasten.plugin.services.zettel_parser import ZettelParser
+
+VALID_CONTENT = "---\nid: 1\ndate: 2024-01-01\n---\n# Title\nSee [[2]]\n"
+PERMISSIVE_CONFIG = ZettelkastenConfig(id_format=r"^\d+$")
+
+
+def _make_files(tmp_path: Path, names: list[str]) -> MagicMock:
+    entries = []
+    for name in names:
+        f = MagicMock(spec=File)
+        f.src_path = name
+        f.abs_src_path = str(tmp_path / name)
+        f.is_documentation_page.return_value = True
+        entries.append(f)
+    files = MagicMock()
+    files.__iter__ = lambda self: iter(entries)
+    return files
+
+
+def _parse(tmp_path: Path, names: list[str], cfg=PERMISSIVE_CONFIG):
+    cache = ParseCache(tmp_path / ".build", cfg)
+    cache.load()
+    with patch(
+        "mkdocs_zettelkasten.plugin.entities.zettel.GitUtil.is_tracked",
+        return_value=False,
+    ):
+        valid, invalid = ZettelParser.parse_files(
+            _make_files(tmp_path, names), zettel_config=cfg, cache=cache
+        )
+    return cache, valid, invalid
+
+
+class TestParseCache:
+    def test_first_build_misses_and_writes_cache(self, tmp_path: Path) -> None:
+        (tmp_path / "1.md").write_text(VALID_CONTENT)
+
+        cache, valid, _ = _parse(tmp_path, ["1.md"])
+
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert valid[0].links == ["2"]
+        assert (tmp_path / ".build" / CACHE_FILENAME).is_file()
+
+    def test_second_build_hits_without_parsing(self, tmp_path: Path) -> None:
+        (tmp_path / "1.md").write_text(VALID_CONTENT)
+        _parse(tmp_path, ["1.md"])
+
+        with patch(
+            "mkdocs_zettelkasten.plugin.entities.zettel.Zettel._build_meta"
+        ) as mock_build:
+            cache, valid, _ = _parse(tmp_path, ["1.md"])
+
+        mock_build.assert_not_called()
+        assert (cache.hits, cache.misses) == (1, 0)
+        assert valid[0].id == 1
+        assert valid[0].title == "Title"
+        assert valid[0].link_snippets["2"] == "# Title See <mark>2</mark>"
+
+    def test_changed_content_is_reparsed(self, tmp_path: Path) -> None:
+        fp = tmp_path / "1.md"
+        fp.write_text(VALID_CONTENT)
+        _parse(tmp_path, ["1.md"])
+
+        fp.write_text(VALID_CONTENT.replace("# Title", "# Renamed"))
+        cache, valid, _ = _parse(tmp_path, ["1.md"])
+
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert valid[0].title == "Renamed"
+
+    def test_touched_file_hits_by_content_hash(self, tmp_path: Path) -> None:
+        fp = tmp_path / "1.md"
+        fp.write_text(VALID_CONTENT)
+        _parse(tmp_path, ["1.md"])
+
+        st = fp.stat()
+        os.utime(fp, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        cache, valid, _ = _parse(tmp_path, ["1.md"])
+
+        assert (cache.hits, cache.misses) == (1, 0)
+        assert valid[0].id == 1
+
+    def test_new_commit_updates_date_of_untouched_file(self, tmp_path: Path) -> None:
+        (tmp_path / "1.md").write_text(VALID_CONTENT)
+        _parse(tmp_path, ["1.md"])
+
+        commit = datetime.datetime(2030, 5, 6, tzinfo=datetime.UTC)
+        with (
+            patch(
+                "mkdocs_zettelkasten.plugin.entities.zettel.GitUtil.is_tracked",
+                return_value=True,
+            ),
+            patch(
+                "mkdocs_zettelkasten.plugin.entities.zettel.GitUtil.get_revision_date_for_file",
+                return_value=commit,
+            ),
+        ):
+            cache = ParseCache(tmp_path / ".build", PERMISSIVE_CONFIG)
+            cache.load()
+            valid, _ = ZettelParser.parse_files(
+                _make_files(tmp_path, ["1.md"]),
+                zettel_config=PERMISSIVE_CONFIG,
+                cache=cache,
+            )
+
+        assert (cache.hits, cache.misses) == (1, 0)
+        assert valid[0].last_update_date == "2030-05-06"
+        assert cache._entries[str(tmp_path / "1.md")].meta.last_update_date == (
+            "2030-05-06"
+        )
+
+    def test_config_change_invalidates(self, tmp_path: Path) -> None:
+        (tmp_path / "1.md").write_text(VALID_CONTENT)
+        _parse(tmp_path, ["1.md"])
+
+        cfg = ZettelkastenConfig(id_format=r"^\d+$", date_format="%d/%m/%Y")
+        cache, valid, _ = _parse(tmp_path, ["1.md"], cfg)
+
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert "/" in valid[0].last_update_date
+
+    def test_deleted_files_are_pruned(self, tmp_path: Path) -> None:
+        (tmp_path / "1.md").write_text(VALID_CONTENT)
+        (tmp_path / "2.md").write_text(VALID_CONTENT.replace("id: 1", "id: 2"))
+        _parse(tmp_path, ["1.md", "2.md"])
+
+        (tmp_path / "2.md").unlink()
+        _parse(tmp_path, ["1.md"])
+        cache, _, _ = _parse(tmp_path, ["1.md"])
+
+        assert len(cache._entries) == 1
+
+    def test_invalid_files_are_not_cached(self, tmp_path: Path) -> None:
+        (tmp_path / "bad.md").write_text("---\ntitle: No ID\n---\n")
+        _parse(tmp_path, ["bad.md"])
+
+        cache, valid, invalid = _parse(tmp_path, ["bad.md"])
+
+        assert valid == []
+        assert len(invalid) == 1
+        assert cache.hits == 0
+
+    def test_corrupt_cache_is_discarded(self, tmp_path: Path) -> None:
+        (tmp_path / ".build").mkdir()
+        (tmp_path / ".build" / CACHE_FILENAME).write_bytes(b"not a pickle")
+        (tmp_path / "1.md").write_text(VALID_CONTENT)
+
+        cache, valid, _ = _parse(tmp_path, ["1.md"])
+
+        assert cache.misses == 1
+        assert len(valid) == 1
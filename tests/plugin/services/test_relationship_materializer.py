@@ -177,3 +177,84 @@ class TestMaterializeSuggestions:
         suggestions = {1: [{"target_id": 999, "reason": "r", "confidence": 0.5}]}
         materialize_suggestions(source, suggestions, store, ".md")
         assert source.suggested_links == []
+
+
+class TestMaterializeAll:
+    def test_rematerializing_does_not_duplicate(self, tmp_path: Path) -> None:
+        from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
+        from mkdocs_zettelkasten.plugin.pipeline_context import PipelineContext
+        from mkdocs_zettelkasten.plugin.services.link_resolver import LinkMap
+        from mkdocs_zettelkasten.plugin.services.relationship_materializer import (
+            RelationshipMaterializer,
+        )
+
+        source = _make_zettel(1, links=["2.md"])
+        target = _make_zettel(2)
+        ctx = PipelineContext(
+            config=ZettelkastenConfig(),
+            store=ZettelStore([source, target]),
+            link_map=LinkMap(resolved={1: {2}, 2: set()}, broken=[]),
+            invalid_files=[],
+            tags_metadata=[],
+            tags_folder=tmp_path,
+            site_dir=str(tmp_path),
+            backlinks={2: [source]},
+        )
+
+        RelationshipMaterializer.materialize_all(ctx)
+        RelationshipMaterializer.materialize_all(ctx)
+
+        assert len(target.backlinks) == 1
+
+    def test_only_dirty_zettels_rematerialized(self, tmp_path: Path) -> None:
+        from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
+        from mkdocs_zettelkasten.plugin.pipeline_context import PipelineContext
+        from mkdocs_zettelkasten.plugin.services.link_resolver import LinkMap
+        from mkdocs_zettelkasten.plugin.services.relationship_materializer import (
+            RelationshipMaterializer,
+        )
+
+        source = _make_zettel(1, links=["2.md", "3.md"])
+        clean, dirty = _make_zettel(2), _make_zettel(3)
+        clean.backlinks.append({"url": "stale/", "title": "Stale", "snippet": None})
+        ctx = PipelineContext(
+            config=ZettelkastenConfig(),
+            store=ZettelStore([source, clean, dirty]),
+            link_map=LinkMap(resolved={1: {2, 3}, 2: set(), 3: set()}, broken=[]),
+            invalid_files=[],
+            tags_metadata=[],
+            tags_folder=tmp_path,
+            site_dir=str(tmp_path),
+            backlinks={2: [source], 3: [source]},
+            dirty_ids={3},
+        )
+
+        RelationshipMaterializer.materialize_all(ctx)
+
+        assert clean.backlinks[0]["title"] == "Stale"
+        assert dirty.backlinks[0]["title"] == "Note 1"
+
+    def test_panels_prerendered_when_enabled(self, tmp_path: Path) -> None:
+        from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
+        from mkdocs_zettelkasten.plugin.pipeline_context import PipelineContext
+        from mkdocs_zettelkasten.plugin.services.link_resolver import LinkMap
+        from mkdocs_zettelkasten.plugin.services.relationship_materializer import (
+            RelationshipMaterializer,
+        )
+
+        source = _make_zettel(1, links=["2.md"])
+        target = _make_zettel(2)
+        for enabled in (False, True):
+            ctx = PipelineContext(
+                config=ZettelkastenConfig(prerender_panels=enabled),
+                store=ZettelStore([source, target]),
+                link_map=LinkMap(resolved={1: {2}, 2: set()}, broken=[]),
+                invalid_files=[],
+                tags_metadata=[],
+                tags_folder=tmp_path,
+                site_dir=str(tmp_path),
+                backlinks={2: [source]},
+            )
+            RelationshipMaterializer.materialize_all(ctx)
+            assert ("backlinks" in target.panels) is enabled
+            assert source.panels == {}
@@ -60,3 +60,11 @@ class TestSequenceService:
         assert result[1] == [2, 3]
         assert result[2] == [4]
         assert 3 not in result
+
+    def test_components_groups_connected_sequences(self) -> None:
+        children = {1: [2, 3], 3: [4], 10: [11]}
+        groups = SequenceService.components(children)
+        assert sorted(sorted(g) for g in groups) == [[1, 2, 3, 4], [10, 11]]
+
+    def test_components_empty(self) -> None:
+        assert SequenceService.components({}) == []
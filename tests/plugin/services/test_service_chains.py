@@ -20,6 +20,7 @@ from mkdocs_zettelkasten.plugin.features.unlinked_mention_feature import (
 )
 from mkdocs_zettelkasten.plugin.pipeline_context import PipelineContext
 from mkdocs_zettelkasten.plugin.services.backlink_processor import BacklinkProcessor
+from mkdocs_zettelkasten.plugin.services.dependency_index import TRANSCLUSION
 from mkdocs_zettelkasten.plugin.services.graph_exporter import GraphExporter
 from mkdocs_zettelkasten.plugin.services.page_transformer import PageTransformer
 from mkdocs_zettelkasten.plugin.services.preview_exporter import PreviewExporter
@@ -509,3 +510,40 @@ class TestPageTransformerChain:
         zettel = page.meta["zettel"]
         assert zettel.sequence_parent is not None
         assert len(zettel.sequence_children) > 0
+
+
+class TestDependencyChain:
+    """Features record reverse-dependency edges while computing."""
+
+    def test_dirty_set_from_computed_features(self, tmp_path: Path) -> None:
+        svc = _build_service(
+            tmp_path,
+            {
+                "1.md": ZETTEL_A,
+                "2.md": ZETTEL_B,
+                "3.md": ZETTEL_C,
+                "10.md": ZETTEL_SEQ_ROOT,
+                "11.md": ZETTEL_SEQ_CHILD,
+                "12.md": ZETTEL_SEQ_GRANDCHILD,
+            },
+        )
+        ctx = _build_ctx(svc)
+
+        # 2 links to 1; 1 mentions Gamma Note, so 3's unlinked mentions show 1.
+        assert ctx.dependencies.dirty({1}) == {1, 2, 3}
+        assert ctx.dependencies.dirty({12}) == {10, 11, 12}
+
+    def test_transclusions_recorded_before_render(self, tmp_path: Path) -> None:
+        embedding = ZETTEL_B.replace("links to [[1]]", "embeds\n\n![[3]]")
+        nested = ZETTEL_C + "\n![[1]]\n\n```\n![[2]]\n```\n"
+        file_map = {"1.md": ZETTEL_A, "2.md": embedding, "3.md": nested}
+        svc = _build_service(tmp_path, file_map)
+        ctx = _build_ctx(svc)
+
+        PageTransformer.record_transclusions(svc, ctx)
+
+        edges = ctx.dependencies._dependents[TRANSCLUSION]
+        assert edges[3] == {2}
+        # Nested embed, and none from inside a code block.
+        assert edges[1] == {2, 3}
+        assert 2 not in edges
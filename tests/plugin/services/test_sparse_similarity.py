@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("scipy")
+
+from mkdocs_zettelkasten.plugin.services.link_resolver import LinkResolver
+from mkdocs_zettelkasten.plugin.services.sparse_similarity import jaccard_pairs
+from mkdocs_zettelkasten.plugin.services.suggestion_service import SuggestionService
+from mkdocs_zettelkasten.plugin.services.zettel_store import ZettelStore
+from tests.plugin.conftest import _make_zettel_mock
+
+
+class TestJaccardPairs:
+    def test_pairs_above_threshold(self):
+        sets = [frozenset("ab"), frozenset("ab"), frozenset("ac"), frozenset("d")]
+        assert list(jaccard_pairs(sets, 0.3)) == [
+            (0, 1, 2, 1.0),
+            (0, 2, 1, 1 / 3),
+            (1, 2, 1, 1 / 3),
+        ]
+
+    def test_threshold_filters(self):
+        sets = [frozenset("ab"), frozenset("ab"), frozenset("ac")]
+        assert list(jaccard_pairs(sets, 0.5)) == [(0, 1, 2, 1.0)]
+
+    def test_empty_sets(self):
+        assert list(jaccard_pairs([], 0.3)) == []
+        assert list(jaccard_pairs([frozenset()], 0.3)) == []
+
+    def test_stopped_column_counts_but_finds_no_pairs(self):
+        sets = [frozenset("xa"), frozenset("xa"), frozenset("x"), frozenset("x")]
+        assert list(jaccard_pairs(sets, 0.3, stop_ratio=0.5)) == [(0, 1, 2, 1.0)]
+
+
+class TestSparseBackend:
+    def test_matches_python_backend(self):
+        rng = random.Random(7)  # noqa: S311
+        ids = rng.sample(range(1, 500), 40)
+        store = ZettelStore(
+            [_make_zettel_mock(i, title=str(i), rel_path=f"{i}.md") for i in ids]
+        )
+        resolved = {i: set(rng.sample(ids, rng.randint(0, 5))) for i in ids}
+        tags_meta = [
+            {"src_path": f"{i}.md", "tags": rng.sample("abcdefg", rng.randint(0, 4))}
+            for i in ids
+        ]
+        for stop_ratio in (1.0, 0.3):
+            python = SuggestionService().compute(
+                store, tags_meta, resolved, stop_ratio=stop_ratio
+            )
+            sparse = SuggestionService().compute(
+                store, tags_meta, resolved, stop_ratio=stop_ratio, backend="sparse"
+            )
+            assert sparse == python
+
+    def test_shared_link_suggestion(self):
+        a = _make_zettel_mock(1, title="A", rel_path="a.md", links=["c.md"])
+        b = _make_zettel_mock(2, title="B", rel_path="b.md", links=["c.md"])
+        c = _make_zettel_mock(3, title="C", rel_path="c.md")
+        store = ZettelStore([a, b, c])
+        result = SuggestionService().compute(
+            store, [], LinkResolver.resolve(store).resolved, backend="sparse"
+        )
+        assert result[1] == [
+            {"target_id": 2, "reason": "1 shared link", "confidence": 1.0}
+        ]
@@ -1,3 +1,7 @@
+import sys
+
+from mkdocs_zettelkasten.plugin import services
+from mkdocs_zettelkasten.plugin.services.content_index import ContentIndex
 from mkdocs_zettelkasten.plugin.services.link_resolver import LinkResolver
 from mkdocs_zettelkasten.plugin.services.suggestion_service import SuggestionService
 from mkdocs_zettelkasten.plugin.services.zettel_store import ZettelStore
@@ -252,3 +256,145 @@ class TestCustomThresholds:
         service = SuggestionService()
         result = service.compute(store, tags_meta, _resolve(store), max_suggestions=2)
         assert len(result.get(1, [])) <= 2
+
+
+class TestStopRatio:
+    def _vault(self):
+        notes = [
+            _make_zettel_mock(i, title=f"N{i}", rel_path=f"n{i}.md")
+            for i in range(1, 5)
+        ]
+        store = ZettelStore(notes)
+        tags_meta = [
+            {"src_path": "n1.md", "tags": ["common", "rare"]},
+            {"src_path": "n2.md", "tags": ["common", "rare"]},
+            {"src_path": "n3.md", "tags": ["common"]},
+            {"src_path": "n4.md", "tags": ["common"]},
+        ]
+        return store, tags_meta
+
+    def test_common_tag_used_by_default(self):
+        store, tags_meta = self._vault()
+        result = SuggestionService().compute(store, tags_meta, _resolve(store))
+        assert any(s["target_id"] == 4 for s in result[3])
+
+    def test_stopped_tag_does_not_create_candidates(self):
+        store, tags_meta = self._vault()
+        result = SuggestionService().compute(
+            store, tags_meta, _resolve(store), stop_ratio=0.5
+        )
+        assert result[3] == []
+        assert result[4] == []
+
+    def test_stopped_tag_still_counts_in_score(self):
+        """n1 and n2 are found through the rare tag and scored on both tags."""
+        store, tags_meta = self._vault()
+        result = SuggestionService().compute(
+            store, tags_meta, _resolve(store), stop_ratio=0.5
+        )
+        assert result[1] == [
+            {"target_id": 2, "reason": "2 shared tags", "confidence": 1.0}
+        ]
+
+
+class TestOrdering:
+    def test_ties_keep_id_order(self):
+        main = _make_zettel_mock(1, title="Main", rel_path="main.md")
+        others = [
+            _make_zettel_mock(i, title=f"Other{i}", rel_path=f"other{i}.md")
+            for i in (5, 3, 4, 2)
+        ]
+        store = ZettelStore([main, *others])
+        tags_meta = [{"src_path": z.rel_path, "tags": ["a"]} for z in [main, *others]]
+        result = SuggestionService().compute(
+            store, tags_meta, _resolve(store), max_suggestions=3
+        )
+        assert [s["target_id"] for s in result[1]] == [2, 3, 4]
+
+    def test_link_suggestion_wins_confidence_tie(self):
+        a = _make_zettel_mock(1, title="A", rel_path="a.md", links=["c.md"])
+        b = _make_zettel_mock(2, title="B", rel_path="b.md", links=["c.md"])
+        c = _make_zettel_mock(3, title="C", rel_path="c.md")
+        store = ZettelStore([a, b, c])
+        tags_meta = [
+            {"src_path": "a.md", "tags": ["x"]},
+            {"src_path": "b.md", "tags": ["x"]},
+        ]
+        result = SuggestionService().compute(store, tags_meta, _resolve(store))
+        assert result[1] == [
+            {"target_id": 2, "reason": "1 shared link", "confidence": 1.0}
+        ]
+
+
+class TestBackendSelection:
+    def test_sparse_falls_back_without_dependencies(self, monkeypatch, caplog):
+        monkeypatch.setitem(
+            sys.modules, "mkdocs_zettelkasten.plugin.services.sparse_similarity", None
+        )
+        monkeypatch.delattr(services, "sparse_similarity", raising=False)
+        a = _make_zettel_mock(1, title="A", rel_path="a.md", links=["c.md"])
+        b = _make_zettel_mock(2, title="B", rel_path="b.md", links=["c.md"])
+        c = _make_zettel_mock(3, title="C", rel_path="c.md")
+        store = ZettelStore([a, b, c])
+        result = SuggestionService().compute(
+            store, [], _resolve(store), backend="sparse"
+        )
+        assert any(s["target_id"] == 2 for s in result[1])
+        assert "falling back" in caplog.text
+
+
+class TestContentSuggestions:
+    def _store(self, a_links=None):
+        a = _make_zettel_mock(
+            1,
+            title="A",
+            rel_path="a.md",
+            links=a_links,
+            body="Tomatoes need compost and watering.",
+        )
+        b = _make_zettel_mock(
+            2, title="B", rel_path="b.md", body="Compost helps tomatoes; watering too."
+        )
+        c = _make_zettel_mock(
+            3, title="C", rel_path="c.md", body="Rust ownership prevents data races."
+        )
+        return ZettelStore([a, b, c])
+
+    def test_similar_bodies_suggested(self):
+        store = self._store()
+        index = ContentIndex()
+        index.update(store.zettels)
+        result = SuggestionService().compute(
+            store, [], _resolve(store), content_index=index
+        )
+        (sugg,) = result[1]
+        assert sugg["target_id"] == 2
+        assert sugg["reason"] == "similar content"
+        assert result.get(3, []) == []
+
+    def test_linked_zettels_not_suggested(self):
+        store = self._store(a_links=["b.md"])
+        index = ContentIndex()
+        index.update(store.zettels)
+        result = SuggestionService().compute(
+            store, [], _resolve(store), content_index=index
+        )
+        assert result.get(1, []) == []
+
+    def test_linked_neighbour_does_not_use_up_slots(self):
+        store = self._store(a_links=["b.md"])
+        d = _make_zettel_mock(
+            4, title="D", rel_path="d.md", body="Watering tomatoes and compost again."
+        )
+        store = ZettelStore([*store.zettels, d])
+        index = ContentIndex()
+        index.update(store.zettels)
+        result = SuggestionService().compute(
+            store,
+            [],
+            _resolve(store),
+            confidence_threshold=0.1,
+            max_suggestions=1,
+            content_index=index,
+        )
+        assert [s["target_id"] for s in result[1]] == [4]
@@ -126,6 +126,20 @@ class TestUnlinkedMentionDetection:
         )
         assert 1 not in mentions
 
+    def test_whitespace_line_in_fence_keeps_paragraphs_paired(self) -> None:
+        target = _make_zettel_mock(1, title="Epistemology", body="Body.")
+        source = _make_zettel_mock(
+            2,
+            title="Other",
+            body="```\nepistemology\n   \nmore\n```\n\nOn epistemology.",
+        )
+        store = _make_store([target, source])
+
+        mentions = UnlinkedMentionService().find_unlinked_mentions(
+            store, _empty_resolved([target, source])
+        )
+        assert mentions[1] == [(2, "On <mark>epistemology</mark>.")]
+
     def test_finds_id_mention(self) -> None:
         target = _make_zettel_mock(20240101120000, title="My Note", body="Body.")
         source = _make_zettel_mock(
@@ -311,3 +325,48 @@ class TestUnlinkedMentionDetection:
             store, _empty_resolved([target, source]), min_title_len=2
         )
         assert 1 in mentions
+
+    def test_first_matching_paragraph_wins(self) -> None:
+        target = _make_zettel_mock(42, title="Epistemology", body="Body.")
+        source = _make_zettel_mock(
+            2, title="Other", body="See note 42 here.\n\nEpistemology later."
+        )
+        zettels = [target, source]
+        mentions = UnlinkedMentionService().find_unlinked_mentions(
+            _make_store(zettels), _empty_resolved(zettels)
+        )
+
+        assert mentions[42] == [(2, "See note <mark>42</mark> here.")]
+
+    def test_title_preferred_over_id_in_same_paragraph(self) -> None:
+        target = _make_zettel_mock(42, title="Epistemology", body="Body.")
+        source = _make_zettel_mock(2, title="Other", body="42 and epistemology.")
+        zettels = [target, source]
+        mentions = UnlinkedMentionService().find_unlinked_mentions(
+            _make_store(zettels), _empty_resolved(zettels)
+        )
+
+        assert mentions[42] == [(2, "42 and <mark>epistemology</mark>.")]
+
+    def test_unicode_case_folding_matches_re(self) -> None:
+        target = _make_zettel_mock(1, title="Straße Kids", body="Body.")
+        source = _make_zettel_mock(2, title="Other", body="On STRAßE KIDS today.")
+        zettels = [target, source]
+        mentions = UnlinkedMentionService().find_unlinked_mentions(
+            _make_store(zettels), _empty_resolved(zettels)
+        )
+
+        assert mentions[1] == [(2, "On <mark>STRAßE KIDS</mark> today.")]
+
+    def test_targets_in_store_order(self) -> None:
+        zettels = [
+            _make_zettel_mock(3, title="Gamma", body="alpha beta"),
+            _make_zettel_mock(1, title="Alpha", body="gamma"),
+            _make_zettel_mock(2, title="Beta", body="gamma"),
+        ]
+        mentions = UnlinkedMentionService().find_unlinked_mentions(
+            _make_store(zettels), _empty_resolved(zettels)
+        )
+
+        assert list(mentions) == [3, 1, 2]
+        assert [src for src, _ in mentions[3]] == [1, 2]
@@ -90,3 +90,49 @@ class TestZettelParser:
 
         assert len(valid) == 1
         assert valid[0].id == 99
+
+
+class TestParallelParsing:
+    def _write_files(self, tmp_path: Path) -> MagicMock:
+        entries = []
+        for i in range(1, 7):
+            name = f"{i}.md"
+            content = VALID_CONTENT.replace("id: 1", f"id: {i}")
+            if i % 3 == 0:
+                content = INVALID_CONTENT
+            (tmp_path / name).write_text(content)
+            entries.append(_make_file(name, str(tmp_path / name)))
+        files = MagicMock()
+        files.__iter__ = lambda self: iter(entries)
+        return files
+
+    def test_matches_serial_results(self, tmp_path: Path) -> None:
+        files = self._write_files(tmp_path)
+
+        serial_valid, serial_invalid = ZettelParser.parse_files(
+            files, zettel_config=PERMISSIVE_CONFIG
+        )
+        parallel_valid, parallel_invalid = ZettelParser.parse_files(
+            files, zettel_config=PERMISSIVE_CONFIG, workers=2
+        )
+
+        assert [z.id for z in parallel_valid] == [z.id for z in serial_valid]
+        assert [z.id for z in parallel_valid] == [1, 2, 4, 5]
+        assert [f.src_path for f in parallel_invalid] == ["3.md", "6.md"]
+        assert [f.src_path for f in parallel_invalid] == [
+            f.src_path for f in serial_invalid
+        ]
+
+    def test_falls_back_to_serial_when_pool_breaks(self, tmp_path: Path) -> None:
+        files = self._write_files(tmp_path)
+
+        with patch(
+            "mkdocs_zettelkasten.plugin.services.zettel_parser.ProcessPoolExecutor",
+            side_effect=OSError("no processes"),
+        ):
+            valid, invalid = ZettelParser.parse_files(
+                files, zettel_config=PERMISSIVE_CONFIG, workers=4
+            )
+
+        assert [z.id for z in valid] == [1, 2, 4, 5]
+        assert len(invalid) == 2
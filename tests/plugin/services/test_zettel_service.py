@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -122,3 +123,104 @@ class TestZettelService:
 
         assert svc.get_zettel_by_partial_path("note.txt") is not None
         assert svc.get_zettel_by_partial_path("note.txt").id == 1
+
+
+class TestIncrementalProcessing:
+    @staticmethod
+    def _files(tmp_path: Path) -> MagicMock:
+        entries = []
+        for fp in sorted(tmp_path.glob("*.md")):
+            f = MagicMock()
+            f.src_path = fp.name
+            f.abs_src_path = str(fp)
+            f.is_documentation_page.return_value = True
+            entries.append(f)
+        files = MagicMock()
+        files.__iter__ = lambda self: iter(entries)
+        return files
+
+    def _run(self, svc: ZettelService, tmp_path: Path) -> None:
+        config = MagicMock()
+        config.__getitem__ = lambda self, key: {"docs_dir": str(tmp_path)}[key]
+        with patch(
+            "mkdocs_zettelkasten.plugin.entities.zettel.GitUtil.is_tracked",
+            return_value=False,
+        ):
+            svc.process_files(self._files(tmp_path), config)
+
+    @staticmethod
+    def _write(tmp_path: Path, zettel_id: int, body: str = "Body") -> None:
+        fp = tmp_path / f"{zettel_id}.md"
+        fp.write_text(
+            f"---\nid: {zettel_id}\ndate: 2024-01-01\n---\n# Note {zettel_id}\n{body}\n"
+        )
+        # Guarantee a distinct mtime even on coarse-grained filesystems.
+        st = fp.stat()
+        os.utime(fp, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9 * zettel_id))
+
+    def _service(self, tmp_path: Path) -> ZettelService:
+        self._write(tmp_path, 1, "See [[2]]")
+        self._write(tmp_path, 2)
+        svc = ZettelService()
+        svc.configure(PERMISSIVE_CONFIG)
+        svc.incremental = True
+        self._run(svc, tmp_path)
+        return svc
+
+    def test_first_run_is_full(self, tmp_path: Path) -> None:
+        svc = self._service(tmp_path)
+        assert svc.changed_ids is None
+        assert svc.link_map.resolved == {1: {2}, 2: set()}
+
+    def test_unchanged_files_skip_parsing(self, tmp_path: Path) -> None:
+        svc = self._service(tmp_path)
+        with patch(
+            "mkdocs_zettelkasten.plugin.services.zettel_service.ZettelParser.parse_files"
+        ) as mock_parse:
+            self._run(svc, tmp_path)
+        mock_parse.assert_not_called()
+        assert svc.changed_ids == set()
+
+    def test_modified_file_reparsed(self, tmp_path: Path) -> None:
+        svc = self._service(tmp_path)
+        untouched = svc.get_zettel_by_id(2)
+        fp = tmp_path / "1.md"
+        fp.write_text(fp.read_text().replace("See [[2]]", "No links"))
+        st = fp.stat()
+        os.utime(fp, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        self._run(svc, tmp_path)
+
+        assert svc.changed_ids == {1}
+        assert svc.link_map.resolved == {1: set(), 2: set()}
+        assert svc.get_zettel_by_id(2) is untouched
+
+    def test_added_and_removed_files(self, tmp_path: Path) -> None:
+        svc = self._service(tmp_path)
+        (tmp_path / "2.md").unlink()
+        self._write(tmp_path, 3, "See [[1]]")
+
+        self._run(svc, tmp_path)
+
+        assert {z.id for z in svc.get_zettels()} == {1, 3}
+        assert svc.link_map.resolved == {1: set(), 3: {1}}
+        assert svc.link_map.broken == [("1.md", "2")]
+        assert svc.changed_ids == {1, 2, 3}
+
+    def test_invalid_file_tracked(self, tmp_path: Path) -> None:
+        svc = self._service(tmp_path)
+        (tmp_path / "bad.md").write_text("---\ntitle: No ID\n---\n")
+
+        self._run(svc, tmp_path)
+        assert [f.src_path for f in svc.invalid_files] == ["bad.md"]
+
+        self._run(svc, tmp_path)
+        assert [f.src_path for f in svc.invalid_files] == ["bad.md"]
+
+    def test_config_change_forces_full_run(self, tmp_path: Path) -> None:
+        svc = self._service(tmp_path)
+        svc.configure(ZettelkastenConfig(id_format=r"^\d+$", date_format="%d/%m/%Y"))
+
+        self._run(svc, tmp_path)
+
+        assert svc.changed_ids is None
@@ -65,3 +65,103 @@ class TestZettelStore:
         store = ZettelStore([z])
 
         assert store.get_by_partial_path("dir/foo.md") is None
+
+
+def _assert_same_indexes(store: ZettelStore, expected: ZettelStore) -> None:
+    assert store.zettels == expected.zettels
+    assert store._path_index == expected._path_index
+    assert store._id_index == expected._id_index
+    assert store._suffix_index == expected._suffix_index
+    assert store._suffix_shadowed == expected._suffix_shadowed
+
+
+class TestZettelStoreMutations:
+    def test_upsert_inserts_in_id_order(self) -> None:
+        z1 = _make_zettel_mock(1, path=Path("/docs/a.md"))
+        z3 = _make_zettel_mock(3, path=Path("/docs/c.md"))
+        store = ZettelStore([z1, z3])
+
+        z2 = _make_zettel_mock(2, path=Path("/docs/b.md"))
+        store.upsert(z2)
+
+        assert [z.id for z in store.zettels] == [1, 2, 3]
+        assert store.get_by_partial_path("b") is z2
+        _assert_same_indexes(store, ZettelStore([z1, z2, z3]))
+
+    def test_upsert_replaces_same_path(self) -> None:
+        old = _make_zettel_mock(1, path=Path("/docs/a.md"))
+        store = ZettelStore([old])
+
+        new = _make_zettel_mock(5, path=Path("/docs/a.md"))
+        store.upsert(new)
+
+        assert store.zettels == [new]
+        assert store.get_by_id(1) is None
+        assert store.get_by_path(Path("/docs/a.md")) is new
+
+    def test_remove(self) -> None:
+        z1 = _make_zettel_mock(1, path=Path("/docs/a.md"))
+        z2 = _make_zettel_mock(2, path=Path("/docs/b.md"))
+        store = ZettelStore([z1, z2])
+
+        assert store.remove(Path("/docs/a.md")) is z1
+        assert store.remove(Path("/docs/missing.md")) is None
+        _assert_same_indexes(store, ZettelStore([z2]))
+
+    def test_remove_promotes_shadowed_suffix(self) -> None:
+        z1 = _make_zettel_mock(1, path=Path("/docs/x/note.md"))
+        z2 = _make_zettel_mock(2, path=Path("/docs/y/note.md"))
+        store = ZettelStore([z1, z2])
+        assert store.get_by_partial_path("note") is z1
+
+        store.remove(z1.path)
+
+        assert store.get_by_partial_path("note") is z2
+
+    def test_upsert_lower_id_takes_suffix(self) -> None:
+        z2 = _make_zettel_mock(2, path=Path("/docs/y/note.md"))
+        store = ZettelStore([z2])
+
+        z1 = _make_zettel_mock(1, path=Path("/docs/x/note.md"))
+        store.upsert(z1)
+
+        assert store.get_by_partial_path("note") is z1
+        store.remove(z1.path)
+        assert store.get_by_partial_path("note") is z2
+
+    def test_upsert_winner_shadows_only_previous_owner(self) -> None:
+        c = _make_zettel_mock(2, path=Path("/r/c/note.md"))
+        b = _make_zettel_mock(5, path=Path("/r/y/note.md"))
+        store = ZettelStore([c, b])
+
+        a = _make_zettel_mock(3, path=Path("/s/y/note.md"))
+        store.upsert(a)
+        _assert_same_indexes(store, ZettelStore([c, b, a]))
+
+        store.remove(c.path)
+        assert store.get_by_partial_path("note.md") is a
+        _assert_same_indexes(store, ZettelStore([b, a]))
+
+    def test_bulk_apply_matches_update(self) -> None:
+        zettels = [
+            _make_zettel_mock(i, path=Path(f"/docs/{i % 3}/n{i % 5}.md"))
+            for i in range(1, 16)
+        ]
+        store = ZettelStore(zettels)
+        added = _make_zettel_mock(20, path=Path("/docs/1/n2.md"))
+        changes = {zettels[0].path: None, zettels[4].path: None, added.path: added}
+
+        store.bulk_apply(changes)
+
+        remaining = [z for z in zettels if z.path not in changes]
+        _assert_same_indexes(store, ZettelStore([*remaining, added]))
+
+    def test_bulk_apply_large_batch_rebuilds(self) -> None:
+        z1 = _make_zettel_mock(1, path=Path("/docs/a.md"))
+        z2 = _make_zettel_mock(2, path=Path("/docs/b.md"))
+        store = ZettelStore([z1, z2])
+        z3 = _make_zettel_mock(3, path=Path("/docs/c.md"))
+
+        store.bulk_apply({z1.path: None, z3.path: z3})
+
+        _assert_same_indexes(store, ZettelStore([z2, z3]))
@@ -37,3 +37,14 @@ class TestPipelineContext:
 
     def test_sequence_children_from_init(self) -> None:
         assert _make_ctx(sequence_children={1: [2, 3]}).sequence_children == {1: [2, 3]}
+
+    def test_changed_panels(self) -> None:
+        previous = _make_ctx(
+            suggestions={1: [{"target_id": 2}], 3: [{"target_id": 4}]},
+            unlinked_mentions={5: [(6, "old")]},
+        )
+        ctx = _make_ctx(
+            suggestions={1: [{"target_id": 2}], 7: [{"target_id": 8}]},
+            unlinked_mentions={5: [(6, "new")]},
+        )
+        assert ctx.changed_panels(previous) == {3, 5, 7}
@@ -3,6 +3,7 @@ import os
 from unittest.mock import MagicMock, patch
 from zoneinfo import ZoneInfo
 
+from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
 from mkdocs_zettelkasten.plugin.plugin import ZettelkastenPlugin
 from mkdocs_zettelkasten.plugin.services.link_resolver import LinkMap
 
@@ -35,7 +36,11 @@ class TestZettelkastenPlugin:
             "icon_backlinks": "fa fa-link",
             "file_suffix": ".md",
             "graph_enabled": False,
+            "graph_format": "objects",
+            "graph_layout_enabled": False,
+            "graph_local_slices": False,
             "preview_enabled": False,
+            "preview_shard_size": 0,
             "suggestions_enabled": False,
             "workflow_enabled": False,
             "transclusion_strip_heading": True,
@@ -44,9 +49,17 @@ class TestZettelkastenPlugin:
             "review_stale_days": 30,
             "max_suggestions": 5,
             "suggestion_confidence_threshold": 0.3,
+            "suggestion_stop_ratio": 1.0,
+            "suggestion_backend": "python",
+            "suggestion_content_enabled": False,
+            "link_substring_fallback": False,
             "max_excerpt_length": 200,
             "max_embed_depth": 5,
             "min_mention_title_length": 3,
+            "parse_cache_enabled": True,
+            "parse_workers": 0,
+            "render_workers": 0,
+            "prerender_panels": False,
         }
         return plugin
 
@@ -213,6 +226,64 @@ class TestZettelkastenPlugin:
             "backlinks": "fa fa-link",
         }
 
+    def test_on_page_markdown_uses_precomputed(self) -> None:
+        plugin = self._make_plugin()
+        plugin._ctx = MagicMock()
+        page = MagicMock()
+        page.meta = {}
+
+        with (
+            patch.object(plugin.page_transformer, "take", return_value="pre"),
+            patch.object(plugin.page_transformer, "transform") as transform,
+        ):
+            result = plugin.on_page_markdown(
+                "original", page=page, config=MagicMock(), files=MagicMock()
+            )
+
+        assert result == "pre"
+        transform.assert_not_called()
+
+    def test_on_nav_precomputes_with_render_workers(self) -> None:
+        plugin = self._make_plugin()
+        plugin._ctx = MagicMock()
+        plugin.zk_config = ZettelkastenConfig(render_workers=4)
+        file = MagicMock()
+        files = MagicMock()
+        files.documentation_pages.return_value = [file]
+
+        with patch.object(plugin.page_transformer, "precompute") as precompute:
+            plugin.on_nav(MagicMock(), config=MagicMock(), files=files)
+
+        precompute.assert_called_once()
+        assert precompute.call_args.args[0] == [file.page]
+        assert precompute.call_args.args[-1] == 4
+
+    def test_on_nav_precomputes_only_modified_pages_when_dirty(self) -> None:
+        plugin = self._make_plugin()
+        plugin.on_startup(command="serve", dirty=True)
+        plugin._ctx = MagicMock()
+        plugin.zk_config = ZettelkastenConfig(render_workers=4)
+        changed, unchanged = MagicMock(), MagicMock()
+        changed.is_modified.return_value = True
+        unchanged.is_modified.return_value = False
+        files = MagicMock()
+        files.documentation_pages.return_value = [changed, unchanged]
+
+        with patch.object(plugin.page_transformer, "precompute") as precompute:
+            plugin.on_nav(MagicMock(), config=MagicMock(), files=files)
+
+        assert precompute.call_args.args[0] == [changed.page]
+
+    def test_on_nav_skips_precompute_by_default(self) -> None:
+        plugin = self._make_plugin()
+        plugin._ctx = MagicMock()
+        plugin.zk_config = ZettelkastenConfig()
+
+        with patch.object(plugin.page_transformer, "precompute") as precompute:
+            plugin.on_nav(MagicMock(), config=MagicMock(), files=MagicMock())
+
+        precompute.assert_not_called()
+
     def test_on_config_sets_graph_enabled_extra(self) -> None:
         plugin = self._make_plugin()
         plugin.config["graph_enabled"] = True
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from mkdocs_zettelkasten.plugin.services.preview_exporter import PreviewExporter
+import json
+
+from mkdocs_zettelkasten.plugin.services.preview_exporter import (
+    PreviewExporter,
+    shard_index,
+    shard_previews,
+)
 from mkdocs_zettelkasten.plugin.services.zettel_store import ZettelStore
 from tests.plugin.conftest import _make_zettel_mock
 
@@ -188,3 +194,92 @@ class TestPreviewExporter:
 
         assert excerpt.endswith("\u2026")
         assert len(excerpt) <= 21
+
+
+class TestShardPreviews:
+    def _previews(self, count: int) -> dict:
+        return {
+            str(i): {"title": f"T{i}", "excerpt": "", "url": f"{i}/"}
+            for i in range(count)
+        }
+
+    def test_every_preview_in_its_hashed_shard(self) -> None:
+        previews = self._previews(50)
+
+        manifest, shards = shard_previews(previews, 10)
+
+        assert manifest["format"] == "sharded"
+        assert len(manifest["shards"]) == 5
+        assert list(shards) == manifest["shards"]
+        merged = {}
+        for i, path in enumerate(manifest["shards"]):
+            bucket = json.loads(shards[path])
+            assert all(shard_index(zid, 5) == i for zid in bucket)
+            merged.update(bucket)
+        assert merged == previews
+
+    def test_shard_names_follow_content(self) -> None:
+        previews = self._previews(20)
+        _, before = shard_previews(previews, 10)
+        previews["3"]["title"] = "Changed"
+
+        _, after = shard_previews(previews, 10)
+
+        changed = set(before) ^ set(after)
+        assert len(changed) == 2
+        assert all(p.startswith("previews/") for p in changed)
+
+    def test_empty_previews_single_shard(self) -> None:
+        manifest, shards = shard_previews({}, 10)
+        assert len(manifest["shards"]) == 1
+        assert list(shards.values()) == ["{}"]
+
+    def test_feature_writes_manifest_and_prunes_stale_shards(self, tmp_path) -> None:
+        from unittest.mock import MagicMock
+
+        from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
+        from mkdocs_zettelkasten.plugin.features.preview_feature import (
+            PreviewFeature,
+        )
+
+        ctx = MagicMock()
+        ctx.tags_folder = tmp_path
+        ctx.config = ZettelkastenConfig(preview_shard_size=2)
+        feature = PreviewFeature()
+        feature._preview_data = self._previews(4)
+        (tmp_path / "previews").mkdir()
+        (tmp_path / "previews" / "0.deadbeef.json").write_text("{}")
+        files = MagicMock()
+
+        feature.export(ctx, files, {"site_dir": str(tmp_path / "site")})
+
+        manifest = json.loads((tmp_path / "previews.json").read_text())
+        on_disk = sorted(
+            f"previews/{p.name}" for p in (tmp_path / "previews").iterdir()
+        )
+        assert on_disk == sorted(manifest["shards"])
+        assert files.append.call_count == 3
+
+    def test_feature_drops_shards_when_sharding_turned_off(self, tmp_path) -> None:
+        from unittest.mock import MagicMock
+
+        from mkdocs_zettelkasten.plugin.config import ZettelkastenConfig
+        from mkdocs_zettelkasten.plugin.features.preview_feature import (
+            PreviewFeature,
+        )
+
+        ctx = MagicMock()
+        ctx.tags_folder = tmp_path
+        ctx.config = ZettelkastenConfig(preview_shard_size=2)
+        feature = PreviewFeature()
+        feature._preview_data = self._previews(4)
+        site = {"site_dir": str(tmp_path / "site")}
+        feature.export(ctx, MagicMock(), site)
+        assert list((tmp_path / "previews").iterdir())
+
+        ctx.config = ZettelkastenConfig()
+        feature.export(ctx, MagicMock(), site)
+
+        assert list((tmp_path / "previews").iterdir()) == []
+        written = json.loads((tmp_path / "previews.json").read_text())
+        assert written == feature._preview_data
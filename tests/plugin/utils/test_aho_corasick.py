@@ -0,0 +1,32 @@
+from mkdocs_zettelkasten.plugin.utils.aho_corasick import AhoCorasick
+
+
+class TestAhoCorasick:
+    def test_empty_automaton(self) -> None:
+        automaton = AhoCorasick([])
+        assert not automaton
+        assert list(automaton.iter_matches("anything")) == []
+
+    def test_single_pattern(self) -> None:
+        automaton = AhoCorasick([("abc", 1)])
+        assert list(automaton.iter_matches("xabcabc")) == [(1, 1), (4, 1)]
+
+    def test_overlapping_patterns(self) -> None:
+        automaton = AhoCorasick([("he", "he"), ("she", "she"), ("hers", "hers")])
+        assert sorted(automaton.iter_matches("ushers")) == [
+            (1, "she"),
+            (2, "he"),
+            (2, "hers"),
+        ]
+
+    def test_duplicate_patterns_report_all_payloads(self) -> None:
+        automaton = AhoCorasick([("ab", 1), ("ab", 2)])
+        assert list(automaton.iter_matches("ab")) == [(0, 1), (0, 2)]
+
+    def test_suffix_pattern_through_failure_links(self) -> None:
+        automaton = AhoCorasick([("abcd", 1), ("bc", 2)])
+        assert list(automaton.iter_matches("abce")) == [(1, 2)]
+
+    def test_empty_pattern_ignored(self) -> None:
+        automaton = AhoCorasick([("", 1), ("a", 2)])
+        assert list(automaton.iter_matches("aa")) == [(0, 2), (1, 2)]
@@ -1,9 +1,18 @@
 import datetime
+import os
+import shutil
+import subprocess
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 from git import GitCommandError, InvalidGitRepositoryError
 
-from mkdocs_zettelkasten.plugin.utils.git_utils import GitUtil
+from mkdocs_zettelkasten.plugin.utils.git_utils import (
+    INDEX_FILENAME,
+    GitRevisionIndex,
+    GitUtil,
+)
 
 GIT_DATE_ISO = "2025-01-15T10:30:00+01:00"
 
@@ -62,3 +71,171 @@ class TestIsTracked:
             mock_repo_cls.return_value = mock_repo
 
             assert GitUtil.is_tracked("/repo/some/path.md") is False
+
+
+class TestGitRevisionIndex:
+    def _mock_repo(self, ls_output: str, log_output: str) -> MagicMock:
+        mock_repo = MagicMock()
+        mock_repo.working_tree_dir = "/repo"
+        mock_repo.git.ls_files.return_value = ls_output
+        mock_repo.git.log.return_value = log_output
+        return mock_repo
+
+    def test_builds_latest_date_per_path(self) -> None:
+        log_output = (
+            "\x1e2025-02-01T00:00:00+00:00\0\ndocs/a.md\0"
+            "\x1e2025-01-15T10:30:00+01:00\0\ndocs/a.md\0docs/b c.md\0"
+        )
+        with (
+            patch(
+                "mkdocs_zettelkasten.plugin.utils.git_utils.Repo",
+                return_value=self._mock_repo("docs/a.md\0docs/b c.md\0", log_output),
+            ),
+            patch("os.path.realpath", side_effect=lambda p: p),
+        ):
+            index = GitRevisionIndex.build("/repo/docs")
+
+            assert index is not None
+            assert index.is_tracked("/repo/docs/a.md")
+            assert not index.is_tracked("/repo/docs/new.md")
+            assert index.get_revision_date("/repo/docs/a.md") == (
+                datetime.datetime.fromisoformat("2025-02-01T00:00:00+00:00")
+            )
+            assert index.get_revision_date("/repo/docs/b c.md") == (
+                datetime.datetime.fromisoformat(GIT_DATE_ISO)
+            )
+
+    def test_runs_two_git_commands(self) -> None:
+        mock_repo = self._mock_repo("", "")
+        with patch(
+            "mkdocs_zettelkasten.plugin.utils.git_utils.Repo", return_value=mock_repo
+        ):
+            GitRevisionIndex.build("/repo/docs")
+
+        mock_repo.git.ls_files.assert_called_once()
+        mock_repo.git.log.assert_called_once()
+
+    def test_returns_none_outside_git_repo(self) -> None:
+        with patch(
+            "mkdocs_zettelkasten.plugin.utils.git_utils.Repo",
+            side_effect=InvalidGitRepositoryError("/not/a/repo"),
+        ):
+            assert GitRevisionIndex.build("/not/a/repo") is None
+
+    def test_returns_none_on_git_command_error(self) -> None:
+        mock_repo = self._mock_repo("", "")
+        mock_repo.git.log.side_effect = GitCommandError("log")
+        with patch(
+            "mkdocs_zettelkasten.plugin.utils.git_utils.Repo", return_value=mock_repo
+        ):
+            assert GitRevisionIndex.build("/repo/docs") is None
+
+
+def _git(repo: Path, *args: str, date: str | None = None) -> str:
+    env = {**os.environ, "GIT_CONFIG_GLOBAL": os.devnull}
+    if date:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = date
+    return subprocess.run(  # noqa: S603
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],  # noqa: S607
+        cwd=repo,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestPersistedGitRevisionIndex:
+    def _init_repo(self, tmp_path: Path) -> tuple[Path, Path]:
+        repo = tmp_path / "repo"
+        docs = repo / "docs"
+        docs.mkdir(parents=True)
+        _git(repo, "init", "-q")
+        (docs / "a.md").write_text("a")
+        (docs / "b.md").write_text("b")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-qm", "first", date="2025-01-01T00:00:00+00:00")
+        return repo, docs
+
+    def _date(self, index: GitRevisionIndex, path: Path) -> str:
+        date = index.get_revision_date(str(path))
+        assert date is not None
+        return date.date().isoformat()
+
+    def test_persists_head_and_dates(self, tmp_path: Path) -> None:
+        repo, docs = self._init_repo(tmp_path)
+        cache_dir = tmp_path / "cache"
+
+        index = GitRevisionIndex.build(str(docs), cache_dir=cache_dir)
+
+        assert index is not None
+        assert index.head == _git(repo, "rev-parse", "HEAD").strip()
+        assert (cache_dir / INDEX_FILENAME).is_file()
+        assert self._date(index, docs / "a.md") == "2025-01-01"
+
+    def test_unchanged_head_skips_log_walk(self, tmp_path: Path) -> None:
+        _, docs = self._init_repo(tmp_path)
+        cache_dir = tmp_path / "cache"
+        GitRevisionIndex.build(str(docs), cache_dir=cache_dir)
+
+        with patch.object(GitRevisionIndex, "_log") as mock_log:
+            index = GitRevisionIndex.build(str(docs), cache_dir=cache_dir)
+
+        mock_log.assert_not_called()
+        assert index is not None
+        assert self._date(index, docs / "b.md") == "2025-01-01"
+
+    def test_new_commits_update_incrementally(self, tmp_path: Path) -> None:
+        repo, docs = self._init_repo(tmp_path)
+        cache_dir = tmp_path / "cache"
+        first = GitRevisionIndex.build(str(docs), cache_dir=cache_dir)
+        assert first is not None
+        (docs / "a.md").write_text("changed")
+        (docs / "c.md").write_text("c")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-qm", "second", date="2025-03-01T00:00:00+00:00")
+
+        with patch.object(
+            GitRevisionIndex, "_log", wraps=GitRevisionIndex._log
+        ) as mock_log:
+            index = GitRevisionIndex.build(str(docs), cache_dir=cache_dir)
+
+        assert mock_log.call_args.args[2] == f"{first.head}..{index.head}"
+        assert self._date(index, docs / "a.md") == "2025-03-01"
+        assert self._date(index, docs / "b.md") == "2025-01-01"
+        assert self._date(index, docs / "c.md") == "2025-03-01"
+
+    def test_rewritten_history_triggers_full_rebuild(self, tmp_path: Path) -> None:
+        repo, docs = self._init_repo(tmp_path)
+        cache_dir = tmp_path / "cache"
+        GitRevisionIndex.build(str(docs), cache_dir=cache_dir)
+        (docs / "a.md").write_text("amended")
+        _git(repo, "add", ".")
+        _git(
+            repo,
+            "commit",
+            "-q",
+            "--amend",
+            "-m",
+            "amended",
+            date="2025-02-01T00:00:00+00:00",
+        )
+
+        index = GitRevisionIndex.build(str(docs), cache_dir=cache_dir)
+
+        assert index is not None
+        assert self._date(index, docs / "a.md") == "2025-02-01"
+
+    def test_staged_file_is_tracked_without_date(self, tmp_path: Path) -> None:
+        repo, docs = self._init_repo(tmp_path)
+        cache_dir = tmp_path / "cache"
+        GitRevisionIndex.build(str(docs), cache_dir=cache_dir)
+        (docs / "new.md").write_text("new")
+        _git(repo, "add", ".")
+
+        index = GitRevisionIndex.build(str(docs), cache_dir=cache_dir)
+
+        assert index is not None
+        assert index.is_tracked(str(docs / "new.md"))
+        assert index.get_revision_date(str(docs / "new.md")) is None